@@ -0,0 +1 @@
+from .servers import FakeUpstreams, DEFAULT_UPSTREAM_CONFIG
@@ -0,0 +1,157 @@
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from question_answer.__article import extractArticle
+from .servers import QuietHTTPServer
+
+#### Const Variables ####
+
+# Sentences of the Article, which must be Extracted
+ARTICLE_SENTENCES = ["The latest version of Node.js is 22.1.0, released on May 2, 2024.",
+                     "It ships an updated V8 engine and a stable test runner.",
+                     "Version 20 stays the active long term support line until October 2024.",
+                     "Upgrading only needs a reinstall from the official download page."]
+
+# Sentences around the Article (Menus, Sidebars, Banners, Footers), which should not be Extracted
+BOILERPLATE_SENTENCES = ["Home", "Blog", "Download", "Subscribe to our newsletter",
+                         "We use cookies to improve your experience", "Copyright 2024 Example Media"]
+
+
+# Menu of Links, as most Pages have one outside their <nav>
+def getLinkList(words: list):
+    return " ".join(f'<a href="/{word.lower()}">{word}</a>' for word in words)
+
+
+# Test Pages: the same Article in the Layouts found on the Web. Text directly in <div> / <span> is common on CMS and Forum Pages
+def getPages():
+    first, second, third, fourth = ARTICLE_SENTENCES
+    menu = getLinkList(BOILERPLATE_SENTENCES[:3])
+    head = f"<head><title>Node.js Releases</title><style>p {{margin: 0}}</style><script>var x = 1;</script></head>"
+    footer = f"<footer>{BOILERPLATE_SENTENCES[5]}</footer>"
+    return {
+        "paragraphs": f"<html>{head}<body><nav>{menu}</nav><article><h1>Node.js Releases</h1><p>{first}</p><p>{second}</p>"
+                      f"<p>{third}</p><p>{fourth}</p></article><aside>{BOILERPLATE_SENTENCES[3]}</aside>{footer}</body></html>",
+        "divs": f"<html>{head}<body><div class='menu'>{menu}</div><div class='content'>{first}<br>{second}<div>{third}</div>{fourth}</div>"
+                f"<div class='banner'>{BOILERPLATE_SENTENCES[4]} <a href='/privacy'>Privacy</a></div>{footer}</body></html>",
+        "spans": f"<html>{head}<body><div>{menu}</div><section><span>{first}</span> <span>{second}</span><br><span>{third}</span>"
+                 f" <span>{fourth}</span></section>{footer}</body></html>",
+        "table": f"<html>{head}<body><table><tr><td>{menu}</td></tr><tr><td>{first} {second}</td></tr><tr><td>{third}</td>"
+                 f"<td>{fourth}</td></tr></table>{footer}</body></html>",
+        "forum": f"<html>{head}<body><div class='post'><div class='author'><a href='/u/1'>nodefan</a></div><div class='body'>{first} {second}"
+                 f"</div></div><div class='post'><div class='author'><a href='/u/2'>jsdev</a></div><div class='body'>{third} {fourth}</div></div>"
+                 f"<form><button>{BOILERPLATE_SENTENCES[3]}</button></form></body></html>",
+        "mixed": f"<html>{head}<body><header>{menu}</header><main><h2>Node.js Releases</h2><p>{first}</p>{second}<ul><li>{third}</li></ul>"
+                 f"<div><em>{fourth}</em></div></main><div id='cookies'>{BOILERPLATE_SENTENCES[4]}</div>{footer}</body></html>"
+    }
+
+
+# Share of the Sentences found in the Extracted Text, Whitespace insensitive
+def getFoundShare(sentences: list, text: str):
+    text = re.sub(r"\s+", " ", text or "")
+    return sum(1 for sentence in sentences if sentence in text) / len(sentences)
+
+
+# Serve the Test Pages on a local Port, for the Extractors which Download the Page themselves
+def startPageServer(pages: dict):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            body = pages.get(self.path.strip("/"), "").encode("utf-8")
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = QuietHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever,
+                     name="ExtractionPages", daemon=True).start()
+    return server
+
+
+# Extractors to Compare: Name -> Function (html, url) -> Extracted Text. `articleparser` only if it is Installed
+def getExtractors():
+    extractors = {"builtin": lambda html, url: (
+        extractArticle(html, url) or {}).get("content", "")}
+
+    try:
+        import articleparser
+    except ImportError:
+        return extractors
+
+    extractors["articleparser"] = lambda html, url: (
+        articleparser.parseArticle(url, timeout=10) or {}).get("content", "")
+    return extractors
+
+
+# Run every Extractor on every Page and Report its Recall, Noise and Time
+def runExtractionBenchmark(extractors=None, repeat=20):
+    """
+    Description: Extract the same Article from Pages of different Layouts with every Extractor
+    Return: Machine readable Report (dict): per Extractor and Page, `recall` (Share of the Article Sentences Extracted), `noise` (Share of the Boilerplate Sentences Extracted), `milliseconds` per Page and `error` if it Failed
+    Parameters:
+        extractors: Names of the Extractors to run, see `getExtractors` (Default: All the Installed ones)
+        repeat: Extractions per Page, to Time them (Default: 20)
+    """
+    available = getExtractors()
+    extractors = list(available.keys()) if extractors is None else extractors
+    pages = getPages()
+    report = {"repeat": repeat, "extractors": {}}
+
+    server = startPageServer(pages)
+    try:
+        for name in extractors:
+            if (name not in available):
+                raise ValueError(f"Extractor is not Installed: {name}")
+
+            results = {}
+            for page, html in pages.items():
+                url = f"http://127.0.0.1:{server.server_address[1]}/{page}"
+                try:
+                    startTime = time.perf_counter()
+                    for i in range(repeat):
+                        text = available[name](html, url)
+                    milliseconds = (time.perf_counter() - startTime) * 1000 / repeat
+                except Exception as e:
+                    results[page] = {"error": repr(e)}
+                    continue
+
+                results[page] = {"recall": getFoundShare(ARTICLE_SENTENCES, text), "noise": getFoundShare(BOILERPLATE_SENTENCES, text),
+                                 "milliseconds": milliseconds}
+
+            scored = [result for result in results.values()
+                      if "error" not in result]
+            report["extractors"][name] = {
+                "pages": results,
+                "recall": sum(result["recall"] for result in scored) / len(scored) if scored else None,
+                "noise": sum(result["noise"] for result in scored) / len(scored) if scored else None,
+                "errors": len(results) - len(scored)
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare the Article Extraction of the Package with `articleparser` on Pages of different Layouts")
+    parser.add_argument("--extractors", nargs="+", default=None,
+                        help="Extractors to run: builtin, articleparser (Default: the Installed ones)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(runExtractionBenchmark(
+        extractors=args.extractors, repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
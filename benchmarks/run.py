@@ -0,0 +1,249 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from question_answer import QuestionAnswerClient, GetQuestionAnswer, ArticleExtractor, __version__
+from question_answer.__cache import normalizeQuery
+from question_answer.__utils import formatSerperSearchResults
+from .servers import FakeUpstreams
+
+#### Const Variables ####
+
+# Entry Points which can be Benchmarked. `google-via-serper` runs getAnswerViaGoogleSearch with the Google Search Step Answered by the Fake Serper, so it measures the Article / Inference Stages of that Path, not the Google Scraping
+SCENARIOS = ["serper", "google-via-serper", "object"]
+
+# Percentiles of the Latency Reports
+PERCENTILES = [50, 95, 99]
+
+
+# Client which Searches Google via the Fake Serper, `articleparser` Scrapes the real Google and can't be Pointed to a local Server
+class BenchmarkClient(QuestionAnswerClient):
+    def fetchGoogleSearchResults(self, query, num_results, cacheKey):
+        apiResults = self.fetchSerperApiResult(
+            query, f"serper:{normalizeQuery(query)}")
+        searchResults = formatSerperSearchResults(
+            apiResults.get("organic", []))[:num_results]
+        if (self.searchCache is not None) and (searchResults):
+            self.searchCache.set(cacheKey, searchResults)
+
+        return searchResults
+
+
+# Nearest Rank Percentile of the sorted Values
+def getPercentile(values: list, percentile: float):
+    if (len(values) == 0):
+        return None
+
+    rank = max(1, -(-len(values) * percentile // 100))
+    return values[int(rank) - 1]
+
+
+# p50 / p95 / p99, Mean and Max of the Values
+def getDistribution(values: list):
+    values = sorted(values)
+    distribution = {f"p{percentile}": getPercentile(values, percentile)
+                    for percentile in PERCENTILES}
+    distribution["mean"] = (sum(values) / len(values)) if values else None
+    distribution["max"] = values[-1] if values else None
+    return distribution
+
+
+# Answer one Question with the Entry Point of the Scenario. Returns (success, stageDurations)
+def runRequest(scenario: str, client, question: str, options: dict):
+    if (scenario == "serper"):
+        answer = client.getAnswerViaSerperApi(question, num_results=options["num_results"], timeout=options["timeout"],
+                                              forceAi=options["forceAi"], fast=False)
+        return answer.success, answer.trace.summary()
+
+    if (scenario == "google-via-serper"):
+        answer = client.getAnswerViaGoogleSearch(
+            question, num_results=options["num_results"], timeout=options["timeout"])
+        return answer.success, answer.trace.summary()
+
+    asker = GetQuestionAnswer("serper", num_results=options["num_results"], timeout=options["timeout"],
+                              forceAi=options["forceAi"], client=client)
+    asker.searchQuestion(question)
+    asker.parseArticles()
+    output = asker.getFinalAnswer()
+    return output["success"], asker.trace.summary()
+
+
+# Run the Questions of a Scenario with the Concurrency and Report the Latencies
+def runScenario(scenario: str, client, questions: list, concurrency: int, options: dict):
+    def timed(question):
+        startTime = time.perf_counter()
+        try:
+            success, stages = runRequest(scenario, client, question, options)
+            error = None
+        except Exception as e:
+            success, stages, error = False, {}, repr(e)
+
+        return time.perf_counter() - startTime, success, stages, error
+
+    startTime = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, questions))
+    wallTime = time.perf_counter() - startTime
+
+    stages = {}
+    for latency, success, stageDurations, error in results:
+        for stage, duration in stageDurations.items():
+            if (stage != "total"):
+                stages.setdefault(stage, []).append(duration)
+
+    errors = [error for latency, success, stages, error in results if error]
+    return {
+        "requests": len(results),
+        "concurrency": concurrency,
+        "successes": sum(1 for latency, success, stages, error in results if success),
+        "errors": len(errors),
+        "errorSamples": sorted(set(errors))[:5],
+        "wallTime": wallTime,
+        "throughput": len(results) / wallTime if wallTime else None,
+        "latency": getDistribution([latency for latency, success, stages, error in results]),
+        "stages": {stage: getDistribution(durations) for stage, durations in sorted(stages.items())}
+    }
+
+
+# Run the Benchmark against the Fake Upstreams
+def runBenchmark(scenarios=None, requests=50, concurrency=8, upstreamConfig=None, seed=0, num_results=3, timeout=10, forceAi=True,
+                 formalMode="remote", qaMode="remote", cache=False, warmup=2, extractorProcesses=0):
+    """
+    Description: Start the Fake Upstreams, Answer `requests` distinct Questions per Scenario with `concurrency` Threads and Report the Latencies
+    Return: Machine readable Report (dict) with the Config and, per Scenario, the p50 / p95 / p99 Latency, Throughput and Stage Breakdown
+    Parameters:
+        scenarios: Entry Points to run: `serper` (getAnswerViaSerperApi), `google-via-serper` (getAnswerViaGoogleSearch, Searching via the Fake Serper), `object` (GetQuestionAnswer) (Default: All)
+        requests: Questions per Scenario (Default: 50)
+        concurrency: Parallel Questions (Default: 8)
+        upstreamConfig: Overrides of the Fake Upstreams Config, see `DEFAULT_UPSTREAM_CONFIG` (Default: None)
+        seed: Seed of the random Latencies and Failures (Default: 0)
+        num_results: Articles per Question (Default: 3)
+        timeout: Timeout of the Article Requests (Default: 10s)
+        forceAi: Use the QnA Model even if Serper gave a Direct Answer (Default: True)
+        formalMode: Formal Mode of the Client (Default: remote)
+        qaMode: QnA Mode of the Client (Default: remote)
+        cache: Keep the Search / Inference Caches and the Question Index enabled (Default: False)
+        warmup: Questions Answered per Scenario before Measuring, not Reported (Default: 2)
+        extractorProcesses: Extract the Articles in an `ArticleExtractor` with this many Processes, 0 to Extract them in the Fetching Threads (Default: 0)
+    """
+    scenarios = SCENARIOS if scenarios is None else scenarios
+    options = {"num_results": num_results,
+               "timeout": timeout, "forceAi": forceAi}
+    report = {
+        "version": __version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "config": {"requests": requests, "concurrency": concurrency, "seed": seed, "num_results": num_results, "timeout": timeout,
+                   "forceAi": forceAi, "formalMode": formalMode, "qaMode": qaMode, "cache": cache, "warmup": warmup,
+                   "extractorProcesses": extractorProcesses},
+        "scenarios": {}
+    }
+
+    extractor = ArticleExtractor(
+        maxWorkers=extractorProcesses) if extractorProcesses > 0 else None
+    with FakeUpstreams(upstreamConfig, seed=seed) as upstreams:
+        report["config"]["upstreams"] = upstreams.config
+        for scenario in scenarios:
+            if (scenario not in SCENARIOS):
+                raise ValueError(f"Unknown Scenario: {scenario}")
+
+            cacheOptions = {} if cache else {
+                "searchCache": None, "inferenceCache": None, "questionIndex": None}
+            client = upstreams.configureClient(BenchmarkClient(
+                "benchmark", "benchmark", articleExtractor=extractor, formalMode=formalMode, qaMode=qaMode, **cacheOptions))
+
+            # Questions are distinct, so nothing is Coalesced between them
+            for i in range(warmup):
+                runScenario(scenario, client, [
+                            f"What is the latest version of warmup{i}?"], 1, options)
+            upstreams.counters.clear()
+
+            questions = [f"What is the latest version of {scenario}pkg{i}?"
+                         for i in range(requests)]
+            report["scenarios"][scenario] = runScenario(
+                scenario, client, questions, concurrency, options)
+            report["scenarios"][scenario]["upstreamRequests"] = dict(
+                upstreams.counters)
+            client.close()
+
+    if (extractor is not None):
+        extractor.close()
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Question Answer Pipeline against local Fake Serper, Hugging Face and Article Servers")
+    parser.add_argument("--scenarios", nargs="+",
+                        choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--num-results", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--no-force-ai", action="store_true",
+                        help="Use the Serper Direct Answers when there are some")
+    parser.add_argument("--formal-mode", default="remote",
+                        choices=["local", "remote", "auto"])
+    parser.add_argument("--qa-mode", default="remote",
+                        choices=["remote", "local", "auto"])
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep the Caches and the Question Index enabled")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--extractor-processes", type=int, default=0,
+                        help="Extract the Articles in this many Processes (0: in the Fetching Threads)")
+    parser.add_argument("--config", default=None,
+                        help="JSON File of the Fake Upstreams Config Overrides")
+    parser.add_argument("--serper-latency", type=float)
+    parser.add_argument("--model-latency", type=float)
+    parser.add_argument("--loading-requests", type=int,
+                        help="First Requests of every Model Answered with `Model is Loading`")
+    parser.add_argument("--article-latency", type=float)
+    parser.add_argument("--article-size", type=int)
+    parser.add_argument("--article-failure-rate", type=float)
+    parser.add_argument("--direct-answer-rate", type=float)
+    parser.add_argument("--output", default=None,
+                        help="Write the JSON Report to this File instead of stdout")
+    parser.add_argument("--history", default=None,
+                        help="Append the Report as one JSON Line to this File")
+    args = parser.parse_args(argv)
+
+    upstreamConfig = {}
+    if (args.config):
+        with open(args.config, "r", encoding="utf-8") as file:
+            upstreamConfig = json.load(file)
+
+    for upstream, key, value in [("serper", "latency", args.serper_latency), ("qa", "latency", args.model_latency),
+                                 ("formal", "latency", args.model_latency), ("qa",
+                                                                             "loadingRequests", args.loading_requests),
+                                 ("formal", "loadingRequests", args.loading_requests), (
+                                     "articles", "latency", args.article_latency),
+                                 ("articles", "size", args.article_size), (
+                                     "articles", "failureRate", args.article_failure_rate),
+                                 ("serper", "directAnswerRate", args.direct_answer_rate)]:
+        if (value is not None):
+            upstreamConfig.setdefault(upstream, {})[key] = value
+
+    report = runBenchmark(scenarios=args.scenarios, requests=args.requests, concurrency=args.concurrency, upstreamConfig=upstreamConfig,
+                          seed=args.seed, num_results=args.num_results, timeout=args.timeout, forceAi=not args.no_force_ai,
+                          formalMode=args.formal_mode, qaMode=args.qa_mode, cache=args.cache, warmup=args.warmup,
+                          extractorProcesses=args.extractor_processes)
+
+    output = json.dumps(report, indent=2)
+    if (args.output):
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if (args.history):
+        with open(args.history, "a", encoding="utf-8") as file:
+            file.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
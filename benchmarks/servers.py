@@ -0,0 +1,252 @@
+import copy
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+#### Const Variables ####
+
+# Behaviour of the Fake Upstreams. Latencies are in seconds, `jitter` is the max extra random Latency, Models without `batching` Reject the Inputs Lists
+DEFAULT_UPSTREAM_CONFIG = {
+    "serper": {"latency": 0.05, "jitter": 0.02, "failureRate": 0, "results": 5, "directAnswerRate": 0},
+    "qa": {"latency": 0.1, "jitter": 0.05, "failureRate": 0, "loadingRequests": 0, "estimatedTime": 0.5, "batching": True},
+    "formal": {"latency": 0.3, "jitter": 0.1, "failureRate": 0, "loadingRequests": 0, "estimatedTime": 0.5, "batching": True},
+    "articles": {"latency": 0.1, "jitter": 0.1, "failureRate": 0, "size": 20000, "contentType": "text/html; charset=utf-8"}
+}
+
+# Text the Article Pages are Padded with
+FILLER_SENTENCES = ["The project is maintained by a community of contributors from around the world.",
+                    "Releases are published on a regular schedule with long term support lines.",
+                    "Documentation covers the installation, the configuration and the migration guides.",
+                    "Security fixes are backported to every supported release line."]
+
+
+# HTTP Server which doesn't Log the Clients closing the Connection early (Capped Article Downloads)
+class QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not (isinstance(sys.exc_info()[1], ConnectionError)):
+            super().handle_error(request, client_address)
+
+
+# Merge the Overrides into a Copy of the Default Config
+def getUpstreamConfig(overrides=None):
+    config = copy.deepcopy(DEFAULT_UPSTREAM_CONFIG)
+    for upstream, values in (overrides or {}).items():
+        config.setdefault(upstream, {}).update(values)
+
+    return config
+
+
+# Version which is the Answer of the Question about the Package
+def getPackageVersion(package: str):
+    number = sum(ord(char) for char in package)
+    return f"{number % 30}.{number % 7}.{number % 11}"
+
+
+# HTML Page of an Article, about `size` Bytes, containing the Answer of the Question
+def getArticleHtml(package: str, size: int):
+    version = getPackageVersion(package)
+    blocks = [f"<h1>{package} Releases</h1>",
+              f"<p>The latest version of {package} is {version}, released on May 2, 2024.</p>"]
+    length = sum(len(block) for block in blocks)
+    i = 0
+    while (length < size):
+        block = f"<p>{FILLER_SENTENCES[i % len(FILLER_SENTENCES)]}</p>"
+        blocks.append(block)
+        length += len(block)
+        i += 1
+
+    return f"<html><head><title>{package} Releases</title></head><body><nav>Home | Docs</nav><article>{''.join(blocks)}</article></body></html>"
+
+
+# Local Stand In of Serper, the Hugging Face QnA / Text Generation Endpoints and the Article Pages
+class FakeUpstreams:
+    """
+    Description: Runs a local HTTP Server with `/search` (Serper), `/models/qa` (QnA), `/models/formal` (Text Generation) and `/article/<package>/<i>` (Article Pages, their Query String overrides the Config), with configurable Latency, Size, Failure Rate and "Model is Loading" Responses
+    Initial Parameters:
+        config: Overrides of DEFAULT_UPSTREAM_CONFIG, {upstream: {key: value}} (Default: None)
+        seed: Seed of the random Latencies and Failures (Default: 0)
+        host: Host to Listen on (Default: 127.0.0.1)
+        port: Port to Listen on, 0 for any free Port (Default: 0)
+    """
+
+    def __init__(self, config=None, seed=0, host="127.0.0.1", port=0) -> None:
+        self.config = getUpstreamConfig(config)
+        self.host = host
+        self.port = port
+        self.server = None
+        self.counters = {}
+        self.apiKeys = {}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.server.server_address[1]}"
+
+    # Count the Request of the Upstream. Returns its Number, starting at 1
+    def count(self, upstream: str):
+        with self._lock:
+            self.counters[upstream] = self.counters.get(upstream, 0) + 1
+            return self.counters[upstream]
+
+    # Record the API Key the Upstream was Called with
+    def recordApiKey(self, upstream: str, apiKey):
+        with self._lock:
+            self.apiKeys.setdefault(upstream, set()).add(apiKey)
+
+    # Sleep the Latency of the Upstream. Returns `True` if the Request must Fail. `overrides` replace Config Values for this Request
+    def simulate(self, upstream: str, overrides=None):
+        config = dict(self.config[upstream], **(overrides or {}))
+        with self._lock:
+            delay = config["latency"] + self._random.random() * config["jitter"]
+            failed = self._random.random() < config["failureRate"]
+
+        time.sleep(delay)
+        return failed
+
+    # Point the Client to the Fake Upstreams
+    def configureClient(self, client):
+        client.serperApiUrl = f"{self.url}/search"
+        client.qaModels = [f"{self.url}/models/qa"]
+        client.formalAnswerModel = f"{self.url}/models/formal"
+        return client
+
+    def start(self):
+        upstreams = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def sendBody(self, status: int, body, contentType="application/json", headers=None):
+                if not (isinstance(body, bytes)):
+                    body = json.dumps(body).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", contentType)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def readJson(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    return json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    return {}
+
+            # The Query String of an Article overrides its Config: `?latency=2&size=500&contentType=application/pdf&status=404`
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                match = re.fullmatch(r"/article/([^/]+)/(\d+)", parts.path)
+                if not (match):
+                    return self.sendBody(404, {"error": "Not Found"})
+
+                upstreams.count("articles")
+                overrides = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+                for key in ["latency", "jitter", "failureRate"]:
+                    if (key in overrides):
+                        overrides[key] = float(overrides[key])
+                if (upstreams.simulate("articles", overrides)):
+                    return self.sendBody(500, b"Internal Server Error", "text/plain")
+
+                # The Pages never Change, so a Conditional Request with their ETag is `304 Not Modified`
+                config = dict(upstreams.config["articles"], **overrides)
+                etag = f'"{match.group(1)}-{match.group(2)}-{config["size"]}"'
+                if (self.headers.get("If-None-Match") == etag):
+                    upstreams.count("revalidations")
+                    return self.sendBody(304, b"", config["contentType"], {"ETag": etag})
+
+                self.sendBody(int(config.get("status", 200)), getArticleHtml(match.group(1), int(config["size"])).encode(
+                    "utf-8"), config["contentType"], {"ETag": etag})
+
+            def do_POST(self):
+                payload = self.readJson()
+                if (self.path == "/search"):
+                    return self.search(payload)
+                if (self.path in ["/models/qa", "/models/formal"]):
+                    return self.model(self.path.split("/")[-1], payload)
+
+                self.sendBody(404, {"error": "Not Found"})
+
+            def search(self, payload: dict):
+                upstreams.count("serper")
+                upstreams.recordApiKey("serper", self.headers.get("X-API-KEY"))
+                if (upstreams.simulate("serper")):
+                    return self.sendBody(500, {"message": "Internal Server Error"})
+
+                config = upstreams.config["serper"]
+                package = re.sub(r"\W+", "-", payload.get("q", "")).strip("-") or "package"
+                results = {"organic": [{"title": f"{package} Releases {i}", "link": f"{upstreams.url}/article/{package}/{i}",
+                                        "snippet": f"The latest version of {package} is ..."} for i in range(config["results"])]}
+                with upstreams._lock:
+                    directAnswer = upstreams._random.random() < config["directAnswerRate"]
+                if (directAnswer):
+                    results["answerBox"] = {"title": f"{package} Releases",
+                                            "answer": getPackageVersion(package)}
+
+                self.sendBody(200, results)
+
+            def model(self, upstream: str, payload: dict):
+                number = upstreams.count(upstream)
+                upstreams.recordApiKey(upstream, self.headers.get(
+                    "Authorization", "").replace("Bearer ", "", 1))
+                config = upstreams.config[upstream]
+                if (number <= config["loadingRequests"]):
+                    return self.sendBody(503, {"error": f"Model {upstream} is currently loading", "estimated_time": config["estimatedTime"]})
+
+                if (upstreams.simulate(upstream)):
+                    return self.sendBody(500, {"error": "Internal Server Error"})
+
+                inputs = payload.get("inputs")
+                batched = isinstance(inputs, list)
+                if (batched) and (not config["batching"]):
+                    return self.sendBody(400, {"error": "Inputs must be a single Input, not a List"})
+
+                results = [self.infer(upstream, input) for input in (
+                    inputs if batched else [inputs])]
+                self.sendBody(200, results if batched else results[0])
+
+            def infer(self, upstream: str, input):
+                if (upstream == "formal"):
+                    # The last `A:` of the Prompt is the Target, the first one is the Example
+                    answers = re.findall(r"A: (.*)\n", str(input))
+                    return [{"generated_text": f"The answer is {answers[-1] if answers else ''}."}]
+
+                context = (input or {}).get("context", "")
+                match = re.search(r"\d+\.\d+\.\d+", context)
+                if not (match):
+                    return {"answer": "", "score": 0.01, "start": 0, "end": 0}
+
+                return {"answer": match.group(0), "score": 0.9, "start": match.start(), "end": match.end()}
+
+        self.server = QuietHTTPServer((self.host, self.port), Handler)
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="FakeUpstreams", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if (self.server is not None):
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -33,18 +33,37 @@ if (clicked):
         asker = asker_Serper
 
     asker.num_results = num_results
-    with st.spinner("Searching for Question..."):
-        asker.searchQuestion(question)
 
-    with st.spinner("Parsing the Articles..."):
-        asker.parseArticles()
+    # Show every Stage as soon as it is Ready: the Direct / raw Answer comes before the Formal one
+    status = st.empty()
+    status.info("Searching for Question...")
+    quickAnswer = st.empty()
+    finalAnswer = None
 
-    with st.spinner("Parsing final Answer..."):
-        finalAnswer = asker.getFinalAnswer()
+    for event in asker.stream(question):
+        if (event.type == "searchResults"):
+            status.info("Parsing the Articles...")
 
+        elif (event.type == "directAnswer"):
+            quickAnswer.info(f"Quick Answer: {event.data['answer']}")
+            status.info("Parsing final Answer...")
+
+        elif (event.type == "article"):
+            status.info(f"Article Parsed: {event.data['title']}")
+
+        elif (event.type == "answer") and (event.data["success"]):
+            quickAnswer.info(
+                f"Quick Answer: {event.data['result']['answer']}")
+            status.info("Parsing final Answer...")
+
+        elif (event.type == "formalAnswer"):
+            finalAnswer = event.data
+
+    status.empty()
     if (not finalAnswer["success"]):
         st.error("Error Ocurred!")
         st.write("Error Data:\n", finalAnswer["result"])
     else:
+        quickAnswer.empty()
         st.subheader("Your Answer:")
         st.write(finalAnswer["result"])
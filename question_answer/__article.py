@@ -0,0 +1,437 @@
+import asyncio
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import articleparser
+
+from .__transport import getTransport
+from .__trace import setSpanAttributes
+
+#### Const Variables ####
+
+# Headers sent while fetching the Articles
+ARTICLE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8"
+}
+
+# Max Bytes of an Article Page which are Downloaded and Extracted, the rest of the Page is never Read
+ARTICLE_MAX_BYTES = 1024 * 1024
+
+# Content-Types which can contain an Article. Pages without a Content-Type are Read too
+ARTICLE_CONTENT_TYPES = ["text/html", "application/xhtml+xml"]
+
+# Links which are never an Article (Documents, Media, Archives, Videos, App Stores), they are not Requested
+SKIPPED_URL_EXTENSIONS = ["pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "odt", "epub", "zip", "gz", "tar", "rar", "7z", "exe", "msi",
+                          "dmg", "apk", "iso", "mp3", "wav", "ogg", "mp4", "m4v", "avi", "mov", "mkv", "webm", "jpg", "jpeg", "png", "gif", "webp", "svg"]
+SKIPPED_URL_PATTERNS = [r"(^|\.)youtube\.com/(watch|shorts|embed)", r"(^|\.)youtu\.be/", r"(^|\.)vimeo\.com/\d", r"(^|\.)tiktok\.com/",
+                        r"^apps\.apple\.com/", r"^play\.google\.com/store/", r"^(www\.)?microsoft\.com/[^/]+/p/"]
+
+# Articles with less Text than it are Parsed again with `articleparser`, the Builtin Extractor may have missed the Article (Scripted Pages, unusual Layouts)
+ARTICLE_MIN_CHARS = 200
+
+# Pages smaller than it are Extracted in the Fetching Thread, Sending them to a Process costs more than it saves
+EXTRACT_INLINE_BYTES = 32 * 1024
+
+# Tags whose Text is never part of the Article
+SKIP_TAGS = ["script", "style", "noscript", "template", "svg", "nav",
+             "header", "footer", "aside", "form", "button", "iframe", "select"]
+
+# Tags which contain the Article Text
+BLOCK_TAGS = ["p", "h1", "h2", "h3", "h4", "h5", "h6", "li",
+              "pre", "blockquote", "td", "th", "dd", "dt", "figcaption"]
+
+# Layout Tags: the Text directly inside them is kept too, split into Blocks at their Boundaries
+CONTAINER_TAGS = ["html", "body", "main", "article", "section", "div", "center", "table", "tr", "ul", "ol", "dl",
+                  "figure", "details", "summary", "address", "hr"]
+
+# Share of Link Text from which a Block outside the Block Tags is a Menu / Link List, not Article Text
+MAX_LINK_DENSITY = 0.5
+
+
+# Parse the Article Text out of a HTML Document
+class ArticleHTMLParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.blocks = []
+
+        self._skipDepth = 0
+        self._blockDepth = 0
+        self._linkDepth = 0
+        self._inTitle = False
+        self._buffer = []
+        self._linkChars = 0
+
+    # End the current Block. Text outside the Block Tags is Dropped if it is mostly Links
+    def flushBlock(self):
+        text = re.sub(r"\s+", " ", "".join(self._buffer)).strip()
+        linkDensity = self._linkChars / len(text) if text else 0
+        if (text) and ((self._blockDepth > 0) or (linkDensity <= MAX_LINK_DENSITY)):
+            self.blocks.append(text)
+        self._buffer = []
+        self._linkChars = 0
+
+    def handle_starttag(self, tag, attrs):
+        if (tag in SKIP_TAGS):
+            self._skipDepth += 1
+        elif (tag == "title"):
+            self._inTitle = True
+        elif (tag in BLOCK_TAGS):
+            self.flushBlock()
+            self._blockDepth += 1
+        elif (tag in CONTAINER_TAGS):
+            self.flushBlock()
+        elif (tag == "a"):
+            self._linkDepth += 1
+        elif (tag == "br"):
+            self._buffer.append(" ")
+
+    def handle_endtag(self, tag):
+        if (tag in SKIP_TAGS):
+            self._skipDepth = max(0, self._skipDepth - 1)
+        elif (tag == "title"):
+            self._inTitle = False
+        elif (tag in BLOCK_TAGS):
+            self.flushBlock()
+            self._blockDepth = max(0, self._blockDepth - 1)
+        elif (tag in CONTAINER_TAGS):
+            self.flushBlock()
+        elif (tag == "a"):
+            self._linkDepth = max(0, self._linkDepth - 1)
+
+    def handle_data(self, data):
+        if (self._inTitle):
+            self.title += data
+        elif (self._skipDepth == 0):
+            self._buffer.append(data)
+            if (self._linkDepth > 0):
+                self._linkChars += len(data.strip())
+
+
+# Why the URL is not worth Requesting ("extension" / "pattern"), `None` if it can be an Article
+def getSkippedUrlReason(url: str):
+    parts = urlsplit(url)
+    fileName = parts.path.rsplit("/", 1)[-1]
+    if ("." in fileName) and (fileName.rsplit(".", 1)[-1].lower() in SKIPPED_URL_EXTENSIONS):
+        return "extension"
+
+    location = parts.netloc.lower() + parts.path
+    if (any(re.search(pattern, location) for pattern in SKIPPED_URL_PATTERNS)):
+        return "pattern"
+
+    return None
+
+
+# Check if the Content-Type can contain an Article
+def isArticleContentType(contentType: str):
+    mediaType = contentType.split(";")[0].strip().lower()
+    return (mediaType == "") or (mediaType in ARTICLE_CONTENT_TYPES)
+
+
+# Length of the Body declared in the Headers, `None` if there is none (Chunked Responses)
+def getDeclaredLength(headers):
+    try:
+        return int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+# Check if the declared Length of the Body is over `maxBytes`, such Pages are Skipped before their Body is Read
+def isOversizedArticle(headers, maxBytes=ARTICLE_MAX_BYTES):
+    length = getDeclaredLength(headers)
+    return (length is not None) and (length > maxBytes)
+
+
+# Bytes of the Article Body to Read: 0 if it is not HTML or declares more than `maxBytes`, else `maxBytes` (Undeclared Oversized Bodies are Capped)
+def getArticleByteLimit(headers, maxBytes=ARTICLE_MAX_BYTES):
+    if not (isArticleContentType(headers.get("Content-Type", ""))) or (isOversizedArticle(headers, maxBytes)):
+        return 0
+
+    return maxBytes
+
+
+# Decode the HTML Body using the Charset of the Content-Type (UTF-8 if not Given)
+def decodeHtml(body: bytes, contentType=""):
+    charset = re.search(r"charset=[\"']?([\w-]+)", contentType, re.IGNORECASE)
+    try:
+        return body.decode(charset.group(1) if charset else "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+# Extract the Article from a HTML Document. Returns `None` if nothing could be Extracted
+def extractArticle(html: str, url=None):
+    parser = ArticleHTMLParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:
+        return None
+
+    parser.flushBlock()
+    content = "\n".join(parser.blocks)
+    if (content == ""):
+        return None
+
+    return {"url": url, "title": parser.title.strip(), "content": content}
+
+
+# Decode and Extract the Article of a downloaded Body. Runs in the Extraction Processes
+def extractArticleFromBody(body: bytes, contentType="", url=None):
+    return extractArticle(decodeHtml(body, contentType), url=url)
+
+
+# Check if the Extracted Article is missing or too short to be the whole Article
+def isPoorArticle(article, minChars=ARTICLE_MIN_CHARS):
+    return (article is None) or (len(article["content"]) < minChars)
+
+
+# Parse the Article with `articleparser` (it Downloads the Page again), keeping the Builtin one if it has more Text. Fallback of the Poor Extractions
+def getFallbackArticle(url: str, article, timeout=10):
+    try:
+        parsed = articleparser.parseArticle(url, timeout=timeout)
+    except Exception as e:
+        return article
+
+    content = (parsed or {}).get("content") or ""
+    if (len(content) <= (0 if article is None else len(article["content"]))):
+        return article
+
+    setSpanAttributes(fallback="articleparser")
+    return {"url": url, "title": (parsed.get("title") or "").strip(), "content": content}
+
+
+# Extracts the Articles in a Process Pool, so the Extraction of concurrent Fetches is not Serialized by the GIL
+class ArticleExtractor:
+    """
+    Description: Second Stage of the Article Pipeline: the Fetching Threads / Tasks hand the downloaded Bodies to a Pool of Processes which Extract them. At most `maxQueued` Bodies wait for or are in Extraction, Fetches wait for a Slot when it is full
+    Initial Parameters:
+        maxWorkers: Number of Extraction Processes (Default: Number of CPUs)
+        maxQueued: Max Bodies waiting for or in Extraction (Default: 2 * maxWorkers)
+        minBytes: Bodies smaller than it are Extracted in the calling Thread (Default: EXTRACT_INLINE_BYTES, 32KB)
+        context: `multiprocessing` Context of the Processes (Default: Platform Default)
+    """
+
+    def __init__(self, maxWorkers=None, maxQueued=None, minBytes=EXTRACT_INLINE_BYTES, context=None) -> None:
+        self.maxWorkers = maxWorkers or os.cpu_count() or 1
+        self.maxQueued = maxQueued or 2 * self.maxWorkers
+        self.minBytes = minBytes
+        self.context = context
+        self.inline = 0
+        self.pooled = 0
+
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(self.maxQueued)
+        self._lock = threading.Lock()
+
+    # Get the Process Pool, Creates it on first use or if a Process Crashed
+    def getExecutor(self):
+        with self._lock:
+            if (self._executor is None):
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.maxWorkers, mp_context=self.context)
+            return self._executor
+
+    def resetExecutor(self, executor):
+        with self._lock:
+            if (self._executor is executor):
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def extractInline(self, body: bytes, contentType, url):
+        with self._lock:
+            self.inline += 1
+        return extractArticleFromBody(body, contentType, url)
+
+    # Extract the Article of the Body in the Pool. Blocks until it is Extracted
+    def extract(self, body: bytes, contentType="", url=None):
+        if (len(body) < self.minBytes):
+            return self.extractInline(body, contentType, url)
+
+        with self._slots:
+            executor = self.getExecutor()
+            try:
+                article = executor.submit(
+                    extractArticleFromBody, body, contentType, url).result()
+            except BrokenProcessPool:
+                self.resetExecutor(executor)
+                return self.extractInline(body, contentType, url)
+
+        with self._lock:
+            self.pooled += 1
+        return article
+
+    # Async version of `extract`, the Event Loop is not Blocked while Waiting
+    async def extractAsync(self, body: bytes, contentType="", url=None):
+        if (len(body) < self.minBytes):
+            return self.extractInline(body, contentType, url)
+
+        if not (self._slots.acquire(blocking=False)):
+            await asyncio.to_thread(self._slots.acquire)
+        try:
+            executor = self.getExecutor()
+            try:
+                article = await asyncio.wrap_future(executor.submit(extractArticleFromBody, body, contentType, url))
+            except BrokenProcessPool:
+                self.resetExecutor(executor)
+                return self.extractInline(body, contentType, url)
+        finally:
+            self._slots.release()
+
+        with self._lock:
+            self.pooled += 1
+        return article
+
+    # Shut the Processes down, they are Started again if the Extractor is used
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if (executor is not None):
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # Number of Articles Extracted in the calling Thread and in the Pool
+    def stats(self):
+        with self._lock:
+            return {"workers": self.maxWorkers, "inline": self.inline, "pooled": self.pooled}
+
+
+# Fetch and Extract the Article of the URL. Returns `None` if nothing could be Extracted
+def fetchArticle(url: str, timeout=10, transport=None, cache=None, maxBytes=ARTICLE_MAX_BYTES, extractor=None):
+    """
+    Description: Stream the URL through the pooled Transport and Extract the Article. Links which are never an Article, non HTML Responses and Pages declaring more than `maxBytes` are Skipped, only the first `maxBytes` of the Page are Read. Pages the Builtin Extractor gets little Text from are Parsed again with `articleparser`
+    Parameters:
+        url: Article URL
+        timeout: Timeout of Article URL Request (Default: 10s)
+        transport: Transport to use (Default: Default Transport)
+        cache: `ArticleCache` to serve and store the Extracted Articles (Default: None)
+        maxBytes: Max Bytes of the Page to Download and Extract (Default: ARTICLE_MAX_BYTES, 1MB)
+        extractor: `ArticleExtractor` to Extract the Page in, `None` to Extract it in the calling Thread (Default: None)
+    """
+    if (transport is None):
+        transport = getTransport()
+
+    entry, headers = getCachedArticleEntry(url, cache)
+    if (entry is not None) and (entry["fresh"]):
+        setSpanAttributes(cached=True)
+        return entry["article"]
+
+    skippedReason = getSkippedUrlReason(url)
+    if (skippedReason is not None):
+        setSpanAttributes(skipped=skippedReason)
+        return None
+
+    # Not Retried, so `timeout` Bounds the Fetch. A failing Page falls back to its Snippet
+    response = transport.get(url, timeout=timeout, headers=headers, maxRetries=0,
+                             maxBytes=lambda responseHeaders: getArticleByteLimit(responseHeaders, maxBytes))
+    article, extract = checkArticleResponse(
+        url, response, entry, cache, maxBytes)
+    if not (extract):
+        return article
+
+    startTime = time.monotonic()
+    contentType = response.headers.get("Content-Type", "")
+    if (extractor is None):
+        article = extractArticleFromBody(response.content, contentType, url)
+    else:
+        article = extractor.extract(response.content, contentType, url)
+    if (isPoorArticle(article)):
+        article = getFallbackArticle(url, article, timeout)
+
+    return storeArticleResponse(url, response, article, startTime, cache)
+
+
+# Async version of `fetchArticle`, the Transport must be an `AsyncTransport`. The Cache I/O and the Extraction run in Threads, off the Event Loop
+async def fetchArticleAsync(url: str, transport, timeout=10, cache=None, maxBytes=ARTICLE_MAX_BYTES, extractor=None):
+    if (cache is None):
+        entry, headers = getCachedArticleEntry(url)
+    else:
+        entry, headers = await asyncio.to_thread(getCachedArticleEntry, url, cache)
+    if (entry is not None) and (entry["fresh"]):
+        setSpanAttributes(cached=True)
+        return entry["article"]
+
+    skippedReason = getSkippedUrlReason(url)
+    if (skippedReason is not None):
+        setSpanAttributes(skipped=skippedReason)
+        return None
+
+    response = await transport.get(url, timeout=timeout, headers=headers, maxRetries=0,
+                                   maxBytes=lambda responseHeaders: getArticleByteLimit(responseHeaders, maxBytes))
+    # Only a `304 Not Modified` touches the Cache
+    if (entry is None):
+        article, extract = checkArticleResponse(
+            url, response, maxBytes=maxBytes)
+    else:
+        article, extract = await asyncio.to_thread(checkArticleResponse, url, response, entry, cache, maxBytes)
+    if not (extract):
+        return article
+
+    startTime = time.monotonic()
+    contentType = response.headers.get("Content-Type", "")
+    if (extractor is None):
+        article = await asyncio.to_thread(extractArticleFromBody, response.content, contentType, url)
+    else:
+        article = await extractor.extractAsync(response.content, contentType, url)
+    if (isPoorArticle(article)):
+        article = await asyncio.to_thread(getFallbackArticle, url, article, timeout)
+
+    if (cache is None):
+        return storeArticleResponse(url, response, article, startTime)
+
+    return await asyncio.to_thread(storeArticleResponse, url, response, article, startTime, cache)
+
+
+# Get the Cached Entry of the URL and the Request Headers (Conditional if the Entry is Stale)
+def getCachedArticleEntry(url: str, cache=None):
+    entry = cache.get(url) if (cache is not None) else None
+
+    headers = dict(ARTICLE_HEADERS)
+    if (entry is not None) and (entry["etag"]):
+        headers["If-None-Match"] = entry["etag"]
+    if (entry is not None) and (entry["lastModified"]):
+        headers["If-Modified-Since"] = entry["lastModified"]
+
+    return entry, headers
+
+
+# Check the Response before its Extraction, Revalidating the Cache Entry. Returns (article, extract): `extract` is `True` if the Body must be Extracted
+def checkArticleResponse(url: str, response, entry=None, cache=None, maxBytes=ARTICLE_MAX_BYTES):
+    setSpanAttributes(status=response.status_code)
+    if (entry is not None) and (response.status_code == 304):
+        setSpanAttributes(revalidated=True)
+        cache.touch(url)
+        return entry["article"], False
+
+    if (response.status_code != 200):
+        return None, False
+
+    contentType = response.headers.get("Content-Type", "")
+    if not (isArticleContentType(contentType)):
+        setSpanAttributes(skipped="contentType", contentType=contentType)
+        return None, False
+
+    if (isOversizedArticle(response.headers, maxBytes)):
+        setSpanAttributes(skipped="contentLength",
+                          contentLength=getDeclaredLength(response.headers))
+        return None, False
+
+    return None, True
+
+
+# Store the Extracted Article of the Response in the Cache
+def storeArticleResponse(url: str, response, article, startTime: float, cache=None):
+    setSpanAttributes(bytes=len(response.content), truncated=getattr(response, "truncated", False),
+                      extractionTime=time.monotonic() - startTime)
+    if (cache is not None) and (article is not None):
+        cache.set(url, article, etag=response.headers.get("ETag"),
+                  lastModified=response.headers.get("Last-Modified"))
+
+    return article
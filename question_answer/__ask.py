@@ -1,37 +1,30 @@
-import re
-import requests
-import json
-import time
-import articleparser
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from .__client import QuestionAnswerClient, AnswerResult, AnswerEvent, FORMAL_ANSWER_PROMPT, QA_MODELS, FORMAL_ANSWER_MODEL, SERPER_API_URL, QA_CHUNK_WORDS, QA_CHUNK_OVERLAP_WORDS
+from .__models import MODEL_MAX_WAIT
+from .__scheduler import PRIORITY_BATCH
+from .__trace import span, submitTraced
+from .__utils import getSearchResultSnippet, formatSerperSearchResults, parseSerperApiAnswer, articleContainsDesc, getTrimmedText, combineArticles
 
 #### Const Variables ####
 
-# Prompt to Generate Formal Answer
-FORMAL_ANSWER_PROMPT = """Rewrite the Answer to Formal Answer according to the Question. Don't Exclude or Modify anything from Target Answer,
-Example:
-Q: Who is Iron Man?
-A: Tony Stark
-FA: Tony Stark is Iron Man.
-
-Target:
-Q: {}
-A: {}
-FA:"""
-
 # API Key of Hugging Face
 HuggingFace_APIKey = ""
 
 # Serper API Key
 Serper_APIKey = ""
 
+# Client used by the Module level Functions. Use your own `QuestionAnswerClient` to Answer concurrent Questions
+defaultClient = QuestionAnswerClient()
+
 ######## Functions to add the API Keys ########
 # Set Hugging Face API Key
 
 
 def setHuggingFaceApiKey(apiKey: str):
     global HuggingFace_APIKey
-    if (apiKey == ""):
-        raise ValueError("APIKey Cannot be Empty")
+    defaultClient.setHuggingFaceApiKey(apiKey)
 
     HuggingFace_APIKey = apiKey
 
@@ -39,162 +32,227 @@ def setHuggingFaceApiKey(apiKey: str):
 # Set Serper API Key
 def setSerperApiKey(apiKey: str):
     global Serper_APIKey
-    if (apiKey == ""):
-        raise ValueError("APIKey Cannot be Empty")
+    defaultClient.setSerperApiKey(apiKey)
 
     Serper_APIKey = apiKey
 
-######## Utility Functions ########
-# Parse Articles from Search Results
 
+# Get the Default Client
+def getDefaultClient():
+    return defaultClient
 
-def parseArticlesFromSearchResults(searchResults, parseArticles=True, timeout=10, printProgress=False):
-    articles = []
-    for i, item in enumerate(searchResults):
-        try:
-            if (parseArticles):
-                articleData = articleparser.parseArticle(
-                    item["url"], timeout=timeout)
-                if (articleData is None):
-                    article = f"{item['title']}\n{item['description']}"
-                else:
-                    article = articleData["content"]
-            else:
-                article = f"{item['title']}\n{item['description']}"
-
-            articles.append(article)
-            if (printProgress):
-                print("Article Parsed:", i + 1, flush=1)
-        except Exception as e:
-            pass
 
-    return articles
+# Set the Search Results Cache
+def setSearchCache(cache):
+    """
+    Description: Set the Cache of the Search Results. Entries should expire, as the Answers must be Up-To-Date
+    Parameters:
+        cache: `MemoryCache`, `SQLiteCache` or any Object with `get(key)` and `set(key, value)`. `None` to disable Caching
+    """
+    defaultClient.searchCache = cache
+
+
+# Get the Search Results Cache
+def getSearchCache():
+    return defaultClient.searchCache
+
+
+# Set the Extracted Articles Cache
+def setArticleCache(cache):
+    """
+    Description: Set the Cache of the Extracted Articles, so the same Page is not Downloaded and Extracted again for every Question
+    Parameters:
+        cache: `ArticleCache` (Can be shared across Processes by using the same Path). `None` to disable Caching
+    """
+    defaultClient.articleCache = cache
+
+
+# Get the Extracted Articles Cache
+def getArticleCache():
+    return defaultClient.articleCache
+
+
+# Set the Extractor of the downloaded Articles
+def setArticleExtractor(extractor):
+    """
+    Description: Set the Extractor of the downloaded Articles. With an `ArticleExtractor`, the Fetching Threads only Download the Pages and a Pool of Processes Extracts them, so the Extraction of concurrent Questions uses every Core
+    Parameters:
+        extractor: `ArticleExtractor`. `None` to Extract in the Fetching Threads
+    """
+    defaultClient.articleExtractor = extractor
+
+
+# Get the Extractor of the downloaded Articles
+def getArticleExtractor():
+    return defaultClient.articleExtractor
+
+
+# Set the Health Registry of the Article Hosts
+def setHostHealth(registry):
+    """
+    Description: Set the Health Registry of the Article Hosts. Hosts which keep Timing Out, Blocking or Extracting nothing are Skipped for a Cooldown (their Search Snippet is used) and Healthy Hosts are Fetched first
+    Parameters:
+        registry: `HostHealthRegistry` or `SQLiteHostHealthRegistry` (Can be shared across Processes by using the same Path). `None` to disable
+    """
+    defaultClient.hostHealth = registry
+
+
+# Get the Health Registry of the Article Hosts
+def getHostHealth():
+    return defaultClient.hostHealth
+
 
+# Set the Inference Results Cache
+def setInferenceCache(cache):
+    """
+    Description: Set the Cache of the QnA and Formal Answer Results, Keyed by Model and Hash of the Question and Context / Prompt
+    Parameters:
+        cache: `MemoryCache`, `SQLiteCache` or any Object with `get(key)` and `set(key, value)`. `None` to disable Caching
+    """
+    defaultClient.inferenceCache = cache
 
-# Check if article contains the Description
-def articleContainsDesc(article: str, description: str):
-    # Replace more than 2 continuous dots with ".+"
-    pattern = re.sub(r'(\\\.){3,}', r".+", re.escape(description))
-    matches = re.findall(pattern, article, re.MULTILINE)
 
-    return len(matches) > 0
+# Get the Inference Results Cache
+def getInferenceCache():
+    return defaultClient.inferenceCache
 
 
-# Trim the article
-def getTrimmedText(article: str, description: str, article_length: int):
-    pattern = re.compile(re.sub(r'(\\\.){3,}', r".+", re.escape(description)))
-    found = pattern.search(article)
-    if not (found):
-        return article[:article_length]
+# Set the Question Index
+def setQuestionIndex(index):
+    """
+    Description: Set the Index of the Questions. A new Question is Answered as its recently asked Equivalent (a Paraphrase naming the same Entities and Numbers), so they share the Cache Entries
+    Parameters:
+        index: `QuestionIndex`. `None` to disable it
+    """
+    defaultClient.questionIndex = index
+
 
-    d_index = found.span()[0]
+# Get the Question Index
+def getQuestionIndex():
+    return defaultClient.questionIndex
 
-    s_length = (article_length - d_index + len(description)) // 2
-    e_length = s_length
 
-    s_index = d_index - s_length
-    if (s_index < 0):
-        s_index = 0
+# Set the Scheduler of the Serper and Model Requests
+def setScheduler(scheduler):
+    """
+    Description: Set the Scheduler which Rate Limits the Serper and Model Requests and runs the Interactive ones before the Batch ones (Off by Default)
+    Parameters:
+        scheduler: `RequestScheduler`. `None` to disable it
+    """
+    defaultClient.scheduler = scheduler
+
+
+# Get the Scheduler
+def getScheduler():
+    return defaultClient.scheduler
+
+
+# Set the Default way to Generate the Formal Answers
+def setFormalMode(formalMode: str):
+    """
+    Description: Set the Default Formal Mode of the Module level Functions
+    Parameters:
+        formalMode: `local` (Template, no Request), `remote` (Formal Answer Model, Slower but Better) or `auto` (Model, Template if it is Loading or Slow)
+    """
+    defaultClient.formalMode = defaultClient.requireFormalMode(formalMode)
+
+
+# Get the Default Formal Mode
+def getFormalMode():
+    return defaultClient.formalMode
+
+
+# Set the Default way to Answer from the Context
+def setQaMode(qaMode: str):
+    """
+    Description: Set the Default QnA Mode of the Module level Functions
+    Parameters:
+        qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer, no Network or GPU) or `auto` (Local first, Model if it is not Confident, Local if the Model is Loading or Rate Limited)
+    """
+    defaultClient.qaMode = defaultClient.requireQaMode(qaMode)
+
+
+# Get the Default QnA Mode
+def getQaMode():
+    return defaultClient.qaMode
+
+
+# Get the Tracer, to add Hooks or Export the Metrics of the Module level Functions
+def getTracer():
+    return defaultClient.tracer
+
+
+# Map the Question to its recently asked Equivalent
+def resolveQuestion(question: str):
+    return defaultClient.resolveQuestion(question)
+
+######## Utility Functions ########
+# These are Wrappers of the Default Client's Methods, check `QuestionAnswerClient` for the Parameters
+
 
-    e_index = s_index + s_length + len(description) + e_length
+def parseArticleContent(item, timeout=10):
+    return defaultClient.parseArticleContent(item, timeout=timeout)
 
-    trimmedText = article[s_index:e_index]
-    # filtering to avoid cutout texts...
-    filteredText = " ".join(trimmedText.split(" ")[1:-2])
 
-    return filteredText
+def parseArticleFromSearchResult(item, timeout=10):
+    return defaultClient.parseArticleFromSearchResult(item, timeout=timeout)
 
 
-# Combine all the articles as One
-def combineArticles(articles: list, searchResults: list, min_article_length=3000, max_combine_length=15000, filter=True):
+def parseArticlesFromSearchResults(searchResults, parseArticles=True, timeout=10, printProgress=False, concurrent=True, maxWorkers=8, deadline=None):
+    return defaultClient.parseArticlesFromSearchResults(searchResults, parseArticles=parseArticles, timeout=timeout, printProgress=printProgress,
+                                                        concurrent=concurrent, maxWorkers=maxWorkers, deadline=deadline)
 
-    average_article_length = len(articles) // max_combine_length
-    if (average_article_length < min_article_length):
-        average_article_length = min_article_length
 
-    articleDataSet = []
-    for article, searchResult in zip(articles, searchResults):
-        if ((not articleContainsDesc(article, searchResult["description"])) and (filter)):
-            continue
+def parseArticlesHedged(searchResults, num_results, hedge=2, timeout=10, printProgress=False, maxWorkers=8, deadline=None, minArticleLength=200):
+    return defaultClient.parseArticlesHedged(searchResults, num_results, hedge=hedge, timeout=timeout, printProgress=printProgress,
+                                             maxWorkers=maxWorkers, deadline=deadline, minArticleLength=minArticleLength)
 
-        trimmed = "Title: " + searchResult["title"] + "\nDescription: " + searchResult["description"] + \
-            "\nBody: " + \
-            getTrimmedText(
-                article, searchResult["description"], average_article_length)
-        articleDataSet.append(trimmed)
 
-    articleData = "\n\n".join(articleDataSet)
-    return articleData
+def parseArticlesUntilConfident(question: str, searchResults, confidenceThreshold, timeout=10, modelIndex=0, printProgress=False, maxWorkers=8, deadline=None, qaMode=None):
+    return defaultClient.parseArticlesUntilConfident(question, searchResults, confidenceThreshold, timeout=timeout, modelIndex=modelIndex,
+                                                     printProgress=printProgress, maxWorkers=maxWorkers, deadline=deadline, qaMode=qaMode)
 
 
 ######## AI Parsing Functions ########
 
 # Get the Answer from Context
-def getAIQuestionAnswer(context, question, modelIndex=0):
-    MODELS = ["https://api-inference.huggingface.co/models/deepset/roberta-base-squad2",
-              "https://api-inference.huggingface.co/models/twmkn9/distilbert-base-uncased-squad2"]
-
-    headers = {"Authorization": "Bearer " + HuggingFace_APIKey}
-    payload = {"inputs": {
-        "question": question,
-        "context": context
-    }}
-
-    response = requests.post(MODELS[modelIndex], headers=headers, json=payload)
-
-    result = response.json()
-    if (type(result) == list):
-        result = result[0]
-
-    while ("error" in result.keys()):
-        if (all(x in result["error"].lower() for x in ["model", "loading"])):
-            time.sleep(result["estimated_time"] / 1000)
-            result = response.json()
-            if (type(result) == list):
-                result = result[0]
-        else:
-            return {"success": False, "result": result}
+def getAIQuestionAnswer(context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, qaMode=None):
+    return defaultClient.getAIQuestionAnswer(context, question, modelIndex=modelIndex, maxWait=maxWait, qaMode=qaMode)
 
-    if ("answer" not in result.keys()):
-        return {"success": False, "result": result}
 
-    return {"success": True, "result": result}
+# Get the Answer from a Context of any length
+def getAIQuestionAnswerChunked(context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, chunkWords=QA_CHUNK_WORDS, overlapWords=QA_CHUNK_OVERLAP_WORDS, maxWorkers=4, qaMode=None):
+    return defaultClient.getAIQuestionAnswerChunked(context, question, modelIndex=modelIndex, maxWait=maxWait,
+                                                    chunkWords=chunkWords, overlapWords=overlapWords, maxWorkers=maxWorkers, qaMode=qaMode)
 
 
 # Convert easy answer tot Formal Answer. This one is Optional
-def getAIFormalAnswer(question, answer):
-    prompt = FORMAL_ANSWER_PROMPT.format(question, answer)
-
-    API_URL = "https://api-inference.huggingface.co/models/google/flan-t5-xxl"
-
-    headers = {"Authorization": "Bearer " + HuggingFace_APIKey}
-    payload = {"inputs": prompt}
+def getAIFormalAnswer(question, answer, maxWait=MODEL_MAX_WAIT, formalMode=None):
+    return defaultClient.getAIFormalAnswer(question, answer, maxWait=maxWait, formalMode=formalMode)
 
-    response = requests.post(API_URL, headers=headers, json=payload)
 
-    result = response.json()
-    if (type(result) == list):
-        result = result[0]
+######## Model Warm Up Functions ########
 
-    while ("error" in result.keys()):
-        if (all(x in result["error"].lower() for x in ["model", "loading"])):
-            time.sleep(result["estimated_time"] / 1000)
-            result = response.json()
-            if (type(result) == list):
-                result = result[0]
-        else:
-            return {"success": False, "result": result}
+# Start Pinging the QnA and Formal Answer Models at Startup and then Periodically
+def startModelWarmer(interval=300, modelIndex=None):
+    """
+    Description: Keep the Models Warm in the Background, so the Questions don't pay the Model Loading time
+    Parameters:
+        interval: Seconds between two Pings (Default: 300s)
+        modelIndex: Only keep this QnA Model warm, `None` for all of them (Default: None)
+    """
+    return defaultClient.startModelWarmer(interval=interval, modelIndex=modelIndex)
 
-    if ("generated_text" not in result.keys()):
-        return {"success": False, "result": result}
 
-    return {"success": True, "result": result}
+# Stop the Background Warmer
+def stopModelWarmer():
+    defaultClient.stopModelWarmer()
 
 
 ######## Answer Via Google Search Functions ########
 
 # Function to get the Answer after AI finished Parsing
-def getAIAnswer(question: str, searchResults, preParsedArticles=None, timeout=10, parseArticles=True, preParsedAnswer=None, filter=False, modelIndex=0, printProgress=False):
+def getAIAnswer(question: str, searchResults, preParsedArticles=None, timeout=10, parseArticles=True, preParsedAnswer=None, filter=False, modelIndex=0, printProgress=False, deadline=None, confidenceThreshold=None, preParsedAnswerOutput=None, formalMode=None, qaMode=None):
     """
     Description: Takes `Question` and `Search Results` as Required Input
     Generates Answer using Article parsing and AI
@@ -207,53 +265,29 @@ def getAIAnswer(question: str, searchResults, preParsedArticles=None, timeout=10
         filter: Filter the Articles to contain the Searched Description (Default: False)
         modelIndex: Use the corresponding QnA Model (Default: 0)
         printProgress: Print the progress of the Executions (Default: False)
+        deadline: Overall time budget in seconds for parsing all the Articles (Default: None)
+        confidenceThreshold: Run the QnA Model on every Article as it arrives and stop Fetching once an Answer scores at least this (Default: None)
+        preParsedAnswerOutput: Output of the QnA Model if it is already parsed (Default: None)
+        formalMode: `local` (Template), `remote` (Formal Answer Model) or `auto`, `None` for the Default Mode (Default: None)
+        qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) or `auto`, `None` for the Default Mode (Default: None)
     """
-    getAIAnswer.searchResults = searchResults
-
-    if (preParsedArticles is None):
-        articles = parseArticlesFromSearchResults(
-            searchResults, parseArticles=parseArticles, timeout=timeout, printProgress=printProgress)
-    else:
-        articles = preParsedArticles
-
-    getAIAnswer.articles = articles
-    if (parseArticles):
-        combinedArticle = combineArticles(
-            articles, searchResults, filter=filter)
-    else:
-        combinedArticle = "\n\n".join(articles)
-
-    if (preParsedAnswer):
-        combinedArticle = preParsedAnswer + "\n\n" + combinedArticle
-
-    getAIAnswer.combinedArticle = combinedArticle
-
-    answerOutput = getAIQuestionAnswer(
-        combinedArticle, question, modelIndex=modelIndex)
-    if (not answerOutput["success"]):
-        return answerOutput
-
-    getAIAnswer.answerOutput = answerOutput
-    if (printProgress):
-        print("\nAnswer Parsed\n", flush=1)
-
-    formalAnswerOutput = getAIFormalAnswer(
-        question, answerOutput["result"]["answer"])
-    if (not formalAnswerOutput["success"]):
-        return formalAnswerOutput
-
-    getAIAnswer.formalAnswerOutput = formalAnswerOutput
-    if (printProgress):
-        print("Formal Answer Parsed\n", flush=1)
+    answer = defaultClient.getAIAnswer(question, searchResults, preParsedArticles=preParsedArticles, timeout=timeout, parseArticles=parseArticles,
+                                       preParsedAnswer=preParsedAnswer, filter=filter, modelIndex=modelIndex, printProgress=printProgress,
+                                       deadline=deadline, confidenceThreshold=confidenceThreshold, preParsedAnswerOutput=preParsedAnswerOutput, formalMode=formalMode, qaMode=qaMode)
 
-    formalAnswer = formalAnswerOutput["result"]["generated_text"]
-    getAIAnswer.formalAnswer = formalAnswer
+    # Kept for backward compatibility. Not Safe with concurrent Questions, use `QuestionAnswerClient` instead
+    getAIAnswer.searchResults = answer.searchResults
+    getAIAnswer.articles = answer.articles
+    getAIAnswer.combinedArticle = answer.combinedArticle
+    getAIAnswer.answerOutput = answer.answerOutput
+    getAIAnswer.formalAnswerOutput = answer.formalAnswerOutput
+    getAIAnswer.formalAnswer = answer.formalAnswer
 
-    return {"success": True, "result": formalAnswer}
+    return answer.output
 
 
 # Get the Answer via Parsing Search URLs using GoogleSearch_Python
-def getAnswerViaGoogleSearch(question: str, num_results=3, timeout=10, filter=False, modelIndex=0, printProgress=False):
+def getAnswerViaGoogleSearch(question: str, num_results=3, timeout=10, filter=False, modelIndex=0, printProgress=False, deadline=None, confidenceThreshold=None, formalMode=None, qaMode=None):
     """
     Description: Get Question's answer Google Search
     Parameters:
@@ -263,78 +297,33 @@ def getAnswerViaGoogleSearch(question: str, num_results=3, timeout=10, filter=Fa
         filter: Filter the Articles by the Search Result Descriptions [Not Recommended] (Default: False)
         modelIndex: Use the corresponding QnA Model (Default: 0)
         printProgress: Print the progress of the Executions (Default: False)
+        deadline: Overall time budget in seconds for parsing all the Articles (Default: None)
+        confidenceThreshold: Answer from every Article as it arrives and stop Fetching once an Answer scores at least this [Faster] (Default: None)
+        formalMode: `local` (Template), `remote` (Formal Answer Model) [Slow] or `auto`, `None` for the Default Mode (Default: None)
+        qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) [Fastest] or `auto`, `None` for the Default Mode (Default: None)
     """
-    if (HuggingFace_APIKey == ""):
-        raise ValueError(
-            "You must Assign your Hugging Face API Key First!\nUse: `setHuggingFaceApiKey(apiKey)` to Assign")
+    answer = defaultClient.getAnswerViaGoogleSearch(question, num_results=num_results, timeout=timeout, filter=filter, modelIndex=modelIndex,
+                                                    printProgress=printProgress, deadline=deadline, confidenceThreshold=confidenceThreshold, formalMode=formalMode, qaMode=qaMode)
 
-    searchResults = articleparser.getGoogleSearchResults(
-        query=question, num_results=num_results)
-    answerOutput = getAIAnswer(question, searchResults, timeout=timeout,
-                               filter=filter, modelIndex=modelIndex, printProgress=printProgress)
-
-    getAnswerViaGoogleSearch.answerOutput = answerOutput
-    return answerOutput
+    getAnswerViaGoogleSearch.answerOutput = answer.output
+    return answer.output
 
 
 ######## Answer Via using Serper API Functions (Requires API Key) ########
 
-# Parse Search Results to a Similar Format of Google Search
-def formatSerperSearchResults(serperSearchResults):
-    searchResults = []
-    for result in serperSearchResults:
-        searchResults.append({
-            "title": result["title"],
-            "url": result["link"],
-            "description": result["snippet"]
-        })
-
-    return searchResults
-
-# Parser the Automated Serper Answer
-
-
-def parseSerperApiAnswer(searchResults: dict):
-    if ("answerBox" not in searchResults.keys()):
-        return None
-
-    answerBox = searchResults["answerBox"]
-    answer = {
-        "title": answerBox["title"]
-    }
-    if ("answer" in answerBox.keys()):
-        answer["answer"] = answerBox["answer"]
-    elif ("snippet" in answerBox.keys()):
-        if ("snippetHighlighted" in answerBox.keys()):
-
-            answer["answer"] = answerBox["snippetHighlighted"][0]
-        else:
-            answer["answer"] = answerBox["snippet"]
-
-    return answer
+# Get Google Search Results, Cached by the normalized Query
+def getGoogleSearchResults(query, num_results=3):
+    return defaultClient.getGoogleSearchResults(query, num_results=num_results)
 
 
-# Get Serper API result
+# Get Serper API result, Cached by the normalized Query
 def getSerperApiResult(query):
-    url = "https://google.serper.dev/search"
-
-    payload = json.dumps({
-        "q": query
-    })
-    headers = {
-        "X-API-KEY": Serper_APIKey,
-        "Content-Type": "application/json"
-    }
-
-    response = requests.post(url, headers=headers, data=payload)
-    apiResults = response.json()
-
-    return apiResults
+    return defaultClient.getSerperApiResult(query)
 
 # Get The answer using Serper API
 
 
-def getAnswerViaSerperApi(question: str, num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, printProgress=False):
+def getAnswerViaSerperApi(question: str, num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, printProgress=False, deadline=None, hedge=0, confidenceThreshold=None, formalMode=None, qaMode=None):
     """
     Description: Get Question's answer using Serper API.
     Return:
@@ -348,56 +337,37 @@ def getAnswerViaSerperApi(question: str, num_results=3, timeout=10, forceAi=Fals
         fast: If forceAi is `True` and fast is also `False`, Will parse all the link's Article first before using Ai parse. And if `False`, then it will use the Serper descriptions. This Param Does not matter if forceAi = False (Default: True)
         modelIndex: Use the corresponding QnA Model (Default: 0)
         printProgress: Print the progress of the Executions (Default: False)
+        deadline: Overall time budget in seconds for parsing all the Articles (Default: None)
+        hedge: Fetch this many extra Candidate URLs and keep the first `num_results` good Articles (Default: 0)
+        confidenceThreshold: Answer from every Article as it arrives and stop Fetching once an Answer scores at least this [Faster] (Default: None)
+        formalMode: `local` (Template), `remote` (Formal Answer Model) [Slow] or `auto`, `None` for the Default Mode (Default: None)
+        qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) [Fastest] or `auto`, `None` for the Default Mode (Default: None)
     """
-    if (Serper_APIKey == ""):
-        raise ValueError(
-            "You must Assign your Serper API Key First!\nUse: `setSerperApiKey(apiKey)` to Assign")
-
-    if (HuggingFace_APIKey == ""):
-        raise ValueError(
-            "You must Assign your Hugging Face API Key First!\nUse: `setHuggingFaceApiKey(apiKey)` to Assign")
-
-    apiResults = getSerperApiResult(question)
-    getAnswerViaSerperApi.apiResults = apiResults
-
-    organicSearches = apiResults["organic"]
-
-    searchResults = formatSerperSearchResults(organicSearches)
-    getAnswerViaSerperApi.searchResults = searchResults
+    answer = defaultClient.getAnswerViaSerperApi(question, num_results=num_results, timeout=timeout, forceAi=forceAi, fast=fast, modelIndex=modelIndex,
+                                                 printProgress=printProgress, deadline=deadline, hedge=hedge, confidenceThreshold=confidenceThreshold, formalMode=formalMode, qaMode=qaMode)
 
-    if (printProgress):
-        print("API Results Parsed\n", flush=1)
+    # Kept for backward compatibility. Not Safe with concurrent Questions, use `QuestionAnswerClient` instead
+    getAnswerViaSerperApi.apiResults = answer.apiResults
+    getAnswerViaSerperApi.searchResults = answer.searchResults
+    getAnswerViaSerperApi.directAnswer = answer.directAnswer
+    getAnswerViaSerperApi.formalAnswerOutput = answer.formalAnswerOutput
+    getAnswerViaSerperApi.answerOutput = answer.output
+    getAnswerViaSerperApi.answerResult = answer
 
-    directAnswer = parseSerperApiAnswer(apiResults)
-    getAnswerViaSerperApi.directAnswer = directAnswer
+    return answer.output
 
-    if (printProgress):
-        print("Direct Answer Parsed\n", flush=1)
 
-    if (directAnswer is not None) and (not forceAi):
-        answerOutput = getAIFormalAnswer(question, directAnswer["answer"])
-        if (answerOutput["success"]):
-            answerOutput["result"] = answerOutput["result"]["generated_text"]
+######## Batch Functions ########
 
-        getAnswerViaSerperApi.formalAnswerOutput = answerOutput
-        if (printProgress):
-            print("Formal Answer parsed\n", flush=1)
-
-    elif (directAnswer is not None) and (forceAi):
-        answerOutput = getAIAnswer(question, searchResults[:num_results], timeout=timeout, parseArticles=(
-            not fast), preParsedAnswer=f"{directAnswer['title']} - {directAnswer['answer']}", printProgress=printProgress)
-        if (printProgress):
-            print("AI Answer Parsed with Direct Answer\n", flush=1)
-    else:
-        answerOutput = getAIAnswer(
-            question, searchResults[:num_results], timeout=timeout, modelIndex=modelIndex, printProgress=printProgress)
-        if (printProgress):
-            print("Regular (Full) Answer parsed\n", flush=1)
-
-    getAnswerViaSerperApi.answerOutput = answerOutput
-    getAnswerViaSerperApi.getAIAnswer = getAIAnswer
-
-    return answerOutput
+# Answer many Questions together, e.g. to Refresh a List of FAQ Entries
+def getAnswersInBatch(questions: list, parseType="serper", num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, printProgress=False, deadline=None, maxWorkers=8, batchSize=8, priority=PRIORITY_BATCH, formalMode=None, qaMode=None):
+    """
+    Description: Answer a List of Questions at once. Searches run concurrently, URLs shared between Questions are Fetched once and the Model Requests are Batched
+    Return: `BatchAnswerResult`, `.outputs` has the {"success": bool, "result": AnswerData / ContainingErrorData} of every Question and `.timing` the seconds of every Stage
+    Parameters: Same as `QuestionAnswerClient.getAnswersInBatch`
+    """
+    return defaultClient.getAnswersInBatch(questions, parseType=parseType, num_results=num_results, timeout=timeout, forceAi=forceAi, fast=fast, modelIndex=modelIndex,
+                                           printProgress=printProgress, deadline=deadline, maxWorkers=maxWorkers, batchSize=batchSize, priority=priority, formalMode=formalMode, qaMode=qaMode)
 
 
 # A Class to use the options separately
@@ -412,6 +382,12 @@ class GetQuestionAnswer:
         modelIndex: Use the corresponding QnA Model (Default: 0)
         printProgress: Print the progress of the Executions (Default: False)
         forceAi: Forcefully use AI even the Serper gives answer First (Default: False)
+        deadline: Overall time budget in seconds for parsing all the Articles (Default: None)
+        hedge: Fetch this many extra Candidate URLs and keep the first `num_results` good Articles (Default: 0)
+        confidenceThreshold: Answer from every Article as it arrives and stop Fetching once an Answer scores at least this [Faster] (Default: None)
+        formalMode: `local` (Template), `remote` (Formal Answer Model) [Slow] or `auto`, `None` for the Mode of the Client (Default: None)
+        qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) [Fastest] or `auto`, `None` for the Mode of the Client (Default: None)
+        client: `QuestionAnswerClient` to use (Default: Default Client)
     """
 
     question = None
@@ -424,22 +400,29 @@ class GetQuestionAnswer:
     serperResults = None
     serperDirectAnswer = None
     parsedArticles = None
+    parsedSearchResults = None
     fotceAi = None
+    deadline = None
+    hedge = None
+    confidenceThreshold = None
+    formalMode = None
+    qaMode = None
+    earlyAnswerOutput = None
+    client = None
+    answer = None
     finalAnswer = None
+    trace = None
 
     # Initialize the Object with Parse Type: "search" or "serper"
-    def __init__(self, parseType="search", num_results=5, timeout=10, parseArticle=True, modelIndex=0, forceAi=False) -> None:
+    def __init__(self, parseType="search", num_results=5, timeout=10, parseArticle=True, modelIndex=0, forceAi=False, deadline=None, hedge=0, confidenceThreshold=None, formalMode=None, qaMode=None, client=None) -> None:
         if (parseType not in ["search", "serper"]):
             raise ValueError(
                 "parseType can only be either `search` or `serper`")
 
-        if (HuggingFace_APIKey == ""):
-            raise ValueError(
-                "You must Assign your Hugging Face API Key First!\nUse: `setHuggingFaceApiKey(apiKey)` to Assign")
-
-        if (Serper_APIKey == "") and (parseType == "serper"):
-            raise ValueError(
-                "You must Assign your Serper API Key First!\nUse: `setSerperApiKey(apiKey)` to Assign")
+        self.client = defaultClient if client is None else client
+        self.client.requireHuggingFaceApiKey()
+        if (parseType == "serper"):
+            self.client.requireSerperApiKey()
 
         self.parseType = parseType
         self.num_results = num_results
@@ -447,23 +430,37 @@ class GetQuestionAnswer:
         self.parseArticle = parseArticle
         self.modelIndex = modelIndex
         self.forceAi = forceAi
+        self.deadline = deadline
+        self.hedge = hedge
+        self.confidenceThreshold = confidenceThreshold
+        self.formalMode = self.client.requireFormalMode(formalMode)
+        self.qaMode = self.client.requireQaMode(qaMode)
 
     # Search Question Based on the given Question
     def searchQuestion(self, question: str):
         """
-        Description: Search in the Web or use Serper api to get the relevant Search Results of given Question
+        Description: Search in the Web or use Serper api to get the relevant Search Results of given Question. If an Equivalent Question was asked recently, it is used instead
         Parameters:
             question: Your Question
         """
-        self.question = question
+        self.question = self.client.resolveQuestion(question)
+        question = self.question
+        self.parsedArticles = None
+        self.parsedSearchResults = None
+        self.earlyAnswerOutput = None
+        self.answer = None
+        self.trace = self.client.tracer.startTrace(
+            "answer", question=question, parseType=self.parseType)
 
         if (self.parseType == "search"):
-            self.searchResults = articleparser.getGoogleSearchResults(
-                query=question, num_results=self.num_results)
+            with self.trace.activate():
+                self.searchResults = self.client.getGoogleSearchResults(
+                    question, num_results=self.num_results + self.hedge)
             return
 
         # Else Parser Serper API
-        self.serperResults = getSerperApiResult(query=question)
+        with self.trace.activate():
+            self.serperResults = self.client.getSerperApiResult(question)
 
         searchData = self.serperResults["organic"]
         self.searchResults = formatSerperSearchResults(
@@ -483,8 +480,24 @@ class GetQuestionAnswer:
         elif (self.searchResults is None) and (question):
             self.searchQuestion(question)
 
-        self.parsedArticles = parseArticlesFromSearchResults(self.searchResults[:self.num_results], parseArticles=(
-            self.serperDirectAnswer is None), timeout=self.timeout, printProgress=False)
+        with self.activateTrace(), span("parseArticles"):
+            self.runParseArticles()
+
+    def runParseArticles(self):
+        if (self.hedge > 0) and (self.serperDirectAnswer is None):
+            self.parsedArticles, self.parsedSearchResults = self.client.parseArticlesHedged(
+                self.searchResults, self.num_results, hedge=self.hedge, timeout=self.timeout, printProgress=False, deadline=self.deadline)
+            return
+
+        self.parsedSearchResults = self.client.selectSearchResults(
+            self.searchResults, self.num_results)
+        if (self.confidenceThreshold is not None) and (self.serperDirectAnswer is None):
+            self.parsedArticles, self.earlyAnswerOutput = self.client.parseArticlesUntilConfident(self.question, self.parsedSearchResults, self.confidenceThreshold,
+                                                                                                  timeout=self.timeout, modelIndex=self.modelIndex, printProgress=False, deadline=self.deadline, qaMode=self.qaMode)
+            return
+
+        self.parsedArticles = self.client.parseArticlesFromSearchResults(self.parsedSearchResults, parseArticles=(
+            self.serperDirectAnswer is None), timeout=self.timeout, printProgress=False, deadline=self.deadline)
 
     # Get the Final Answer
     def getFinalAnswer(self, question=None):
@@ -501,28 +514,126 @@ class GetQuestionAnswer:
         elif (self.searchResults is None) and (question):
             self.parseArticles(question)
 
-        if (self.parseType == "search"):
-            self.finalAnswer = getAIAnswer(self.question, self.searchResults, preParsedArticles=self.parsedArticles,
-                                           timeout=self.timeout, filter=False, modelIndex=self.modelIndex, printProgress=False)
+        with self.activateTrace():
+            self.runFinalAnswer()
+
+        self.trace.finish()
+        self.answer.trace = self.trace
+        self.finalAnswer = self.answer.output
+        return self.finalAnswer
+
+    def runFinalAnswer(self, onAnswer=None):
+        searchResults = self.parsedSearchResults
+        if (searchResults is None):
+            searchResults = self.client.selectSearchResults(
+                self.searchResults, self.num_results)
 
-            return self.finalAnswer
+        self.answer = AnswerResult(self.question)
+        self.answer.apiResults = self.serperResults
+        self.answer.directAnswer = self.serperDirectAnswer
+
+        if (self.parseType == "search"):
+            self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout, filter=False,
+                                    modelIndex=self.modelIndex, printProgress=False, preParsedAnswerOutput=self.earlyAnswerOutput, answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
 
         # Else Parser Serper Result
-        if (self.serperDirectAnswer is not None) and (not self.forceAi):
-            answerOutput = getAIFormalAnswer(
-                self.question, self.serperDirectAnswer["answer"])
-            if (answerOutput["success"]):
-                answerOutput["result"] = answerOutput["result"]["generated_text"]
+        elif (self.serperDirectAnswer is not None) and (not self.forceAi):
+            self.client.getDirectFormalAnswer(
+                self.question, self.serperDirectAnswer, answer=self.answer, formalMode=self.formalMode)
 
         elif (self.serperDirectAnswer is not None) and (self.forceAi):
-            answerOutput = getAIAnswer(self.question, self.searchResults[:self.num_results], preParsedArticles=self.parsedArticles, timeout=self.timeout,
-                                       parseArticles=self.parseArticle, preParsedAnswer=f"{self.serperDirectAnswer['title']} - {self.serperDirectAnswer['answer']}", printProgress=False)
+            self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout,
+                                    parseArticles=self.parseArticle, preParsedAnswer=f"{self.serperDirectAnswer['title']} - {self.serperDirectAnswer['answer']}", printProgress=False, answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
         else:
-            answerOutput = getAIAnswer(self.question, self.searchResults[:self.num_results], preParsedArticles=self.parsedArticles,
-                                       timeout=self.timeout, parseArticles=self.parseArticle, modelIndex=self.modelIndex, printProgress=False)
+            self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout, parseArticles=self.parseArticle,
+                                    modelIndex=self.modelIndex, printProgress=False, preParsedAnswerOutput=self.earlyAnswerOutput, answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
 
-        self.finalAnswer = answerOutput
-        return self.finalAnswer
+    # Answer the Question Stage by Stage, Yielding every Result as soon as it is Ready
+    def stream(self, question: str):
+        """
+        Description: Streaming version of `searchQuestion` -> `parseArticles` -> `getFinalAnswer`. The Serper Direct Answer or the raw QnA Answer can be shown while the Formal Answer is still Generated
+        Return: Generator of `AnswerEvent`s: `searchResults`, `directAnswer` (Serper only), `article` (one per Article), `answer` (QnA Model Output) and always `formalAnswer` last (Same as `getFinalAnswer`)
+        Parameters:
+            question: Your Question
+        """
+        self.searchQuestion(question)
+        yield AnswerEvent("searchResults", self.searchResults)
+        if (self.serperDirectAnswer is not None):
+            yield AnswerEvent("directAnswer", self.serperDirectAnswer)
+
+        if (self.serperDirectAnswer is None) and (self.hedge == 0) and (self.confidenceThreshold is None):
+            yield from self.streamArticles()
+        elif (self.serperDirectAnswer is None) or (self.forceAi):
+            self.parseArticles()
+            for i, item in enumerate(self.parsedSearchResults):
+                yield AnswerEvent("article", {"index": i, "url": item["url"], "title": item["title"], "article": self.parsedArticles[i]})
+
+        # The Answer is Generated in a Thread, so the raw QnA Answer can be Yielded before the Formal Answer
+        events = queue.Queue()
+        errors = []
+
+        def run():
+            try:
+                with self.activateTrace():
+                    self.runFinalAnswer(onAnswer=lambda answerOutput: events.put(
+                        AnswerEvent("answer", answerOutput)))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                events.put(None)
+
+        threading.Thread(target=run, daemon=True).start()
+        while (True):
+            event = events.get()
+            if (event is None):
+                break
+            yield event
+
+        if (errors):
+            raise errors[0]
+
+        self.trace.finish()
+        self.answer.trace = self.trace
+        self.finalAnswer = self.answer.output
+        yield AnswerEvent("formalAnswer", self.finalAnswer)
+
+    # Parse the Articles in parallel, Yielding every one as soon as it is Parsed
+    def streamArticles(self):
+        self.parsedSearchResults = self.client.selectSearchResults(
+            self.searchResults, self.num_results)
+        self.parsedArticles = [getSearchResultSnippet(
+            item) for item in self.parsedSearchResults]
+        if (len(self.parsedSearchResults) == 0):
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(8, len(self.parsedSearchResults))))
+        with self.activateTrace():
+            futures = {submitTraced(executor, self.client.parseArticleFromSearchResult, item, self.timeout): i
+                       for i, item in enumerate(self.parsedSearchResults)}
+
+        try:
+            for future in as_completed(futures, timeout=self.deadline):
+                i = futures[future]
+                try:
+                    self.parsedArticles[i] = future.result()
+                except Exception as e:
+                    continue
+
+                item = self.parsedSearchResults[i]
+                yield AnswerEvent("article", {"index": i, "url": item["url"], "title": item["title"], "article": self.parsedArticles[i]})
+        except FuturesTimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # Make the Trace of the Question the current one, Starts it if the Search was not done by `searchQuestion`
+    def activateTrace(self):
+        if (self.trace is None):
+            self.trace = self.client.tracer.startTrace(
+                "answer", question=self.question, parseType=self.parseType)
+
+        return self.trace.activate()
 
 
 ######## Testing Purpose Functions ########
@@ -531,7 +642,6 @@ class GetQuestionAnswer:
 def checkApiKeys():
     import os
 
-    global HuggingFace_APIKey, Serper_APIKey
     huggingFaceApi = os.environ.get('HUGGINFACE_API')
     serperApi = os.environ.get('SERPER_API')
 
@@ -540,10 +650,10 @@ def checkApiKeys():
         exit()
 
     else:
-        HuggingFace_APIKey = huggingFaceApi
+        setHuggingFaceApiKey(huggingFaceApi)
 
     if (serperApi is not None):
-        Serper_APIKey = serperApi
+        setSerperApiKey(serperApi)
 
 
 # For Test Purpose (Functional)
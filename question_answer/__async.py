@@ -0,0 +1,823 @@
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+from .__transport import Transport, TransportResponse, RETRY_STATUS_CODES, BODY_CHUNK_SIZE, getBodyLimit
+from .__client import QuestionAnswerClient, AnswerResult, AnswerEvent, FORMAL_ANSWER_PROMPT, QA_CHUNK_WORDS, QA_CHUNK_OVERLAP_WORDS
+from .__models import queryModelAsync, getInferenceCacheKey, MODEL_MAX_WAIT
+from .__article import fetchArticleAsync
+from .__cache import normalizeQuery
+from .__health import OUTCOME_OK, OUTCOME_EMPTY, OUTCOME_ERROR
+from .__flight import AsyncSingleFlight
+from .__scheduler import PRIORITY_INTERACTIVE
+from .__trace import span, setSpanAttributes
+from .__retrieval import buildContext, splitContextChunks
+from .__utils import getSearchResultSnippet, formatSerperSearchResults, parseSerperApiAnswer, combineArticles
+
+# aiohttp is Optional. Without it the Requests run in Threads
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+# Pooled, non blocking HTTP Transport for the asyncio API
+class AsyncTransport(Transport):
+    """
+    Description: asyncio version of `Transport` (Same Initial Parameters), using one pooled aiohttp Session. Without aiohttp installed, the Requests of the `Transport` run in Threads
+    """
+
+    _clientSession = None
+
+    async def getClientSession(self):
+        if (self._clientSession is None) or (self._clientSession.closed):
+            connector = aiohttp.TCPConnector(
+                limit=0, limit_per_host=self.poolSize)
+            self._clientSession = aiohttp.ClientSession(connector=connector)
+
+        return self._clientSession
+
+    def getClientTimeout(self, timeout):
+        if (timeout is None):
+            timeout = (self.connectTimeout, self.readTimeout)
+        if not (isinstance(timeout, tuple)):
+            timeout = (min(self.connectTimeout, timeout), timeout)
+
+        return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+
+    # Send a Request, Retrying Connection Errors and Retryable Status Codes
+    async def request(self, method: str, url: str, timeout=None, retryStatusCodes=None, maxBytes=None, maxRetries=None, **kwargs):
+        if (aiohttp is None):
+            return await asyncio.to_thread(Transport.request, self, method, url, timeout=timeout, retryStatusCodes=retryStatusCodes, maxBytes=maxBytes,
+                                           maxRetries=maxRetries, **kwargs)
+
+        if (retryStatusCodes is None):
+            retryStatusCodes = RETRY_STATUS_CODES
+
+        if (maxRetries is None):
+            maxRetries = self.maxRetries
+
+        session = await self.getClientSession()
+        attempt = 0
+        while (True):
+            try:
+                async with session.request(method, url, timeout=self.getClientTimeout(timeout), **kwargs) as response:
+                    if (maxBytes is None):
+                        content, truncated = await response.read(), False
+                    else:
+                        content, truncated = await self.readCappedContent(response, maxBytes)
+                    transportResponse = TransportResponse(
+                        response.status, response.headers, content, truncated)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if (attempt >= maxRetries):
+                    raise
+                await asyncio.sleep(self.getBackoff(attempt))
+                attempt += 1
+                continue
+
+            if (transportResponse.status_code not in retryStatusCodes) or (attempt >= maxRetries):
+                return transportResponse
+
+            await asyncio.sleep(self.getBackoff(attempt, transportResponse))
+            attempt += 1
+
+    # Read at most `maxBytes` of the Body, the Connection is Released without reading the rest
+    async def readCappedContent(self, response, maxBytes):
+        limit = getBodyLimit(maxBytes, response.headers)
+        if (limit == 0):
+            return b"", response.headers.get("Content-Length", "") != "0"
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+            body += chunk
+            if (len(body) > limit):
+                return bytes(body[:limit]), True
+
+        return bytes(body), False
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    # Close the pooled Session
+    async def aclose(self):
+        if (self._clientSession is not None):
+            await self._clientSession.close()
+            self._clientSession = None
+
+        self.close()
+
+
+# Wait for the Tasks until the Deadline, the unfinished ones are Cancelled
+async def waitTasks(tasks: list, deadline=None):
+    if (len(tasks) == 0):
+        return
+
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+
+
+# asyncio Question Answering Client
+class AsyncQuestionAnswerClient:
+    """
+    Description: asyncio version of `QuestionAnswerClient`. Search, Article Fetches and Inference Calls of many Questions run concurrently on one Event Loop
+    Initial Parameters:
+        client: `QuestionAnswerClient` whose API Keys, Caches and Question Index are used (Default: A new Client)
+        transport: `AsyncTransport` to use (Default: A new AsyncTransport)
+    """
+
+    def __init__(self, client=None, transport=None) -> None:
+        self.client = QuestionAnswerClient() if client is None else client
+        self.transport = AsyncTransport() if transport is None else transport
+        self.answerFlight = AsyncSingleFlight()
+        self.searchFlight = AsyncSingleFlight()
+        self.articleFlight = AsyncSingleFlight()
+        self.inferenceFlight = AsyncSingleFlight()
+
+    # Call / Shared Counters of every Stage
+    def getFlightStats(self):
+        return {
+            "answer": self.answerFlight.stats(),
+            "search": self.searchFlight.stats(),
+            "article": self.articleFlight.stats(),
+            "inference": self.inferenceFlight.stats()
+        }
+
+    # Wait for a Slot of the Upstream in the Scheduler of the wrapped Client
+    @asynccontextmanager
+    async def upstreamSlot(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        if (self.client.scheduler is None):
+            yield
+            return
+
+        startTime = time.monotonic()
+        async with self.client.scheduler.slotAsync(upstream, priority):
+            setSpanAttributes(queueWait=time.monotonic() - startTime)
+            yield
+
+    # Run the Answer Coroutine Function in a new Trace of the wrapped Client's Tracer, kept in the Returned Result
+    async def runTraced(self, name: str, attributes: dict, function, *args):
+        with self.client.tracer.trace(name, **attributes) as trace:
+            result = await function(*args)
+
+        result.trace = trace
+        return result
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    ######## Search Functions ########
+
+    # Get Google Search Results, Cached by the normalized Query. Identical in Flight Searches are Coalesced
+    async def getGoogleSearchResults(self, query, num_results=3):
+        with span("search", provider="google", query=query) as searchSpan:
+            cacheKey = f"search:{num_results}:{normalizeQuery(query)}"
+            if (self.client.searchCache is not None):
+                searchResults = self.client.searchCache.get(cacheKey)
+                if (searchResults is not None):
+                    searchSpan.set(cached=True, results=len(searchResults))
+                    return searchResults
+
+            # The Google Search Library is Blocking, so it runs in a Thread
+            searchResults = await self.searchFlight.do(cacheKey, asyncio.to_thread, self.client.fetchGoogleSearchResults, query, num_results, cacheKey)
+            searchSpan.set(cached=False, results=len(searchResults or []))
+            return searchResults
+
+    # Get Serper API result, Cached by the normalized Query. Identical in Flight Searches are Coalesced
+    async def getSerperApiResult(self, query, priority=PRIORITY_INTERACTIVE):
+        with span("search", provider="serper", query=query) as searchSpan:
+            cacheKey = f"serper:{normalizeQuery(query)}"
+            if (self.client.searchCache is not None):
+                apiResults = self.client.searchCache.get(cacheKey)
+                if (apiResults is not None):
+                    searchSpan.set(cached=True, results=len(
+                        apiResults.get("organic", [])))
+                    return apiResults
+
+            apiResults = await self.searchFlight.do(cacheKey, self.fetchSerperApiResult, query, cacheKey, priority)
+            searchSpan.set(cached=False, results=len(
+                apiResults.get("organic", [])))
+            return apiResults
+
+    async def fetchSerperApiResult(self, query, cacheKey, priority=PRIORITY_INTERACTIVE):
+        headers = {
+            "X-API-KEY": self.client.serperApiKey,
+            "Content-Type": "application/json"
+        }
+
+        async with self.upstreamSlot("serper", priority):
+            response = await self.transport.post(self.client.serperApiUrl, headers=headers, data=json.dumps({"q": query}))
+        apiResults = response.json()
+        # Don't Cache the Errors
+        if (self.client.searchCache is not None) and ("organic" in apiResults):
+            self.client.searchCache.set(cacheKey, apiResults)
+
+        return apiResults
+
+    ######## Article Parsing Functions ########
+
+    # Parse Article Content of a single Search Result. Returns `None` if nothing could be Extracted. Concurrent Fetches of the same URL are Coalesced
+    async def parseArticleContent(self, item, timeout=10):
+        with span("article", url=item["url"]) as articleSpan:
+            # The Health Registry can be on Disk, so it is never Read on the Event Loop
+            if (self.client.hostHealth is not None) and (not await asyncio.to_thread(self.client.hostHealth.allow, item["url"])):
+                articleSpan.set(skipped="circuitOpen", extracted=False)
+                return None
+
+            try:
+                articleData = await self.articleFlight.do(item["url"], self.fetchArticleData, item["url"], timeout)
+            except Exception as e:
+                articleSpan.set(error=repr(e))
+                return None
+
+            if (articleData is None) or (not articleData["content"].strip()):
+                articleSpan.set(extracted=False)
+                return None
+
+            articleSpan.set(extracted=True, chars=len(articleData["content"]))
+            return articleData["content"]
+
+    # Fetch and Extract the Article of the URL, Recording the Health of its Host
+    async def fetchArticleData(self, url: str, timeout):
+        startTime = time.monotonic()
+        try:
+            articleData = await fetchArticleAsync(url, self.transport, timeout=timeout, cache=self.client.articleCache,
+                                                  maxBytes=self.client.articleMaxBytes, extractor=self.client.articleExtractor)
+        except Exception as e:
+            await self.recordHostHealth(url, time.monotonic() - startTime, OUTCOME_ERROR)
+            raise
+
+        extracted = (articleData is not None) and (articleData["content"].strip() != "")
+        await self.recordHostHealth(url, time.monotonic() - startTime,
+                                    OUTCOME_OK if extracted else OUTCOME_EMPTY)
+        return articleData
+
+    # Record the Fetch in the Host Health, in a Thread
+    async def recordHostHealth(self, url: str, latency: float, outcome: str):
+        if (self.client.hostHealth is not None):
+            await asyncio.to_thread(self.client.recordHostHealth, url, latency, outcome)
+
+    # Parse Article of a single Search Result
+    async def parseArticleFromSearchResult(self, item, timeout=10):
+        content = await self.parseArticleContent(item, timeout=timeout)
+        if (content is None):
+            return getSearchResultSnippet(item)
+
+        return content
+
+    # Parse Articles from Search Results concurrently. URLs missing the Deadline fall back to Title + Description
+    async def parseArticlesFromSearchResults(self, searchResults, parseArticles=True, timeout=10, deadline=None):
+        articles = [getSearchResultSnippet(item) for item in searchResults]
+        if not (parseArticles):
+            return articles
+
+        async def parse(i, item):
+            articles[i] = await self.parseArticleFromSearchResult(item, timeout=timeout)
+
+        await waitTasks([asyncio.ensure_future(parse(i, item)) for i, item in enumerate(searchResults)], deadline=deadline)
+        return articles
+
+    # Parse the first `num_results` good Articles out of `num_results + hedge` Candidates. Returns (articles, searchResults)
+    async def parseArticlesHedged(self, searchResults, num_results, hedge=2, timeout=10, deadline=None, minArticleLength=200):
+        candidates = self.client.selectSearchResults(
+            searchResults, num_results + hedge)
+        accepted = {}
+
+        async def parse(i, item):
+            return i, await self.parseArticleContent(item, timeout=timeout)
+
+        tasks = [asyncio.ensure_future(parse(i, item))
+                 for i, item in enumerate(candidates)]
+
+        try:
+            for future in asyncio.as_completed(tasks, timeout=deadline):
+                i, content = await future
+                if (content is None) or (len(content) < minArticleLength):
+                    continue
+
+                accepted[i] = content
+                if (len(accepted) >= num_results):
+                    break
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Not enough good Articles: fill up with the best ranked Snippets
+        for i in range(len(candidates)):
+            if (len(accepted) >= num_results):
+                break
+            if (i not in accepted):
+                accepted[i] = getSearchResultSnippet(candidates[i])
+
+        order = sorted(accepted.keys())
+        return [accepted[i] for i in order], [candidates[i] for i in order]
+
+    # Parse the Articles and run the QnA Model on each one as it arrives, until an Answer is Confident enough. Returns (articles, answerOutput)
+    async def parseArticlesUntilConfident(self, question: str, searchResults, confidenceThreshold, timeout=10, modelIndex=0, deadline=None, qaMode=None):
+        articles = [getSearchResultSnippet(item) for item in searchResults]
+
+        async def parseAndAnswer(i, item):
+            articles[i] = await self.parseArticleFromSearchResult(item, timeout=timeout)
+            context = buildContext(question, [articles[i]], [item])
+            return await self.getAIQuestionAnswerChunked(context, question, modelIndex=modelIndex, qaMode=qaMode)
+
+        tasks = [asyncio.ensure_future(parseAndAnswer(i, item))
+                 for i, item in enumerate(searchResults)]
+
+        confidentOutput = None
+        try:
+            for future in asyncio.as_completed(tasks, timeout=deadline):
+                try:
+                    answerOutput = await future
+                except Exception as e:
+                    continue
+
+                if (answerOutput["success"]) and (answerOutput["result"].get("score", 0) >= confidenceThreshold):
+                    confidentOutput = answerOutput
+                    break
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return articles, confidentOutput
+
+    ######## AI Parsing Functions ########
+
+    # Get the Answer from Context with the QnA Mode. Same Parameters as `QuestionAnswerClient.getAIQuestionAnswer`
+    async def getAIQuestionAnswer(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, qaMode=None):
+        qaMode = self.client.requireQaMode(qaMode)
+        if (qaMode == "remote"):
+            return await self.getRemoteQuestionAnswer(context, question, modelIndex=modelIndex, maxWait=maxWait)
+
+        return await self.getLocalFirstQuestionAnswer(context, question, qaMode, self.getRemoteQuestionAnswer, context, question, modelIndex, maxWait)
+
+    async def getRemoteQuestionAnswer(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT):
+        payload = {"inputs": {
+            "question": question,
+            "context": context
+        }}
+
+        return await self.queryModel(self.client.qaModels[modelIndex], payload, "answer", maxWait=maxWait)
+
+    # Answer Locally first, same as `QuestionAnswerClient.getLocalFirstQuestionAnswer`. The Local Answerer is fast enough to run on the Event Loop
+    async def getLocalFirstQuestionAnswer(self, context, question, qaMode, remoteFunction, *args):
+        localOutput = self.client.getLocalQuestionAnswer(context, question)
+        if (qaMode == "local"):
+            return localOutput
+
+        if (localOutput["success"]) and (localOutput["result"].get("score", 0) >= self.client.localConfidentScore):
+            return localOutput
+
+        output = await remoteFunction(*args)
+        if (not output["success"]) and (localOutput["success"]):
+            return localOutput
+
+        return output
+
+    # Get the Answer from a Context of any length: Chunks are Queried concurrently and the best scored Span is kept
+    async def getAIQuestionAnswerChunked(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, chunkWords=QA_CHUNK_WORDS, overlapWords=QA_CHUNK_OVERLAP_WORDS, qaMode=None):
+        # The Local Answerer has no Input Limit, so the Context is not Chunked
+        qaMode = self.client.requireQaMode(qaMode)
+        if (qaMode != "remote"):
+            return await self.getLocalFirstQuestionAnswer(context, question, qaMode, self.getAIQuestionAnswerChunked, context, question,
+                                                          modelIndex, maxWait, chunkWords, overlapWords, "remote")
+
+        chunks = splitContextChunks(
+            context, chunkWords=chunkWords, overlapWords=overlapWords)
+        outputs = await asyncio.gather(*[self.getRemoteQuestionAnswer(chunk, question, modelIndex=modelIndex, maxWait=maxWait)
+                                         for offset, chunk in chunks])
+
+        bestOutput = None
+        for (offset, chunk), output in zip(chunks, outputs):
+            if (not output["success"]):
+                continue
+
+            result = dict(output["result"])
+            if ("start" in result) and ("end" in result):
+                result["start"] += offset
+                result["end"] += offset
+
+            if (bestOutput is None) or (result.get("score", 0) > bestOutput["result"].get("score", 0)):
+                bestOutput = {"success": True, "result": result}
+
+        if (bestOutput is None):
+            return outputs[0]
+
+        return bestOutput
+
+    # Convert easy answer tot Formal Answer with the Formal Mode. Same Parameters as `QuestionAnswerClient.getAIFormalAnswer`
+    async def getAIFormalAnswer(self, question, answer, maxWait=MODEL_MAX_WAIT, formalMode=None):
+        formalMode = self.client.requireFormalMode(formalMode)
+        with span("formalAnswer", mode=formalMode) as formalSpan:
+            if (formalMode == "local"):
+                output = self.client.getLocalFormalAnswer(question, answer)
+            elif (formalMode == "remote"):
+                output = await self.getRemoteFormalAnswer(question, answer, maxWait=maxWait)
+            else:
+                output = await self.getAutoFormalAnswer(question, answer)
+
+            if (output["success"]):
+                formalSpan.set(formaliser=output["result"]["formaliser"])
+            return output
+
+    async def getRemoteFormalAnswer(self, question, answer, maxWait=MODEL_MAX_WAIT):
+        payload = {"inputs": FORMAL_ANSWER_PROMPT.format(question, answer)}
+
+        output = await self.queryModel(self.client.formalAnswerModel, payload, "generated_text", maxWait=maxWait)
+        if (not output["success"]):
+            return output
+
+        return {"success": True, "result": dict(output["result"], formaliser="remote")}
+
+    # Formal Answer from the Template if one fits the Question, else from the Model if it Answers within `autoFormalTimeout`. The Slow Request keeps running to fill the Cache
+    async def getAutoFormalAnswer(self, question, answer):
+        output = self.client.getLocalFormalAnswer(question, answer, fallback=False)
+        if (output is not None) and (output["success"]):
+            return output
+
+        task = asyncio.ensure_future(
+            self.getRemoteFormalAnswer(question, answer, maxWait=0))
+        # The Error of an abandoned Request is not Reported
+        task.add_done_callback(
+            lambda task: task.cancelled() or task.exception())
+        try:
+            output = await asyncio.wait_for(asyncio.shield(task), self.client.autoFormalTimeout)
+        except Exception as e:
+            output = None
+
+        if (output is None) or (not output["success"]):
+            return self.client.getLocalFormalAnswer(question, answer)
+
+        return output
+
+    # Query the Model, concurrent Queries of the same Model and Payload are Coalesced
+    async def queryModel(self, url: str, payload: dict, expectedKey: str, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE):
+        with span("inference", model=url) as inferenceSpan:
+            cacheKey = getInferenceCacheKey(url, payload)
+            # Cache Hits don't need a Slot of the Model
+            if (self.client.inferenceCache is not None):
+                result = self.client.inferenceCache.get(cacheKey)
+                if (result is not None):
+                    inferenceSpan.set(cached=True, success=True)
+                    return {"success": True, "result": result}
+
+            output = await self.inferenceFlight.do(cacheKey, self.fetchModelResult, url, payload, expectedKey, maxWait, priority)
+            inferenceSpan.set(cached=False, success=output["success"])
+            return output
+
+    async def fetchModelResult(self, url: str, payload: dict, expectedKey: str, maxWait, priority):
+        async with self.upstreamSlot(url, priority):
+            return await queryModelAsync(url, payload, self.client.huggingFaceApiKey, expectedKey, self.transport,
+                                         maxWait=maxWait, cache=self.client.inferenceCache)
+
+    ######## Answer Functions ########
+
+    # Get the Answer after AI finished Parsing. Same Parameters as `QuestionAnswerClient.getAIAnswer`
+    async def getAIAnswer(self, question: str, searchResults, preParsedArticles=None, timeout=10, parseArticles=True, preParsedAnswer=None, filter=False, modelIndex=0, deadline=None, confidenceThreshold=None, preParsedAnswerOutput=None, answer=None, onAnswer=None, formalMode=None, qaMode=None):
+        if (answer is None):
+            answer = AnswerResult(question)
+        answer.searchResults = searchResults
+
+        answerOutput = preParsedAnswerOutput
+        if (preParsedArticles is None) and (parseArticles) and (confidenceThreshold is not None) and (answerOutput is None):
+            articles, answerOutput = await self.parseArticlesUntilConfident(question, searchResults, confidenceThreshold, timeout=timeout,
+                                                                            modelIndex=modelIndex, deadline=deadline, qaMode=qaMode)
+        elif (preParsedArticles is None):
+            articles = await self.parseArticlesFromSearchResults(searchResults, parseArticles=parseArticles, timeout=timeout, deadline=deadline)
+        else:
+            articles = preParsedArticles
+
+        answer.articles = articles
+        if (answerOutput is None):
+            with span("context", charsIn=sum(len(article) for article in articles)) as contextSpan:
+                if (parseArticles):
+                    contextArticles, contextResults = self.client.getDistinctArticles(
+                        articles, searchResults)
+                    combinedArticle = combineArticles(
+                        contextArticles, contextResults, filter=filter, question=question)
+                else:
+                    combinedArticle = "\n\n".join(articles)
+
+                if (preParsedAnswer):
+                    combinedArticle = preParsedAnswer + "\n\n" + combinedArticle
+
+                contextSpan.set(charsOut=len(combinedArticle))
+
+            answer.combinedArticle = combinedArticle
+
+            answerOutput = await self.getAIQuestionAnswerChunked(combinedArticle, question, modelIndex=modelIndex, qaMode=qaMode)
+            if (not answerOutput["success"]):
+                answer.output = answerOutput
+                return answer
+
+        answer.answerOutput = answerOutput
+        if (onAnswer is not None):
+            onAnswer(answerOutput)
+
+        formalAnswerOutput = await self.getAIFormalAnswer(question, answerOutput["result"]["answer"], formalMode=formalMode)
+        if (not formalAnswerOutput["success"]):
+            answer.output = formalAnswerOutput
+            return answer
+
+        answer.formalAnswerOutput = formalAnswerOutput
+        answer.formalAnswer = formalAnswerOutput["result"]["generated_text"]
+        answer.output = {"success": True, "result": answer.formalAnswer}
+
+        return answer
+
+    # Get the Formal Answer of the Serper Direct Answer
+    async def getDirectFormalAnswer(self, question: str, directAnswer: dict, answer=None, formalMode=None):
+        if (answer is None):
+            answer = AnswerResult(question)
+
+        answerOutput = await self.getAIFormalAnswer(question, directAnswer["answer"], formalMode=formalMode)
+        answer.formalAnswerOutput = answerOutput
+        if (answerOutput["success"]):
+            answer.formalAnswer = answerOutput["result"]["generated_text"]
+            answerOutput = {"success": True, "result": answer.formalAnswer}
+
+        answer.output = answerOutput
+        return answer
+
+    # Get the Answer via Parsing Search URLs using Google Search. Same Parameters as `getAnswerViaGoogleSearch`
+    async def getAnswerViaGoogleSearch(self, question: str, num_results=3, timeout=10, filter=False, modelIndex=0, deadline=None, confidenceThreshold=None, formalMode=None, qaMode=None):
+        self.client.requireHuggingFaceApiKey()
+
+        # Identical Questions in Flight share one Answer
+        question = self.client.resolveQuestion(question)
+        formalMode = self.client.requireFormalMode(formalMode)
+        qaMode = self.client.requireQaMode(qaMode)
+        flightKey = ("search", question, num_results, timeout,
+                     filter, modelIndex, deadline, confidenceThreshold, formalMode, qaMode)
+        return await self.answerFlight.do(flightKey, self.runTraced, "answer", {"question": question, "parseType": "search"}, self.fetchAnswerViaGoogleSearch, question,
+                                          num_results, timeout, filter, modelIndex, deadline, confidenceThreshold, formalMode, qaMode)
+
+    async def fetchAnswerViaGoogleSearch(self, question: str, num_results, timeout, filter, modelIndex, deadline, confidenceThreshold, formalMode, qaMode):
+        searchResults = await self.getGoogleSearchResults(question, num_results=num_results)
+
+        return await self.getAIAnswer(question, searchResults, timeout=timeout, filter=filter, modelIndex=modelIndex,
+                                      deadline=deadline, confidenceThreshold=confidenceThreshold, formalMode=formalMode, qaMode=qaMode)
+
+    # Get The answer using Serper API. Same Parameters as `getAnswerViaSerperApi`
+    async def getAnswerViaSerperApi(self, question: str, num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, deadline=None, hedge=0, confidenceThreshold=None, formalMode=None, qaMode=None):
+        self.client.requireSerperApiKey()
+        self.client.requireHuggingFaceApiKey()
+
+        # Identical Questions in Flight share one Answer
+        question = self.client.resolveQuestion(question)
+        formalMode = self.client.requireFormalMode(formalMode)
+        qaMode = self.client.requireQaMode(qaMode)
+        flightKey = ("serper", question, num_results, timeout, forceAi,
+                     fast, modelIndex, deadline, hedge, confidenceThreshold, formalMode, qaMode)
+        return await self.answerFlight.do(flightKey, self.runTraced, "answer", {"question": question, "parseType": "serper"}, self.fetchAnswerViaSerperApi, question,
+                                          num_results, timeout, forceAi, fast, modelIndex, deadline, hedge, confidenceThreshold, formalMode, qaMode)
+
+    async def fetchAnswerViaSerperApi(self, question: str, num_results, timeout, forceAi, fast, modelIndex, deadline, hedge, confidenceThreshold, formalMode, qaMode):
+        answer = AnswerResult(question)
+
+        answer.apiResults = await self.getSerperApiResult(question)
+        searchResults = formatSerperSearchResults(answer.apiResults["organic"])
+        answer.searchResults = searchResults
+        answer.directAnswer = parseSerperApiAnswer(answer.apiResults)
+        directAnswer = answer.directAnswer
+
+        if (directAnswer is not None) and (not forceAi):
+            return await self.getDirectFormalAnswer(question, directAnswer, answer=answer, formalMode=formalMode)
+
+        parsedArticles, parsedSearchResults = None, self.client.selectSearchResults(
+            searchResults, num_results)
+        if (hedge > 0) and ((directAnswer is None) or (not fast)):
+            parsedArticles, parsedSearchResults = await self.parseArticlesHedged(searchResults, num_results, hedge=hedge,
+                                                                                 timeout=timeout, deadline=deadline)
+
+        if (directAnswer is not None):
+            return await self.getAIAnswer(question, parsedSearchResults, preParsedArticles=parsedArticles, timeout=timeout, parseArticles=(not fast),
+                                          preParsedAnswer=f"{directAnswer['title']} - {directAnswer['answer']}", deadline=deadline, answer=answer, formalMode=formalMode, qaMode=qaMode)
+
+        return await self.getAIAnswer(question, parsedSearchResults, preParsedArticles=parsedArticles, timeout=timeout, modelIndex=modelIndex,
+                                      deadline=deadline, confidenceThreshold=confidenceThreshold, answer=answer, formalMode=formalMode, qaMode=qaMode)
+
+    # Close the Transport
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+# asyncio version of `GetQuestionAnswer`
+class AsyncGetQuestionAnswer:
+    """
+    Description: asyncio version of `GetQuestionAnswer`, with the same Initial Parameters. `client` must be an `AsyncQuestionAnswerClient`
+    """
+
+    question = None
+
+    parseType = None
+    num_results = None
+    timeout = None
+    parseArticle = None
+    searchResults = None
+    serperResults = None
+    serperDirectAnswer = None
+    parsedArticles = None
+    parsedSearchResults = None
+    forceAi = None
+    deadline = None
+    hedge = None
+    confidenceThreshold = None
+    formalMode = None
+    qaMode = None
+    earlyAnswerOutput = None
+    client = None
+    answer = None
+    finalAnswer = None
+    trace = None
+
+    def __init__(self, parseType="search", num_results=5, timeout=10, parseArticle=True, modelIndex=0, forceAi=False, deadline=None, hedge=0, confidenceThreshold=None, formalMode=None, qaMode=None, client=None) -> None:
+        if (parseType not in ["search", "serper"]):
+            raise ValueError(
+                "parseType can only be either `search` or `serper`")
+
+        self.client = AsyncQuestionAnswerClient() if client is None else client
+        self.client.client.requireHuggingFaceApiKey()
+        if (parseType == "serper"):
+            self.client.client.requireSerperApiKey()
+
+        self.parseType = parseType
+        self.num_results = num_results
+        self.timeout = timeout
+        self.parseArticle = parseArticle
+        self.modelIndex = modelIndex
+        self.forceAi = forceAi
+        self.deadline = deadline
+        self.hedge = hedge
+        self.confidenceThreshold = confidenceThreshold
+        self.formalMode = self.client.client.requireFormalMode(formalMode)
+        self.qaMode = self.client.client.requireQaMode(qaMode)
+
+    # Search Question Based on the given Question
+    async def searchQuestion(self, question: str):
+        self.question = self.client.client.resolveQuestion(question)
+        self.parsedArticles = None
+        self.parsedSearchResults = None
+        self.earlyAnswerOutput = None
+        self.answer = None
+        self.trace = self.client.client.tracer.startTrace(
+            "answer", question=self.question, parseType=self.parseType)
+
+        if (self.parseType == "search"):
+            with self.trace.activate():
+                self.searchResults = await self.client.getGoogleSearchResults(self.question, num_results=self.num_results + self.hedge)
+            return
+
+        with self.trace.activate():
+            self.serperResults = await self.client.getSerperApiResult(self.question)
+        self.searchResults = formatSerperSearchResults(
+            self.serperResults["organic"])
+        self.serperDirectAnswer = parseSerperApiAnswer(self.serperResults)
+
+    # Parse Articles from Search Results
+    async def parseArticles(self, question=None):
+        if (self.searchResults is None) and (question is None):
+            raise ChildProcessError("You must `searchResult` First!")
+        elif (self.searchResults is None) and (question):
+            await self.searchQuestion(question)
+
+        with self.activateTrace(), span("parseArticles"):
+            await self.runParseArticles()
+
+    async def runParseArticles(self):
+        if (self.hedge > 0) and (self.serperDirectAnswer is None):
+            self.parsedArticles, self.parsedSearchResults = await self.client.parseArticlesHedged(
+                self.searchResults, self.num_results, hedge=self.hedge, timeout=self.timeout, deadline=self.deadline)
+            return
+
+        self.parsedSearchResults = self.client.client.selectSearchResults(
+            self.searchResults, self.num_results)
+        if (self.confidenceThreshold is not None) and (self.serperDirectAnswer is None):
+            self.parsedArticles, self.earlyAnswerOutput = await self.client.parseArticlesUntilConfident(
+                self.question, self.parsedSearchResults, self.confidenceThreshold, timeout=self.timeout, modelIndex=self.modelIndex, deadline=self.deadline, qaMode=self.qaMode)
+            return
+
+        self.parsedArticles = await self.client.parseArticlesFromSearchResults(self.parsedSearchResults, parseArticles=(
+            self.serperDirectAnswer is None), timeout=self.timeout, deadline=self.deadline)
+
+    # Get the Final Answer
+    async def getFinalAnswer(self, question=None):
+        if (self.searchResults is None) and (question is None):
+            raise ChildProcessError("You must `searchResult` First!")
+        elif (self.searchResults is None) and (question):
+            await self.parseArticles(question)
+
+        with self.activateTrace():
+            await self.runFinalAnswer()
+
+        self.trace.finish()
+        self.answer.trace = self.trace
+        self.finalAnswer = self.answer.output
+        return self.finalAnswer
+
+    async def runFinalAnswer(self, onAnswer=None):
+        searchResults = self.parsedSearchResults
+        if (searchResults is None):
+            searchResults = self.client.client.selectSearchResults(
+                self.searchResults, self.num_results)
+
+        self.answer = AnswerResult(self.question)
+        self.answer.apiResults = self.serperResults
+        self.answer.directAnswer = self.serperDirectAnswer
+
+        if (self.parseType == "search"):
+            await self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout, filter=False,
+                                          modelIndex=self.modelIndex, preParsedAnswerOutput=self.earlyAnswerOutput, answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
+
+        elif (self.serperDirectAnswer is not None) and (not self.forceAi):
+            await self.client.getDirectFormalAnswer(self.question, self.serperDirectAnswer, answer=self.answer, formalMode=self.formalMode)
+
+        elif (self.serperDirectAnswer is not None) and (self.forceAi):
+            await self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout, parseArticles=self.parseArticle,
+                                          preParsedAnswer=f"{self.serperDirectAnswer['title']} - {self.serperDirectAnswer['answer']}", answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
+        else:
+            await self.client.getAIAnswer(self.question, searchResults, preParsedArticles=self.parsedArticles, timeout=self.timeout, parseArticles=self.parseArticle,
+                                          modelIndex=self.modelIndex, preParsedAnswerOutput=self.earlyAnswerOutput, answer=self.answer, onAnswer=onAnswer, formalMode=self.formalMode, qaMode=self.qaMode)
+
+    # Answer the Question Stage by Stage, Yielding every Result as soon as it is Ready. Async Iterator version of `GetQuestionAnswer.stream`
+    async def stream(self, question: str):
+        await self.searchQuestion(question)
+        yield AnswerEvent("searchResults", self.searchResults)
+        if (self.serperDirectAnswer is not None):
+            yield AnswerEvent("directAnswer", self.serperDirectAnswer)
+
+        if (self.serperDirectAnswer is None) and (self.hedge == 0) and (self.confidenceThreshold is None):
+            async for event in self.streamArticles():
+                yield event
+        elif (self.serperDirectAnswer is None) or (self.forceAi):
+            await self.parseArticles()
+            for i, item in enumerate(self.parsedSearchResults):
+                yield AnswerEvent("article", {"index": i, "url": item["url"], "title": item["title"], "article": self.parsedArticles[i]})
+
+        # The Answer is Generated in a Task, so the raw QnA Answer can be Yielded before the Formal Answer
+        events = asyncio.Queue()
+        with self.activateTrace():
+            task = asyncio.ensure_future(self.runFinalAnswer(
+                onAnswer=lambda answerOutput: events.put_nowait(AnswerEvent("answer", answerOutput))))
+        task.add_done_callback(lambda done: events.put_nowait(None))
+
+        try:
+            while (True):
+                event = await events.get()
+                if (event is None):
+                    break
+                yield event
+        finally:
+            task.cancel()
+
+        # Raises the Error of the Task, if any
+        task.result()
+
+        self.trace.finish()
+        self.answer.trace = self.trace
+        self.finalAnswer = self.answer.output
+        yield AnswerEvent("formalAnswer", self.finalAnswer)
+
+    # Parse the Articles concurrently, Yielding every one as soon as it is Parsed
+    async def streamArticles(self):
+        self.parsedSearchResults = self.client.client.selectSearchResults(
+            self.searchResults, self.num_results)
+        self.parsedArticles = [getSearchResultSnippet(
+            item) for item in self.parsedSearchResults]
+
+        async def parse(i, item):
+            return i, await self.client.parseArticleFromSearchResult(item, timeout=self.timeout)
+
+        with self.activateTrace():
+            tasks = [asyncio.ensure_future(parse(i, item))
+                     for i, item in enumerate(self.parsedSearchResults)]
+
+        try:
+            for future in asyncio.as_completed(tasks, timeout=self.deadline):
+                i, self.parsedArticles[i] = await future
+                item = self.parsedSearchResults[i]
+                yield AnswerEvent("article", {"index": i, "url": item["url"], "title": item["title"], "article": self.parsedArticles[i]})
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # Make the Trace of the Question the current one, Starts it if the Search was not done by `searchQuestion`
+    def activateTrace(self):
+        if (self.trace is None):
+            self.trace = self.client.client.tracer.startTrace(
+                "answer", question=self.question, parseType=self.parseType)
+
+        return self.trace.activate()
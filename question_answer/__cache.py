@@ -0,0 +1,264 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+# Normalize the Query, so the same Question typed differently shares the Cache Key
+def normalizeQuery(query: str):
+    query = re.sub(r"\s+", " ", query.strip().lower())
+    return query.rstrip("?!. ")
+
+
+# In Memory LRU Cache with TTL
+class MemoryCache:
+    """
+    Description: Thread safe In Memory LRU Cache. Entries expire after `ttl` seconds
+    Initial Parameters:
+        maxSize: Max number of Entries (Default: 256)
+        ttl: Seconds an Entry is valid for, `None` for never (Default: 300s)
+    """
+
+    def __init__(self, maxSize=256, ttl=300) -> None:
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Get the Value of the Key. Returns `None` if Missing or Expired
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None) and (entry[1] is not None) and (entry[1] <= time.time()):
+                del self._entries[key]
+                entry = None
+
+            if (entry is None):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    # Set the Value of the Key
+    def set(self, key: str, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while (len(self._entries) > self.maxSize):
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # Hit / Miss Counters of the Cache
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# On Disk Cache with TTL, backed by SQLite. Can be shared across Processes
+class SQLiteCache:
+    """
+    Description: On Disk LRU Cache stored in a SQLite Database. Values must be JSON Serializable
+    Initial Parameters:
+        path: Path of the Database File
+        maxSize: Max number of Entries (Default: 10000)
+        ttl: Seconds an Entry is valid for, `None` for never (Default: 300s)
+    """
+
+    def __init__(self, path: str, maxSize=10000, ttl=300) -> None:
+        self.path = path
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        with self.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires REAL, accessed REAL)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+
+    # Open a Connection, Commits and Closes it after use
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # Get the Value of the Key. Returns `None` if Missing or Expired
+    def get(self, key: str):
+        now = time.time()
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+            if (row is not None) and (row[1] is not None) and (row[1] <= now):
+                connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                row = None
+
+            if (row is not None):
+                connection.execute(
+                    "UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            if (row is None):
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    # Set the Value of the Key
+    def set(self, key: str, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+
+        with self.connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                               (key, json.dumps(value), expires, now))
+            connection.execute("DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                               (self.maxSize,))
+
+    def delete(self, key: str):
+        with self.connect() as connection:
+            connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self.connect() as connection:
+            connection.execute("DELETE FROM cache")
+
+    # Hit / Miss Counters of the Cache
+    def stats(self):
+        with self.connect() as connection:
+            size = connection.execute(
+                "SELECT COUNT(*) FROM cache").fetchone()[0]
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": size}
+
+
+# On Disk Cache of the Extracted Articles by URL, backed by SQLite. Can be shared across Processes
+class ArticleCache:
+    """
+    Description: Stores the Extracted Article of a URL with its ETag / Last-Modified. Entries older than `freshness` are Revalidated with Conditional Requests. Least recently used Entries are Evicted when the stored size exceeds `maxBytes`
+    Initial Parameters:
+        path: Path of the Database File
+        freshness: Seconds an Entry is used without Revalidation (Default: 3600s)
+        maxBytes: Max total size of the stored Articles (Default: 256MB)
+    """
+
+    def __init__(self, path: str, freshness=3600, maxBytes=256 * 1024 * 1024) -> None:
+        self.path = path
+        self.freshness = freshness
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        with self.connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, article TEXT, etag TEXT, last_modified TEXT, fetched REAL, accessed REAL, size INTEGER)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS articles_accessed ON articles (accessed)")
+
+    # Open a Connection, Commits and Closes it after use
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # Get the Entry of the URL: {"article", "etag", "lastModified", "fetched", "fresh"}. Returns `None` if Missing
+    def get(self, url: str):
+        now = time.time()
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT article, etag, last_modified, fetched FROM articles WHERE url = ?", (url,)).fetchone()
+            if (row is not None):
+                connection.execute(
+                    "UPDATE articles SET accessed = ? WHERE url = ?", (now, url))
+
+        if (row is None):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        fresh = (now - row[3]) < self.freshness
+        if (fresh):
+            with self._lock:
+                self.hits += 1
+
+        return {"article": json.loads(row[0]), "etag": row[1], "lastModified": row[2], "fetched": row[3], "fresh": fresh}
+
+    # Store the Article of the URL
+    def set(self, url: str, article: dict, etag=None, lastModified=None):
+        now = time.time()
+        value = json.dumps(article)
+        with self.connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO articles (url, article, etag, last_modified, fetched, accessed, size) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (url, value, etag, lastModified, now, now, len(value)))
+            self.evict(connection)
+
+    # Mark the Entry as Revalidated (Server answered `304 Not Modified`)
+    def touch(self, url: str):
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE articles SET fetched = ?, accessed = ? WHERE url = ?", (now, now, url))
+
+        with self._lock:
+            self.revalidations += 1
+
+    # Evict the least recently used Entries until the stored size fits `maxBytes`
+    def evict(self, connection):
+        totalSize = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if (totalSize <= self.maxBytes):
+            return
+
+        for url, size in connection.execute("SELECT url, size FROM articles ORDER BY accessed ASC").fetchall():
+            if (totalSize <= self.maxBytes):
+                break
+            connection.execute("DELETE FROM articles WHERE url = ?", (url,))
+            totalSize -= size
+
+    def delete(self, url: str):
+        with self.connect() as connection:
+            connection.execute("DELETE FROM articles WHERE url = ?", (url,))
+
+    def clear(self):
+        with self.connect() as connection:
+            connection.execute("DELETE FROM articles")
+
+    # Hit / Revalidation / Miss Counters of the Cache
+    def stats(self):
+        with self.connect() as connection:
+            size, totalBytes = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles").fetchone()
+
+        with self._lock:
+            return {"hits": self.hits, "revalidations": self.revalidations, "misses": self.misses, "size": size, "bytes": totalBytes}
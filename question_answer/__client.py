@@ -0,0 +1,1271 @@
+import json
+import time
+import articleparser
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from .__transport import getTransport
+from .__article import fetchArticle, getSkippedUrlReason, ARTICLE_MAX_BYTES
+from .__models import queryModel, queryModelBatch, getInferenceCacheKey, ModelWarmer, MODEL_MAX_WAIT
+from .__cache import MemoryCache, normalizeQuery
+from .__health import HostHealthRegistry, OUTCOME_OK, OUTCOME_EMPTY, OUTCOME_ERROR
+from .__flight import SingleFlight
+from .__question import QuestionIndex
+from .__scheduler import PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from .__trace import Tracer, span, setSpanAttributes, submitTraced
+from .__formal import getTemplateSentence, getAnswerSentence, FORMAL_MODES, DEFAULT_FORMAL_MODE, AUTO_FORMAL_TIMEOUT
+from .__extractive import getLexicalAnswer, QA_MODES, DEFAULT_QA_MODE, LOCAL_CONFIDENT_SCORE
+from .__retrieval import buildContext, splitContextChunks
+from .__dedup import deduplicateArticles
+from .__utils import getSearchResultSnippet, formatSerperSearchResults, parseSerperApiAnswer, combineArticles
+
+#### Const Variables ####
+
+# Prompt to Generate Formal Answer
+FORMAL_ANSWER_PROMPT = """Rewrite the Answer to Formal Answer according to the Question. Don't Exclude or Modify anything from Target Answer,
+Example:
+Q: Who is Iron Man?
+A: Tony Stark
+FA: Tony Stark is Iron Man.
+
+Target:
+Q: {}
+A: {}
+FA:"""
+
+# QnA Models, selected by `modelIndex`
+QA_MODELS = ["https://api-inference.huggingface.co/models/deepset/roberta-base-squad2",
+             "https://api-inference.huggingface.co/models/twmkn9/distilbert-base-uncased-squad2"]
+
+# Model to Generate Formal Answer
+FORMAL_ANSWER_MODEL = "https://api-inference.huggingface.co/models/google/flan-t5-xxl"
+
+# Serper Search API
+SERPER_API_URL = "https://google.serper.dev/search"
+
+# Words per Context Chunk sent to the QnA Model (Fits the 512 Tokens of the Model with the Question) and Overlap between Chunks
+QA_CHUNK_WORDS = 300
+QA_CHUNK_OVERLAP_WORDS = 50
+
+# Payloads used to keep the Models warm. Cache is disabled so the Model is Actually hit
+QA_WARMUP_PAYLOAD = {"inputs": {"question": "What is this?", "context": "This is a warm up request."},
+                     "options": {"use_cache": False}}
+FORMAL_WARMUP_PAYLOAD = {"inputs": "Warm up", "options": {"use_cache": False}}
+
+# Marks the Client Options which should use their Default Value
+DEFAULT = object()
+
+
+# Data of a single Question Answering Request
+class AnswerResult:
+    """
+    Description: Holds everything Parsed while Answering one Question, so concurrent Questions never overwrite each other
+    Attributes:
+        question: The Question Answered (Equivalent recently asked Question if Found)
+        apiResults: Serper API Response (Serper only)
+        directAnswer: Answer given by the Serper API (Serper only)
+        searchResults: Search Results used
+        articles: Parsed Articles
+        combinedArticle: Context given to the QnA Model
+        answerOutput: Output of the QnA Model
+        formalAnswerOutput: Output of the Formal Answer Model
+        formalAnswer: The Formal Answer
+        output: Final Output: {"success": bool, "result": AnswerData / ContainingErrorData}
+        trace: `Trace` with the timed Stages of the Question
+    """
+
+    question = None
+    apiResults = None
+    directAnswer = None
+    searchResults = None
+    articles = None
+    combinedArticle = None
+    answerOutput = None
+    formalAnswerOutput = None
+    formalAnswer = None
+    output = None
+    trace = None
+
+    def __init__(self, question=None) -> None:
+        self.question = question
+
+    @property
+    def success(self):
+        return (self.output is not None) and (self.output["success"])
+
+    @property
+    def result(self):
+        return None if self.output is None else self.output["result"]
+
+
+# Data of a Batch of Questions
+class BatchAnswerResult:
+    """
+    Description: Answers of a Batch of Questions with the aggregate Timing
+    Attributes:
+        answers: `AnswerResult` of every Question, in Question order
+        timing: Seconds spent in every Stage: {"search", "articles", "answers", "formalAnswers", "total"}
+        stats: Counters of the Batch: {"questions", "urls", "uniqueUrls", "qaInputs", "formalInputs"}
+        trace: `Trace` with the timed Stages of the Batch
+    """
+
+    answers = None
+    timing = None
+    stats = None
+    trace = None
+
+    def __init__(self) -> None:
+        self.answers = []
+        self.timing = {}
+        self.stats = {}
+
+    # Final Output of every Question
+    @property
+    def outputs(self):
+        return [answer.output for answer in self.answers]
+
+
+# Event of the progressive Answer Stream
+class AnswerEvent:
+    """
+    Description: Yielded by `GetQuestionAnswer.stream` as soon as a Stage has a Result
+    Attributes:
+        type: One of `searchResults`, `directAnswer`, `article`, `answer`, `formalAnswer`
+        data: Search Results / Serper Direct Answer / {"index", "url", "title", "article"} / QnA Model Output / Final Output
+    """
+
+    def __init__(self, type: str, data) -> None:
+        self.type = type
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"AnswerEvent({self.type!r})"
+
+
+# Self contained Question Answering Client
+class QuestionAnswerClient:
+    """
+    Description: Owns the API Keys, Transport, Caches and Model Warmer. Thread safe, so one Client can Answer many concurrent Questions
+    Initial Parameters:
+        huggingFaceApiKey: Hugging Face API Key (Default: "")
+        serperApiKey: Serper API Key (Default: "")
+        transport: `Transport` to use, `None` for the Default Transport (Default: None)
+        searchCache: Cache of the Search Results, `None` to disable (Default: In Memory, 5 minutes TTL)
+        articleCache: `ArticleCache` of the Extracted Articles, `None` to disable (Default: None)
+        articleExtractor: `ArticleExtractor` whose Processes Extract the downloaded Articles, `None` to Extract them in the Fetching Threads (Default: None)
+        hostHealth: `HostHealthRegistry` of the Article Hosts, Tripped Hosts are Skipped and Healthy ones Preferred. `None` to disable (Default: In Memory)
+        inferenceCache: Cache of the Inference Results, `None` to disable (Default: In Memory, 1 hour TTL)
+        questionIndex: `QuestionIndex` of the recently asked Questions, so the Equivalent Questions (Paraphrases) share the Cache Entries. `None` to disable (Default: In Memory, 5 minutes TTL)
+        scheduler: `RequestScheduler` of the Serper and Model Requests (Rate Limits, Concurrency Caps and Priorities), `None` to disable (Default: None)
+        tracer: `Tracer` of the Requests, add Hooks or a `MetricsRegistry` to it to observe the Stages (Default: A new Tracer)
+        formalMode: Default way to Generate the Formal Answers: `local` (Template), `remote` (Formal Answer Model) or `auto` (Model, Template if it is Loading or Slow) (Default: local)
+        formaliser: Function `(question, answer) -> Formal Answer` of the `local` Mode, Returning `None` if it has no Template of the Question (then the Answer is made a Sentence, or the `auto` Mode asks the Model) (Default: getTemplateSentence)
+        qaMode: Default way to Answer from the Context: `remote` (Hosted QnA Model), `local` (Lexical Answerer, no Request) or `auto` (Local first, Model if the Local Answer is Empty or not Confident, waiting for it to Load like `remote`) (Default: remote)
+        localAnswerer: Function `(question, context) -> {"answer", "score", "start", "end"}` of the `local` QnA Mode (Default: getLexicalAnswer)
+    """
+
+    def __init__(self, huggingFaceApiKey="", serperApiKey="", transport=None, searchCache=DEFAULT, articleCache=None, articleExtractor=None, hostHealth=DEFAULT, inferenceCache=DEFAULT, questionIndex=DEFAULT, scheduler=None, tracer=None, formalMode=DEFAULT_FORMAL_MODE, formaliser=None, qaMode=DEFAULT_QA_MODE, localAnswerer=None) -> None:
+        self.huggingFaceApiKey = huggingFaceApiKey
+        self.serperApiKey = serperApiKey
+        self.transport = transport
+
+        self.searchCache = MemoryCache(
+            maxSize=256, ttl=300) if searchCache is DEFAULT else searchCache
+        self.articleCache = articleCache
+        self.articleMaxBytes = ARTICLE_MAX_BYTES
+        self.articleExtractor = articleExtractor
+        self.articleDeduplication = True
+        self.hostHealth = HostHealthRegistry() if hostHealth is DEFAULT else hostHealth
+        self.inferenceCache = MemoryCache(
+            maxSize=512, ttl=3600) if inferenceCache is DEFAULT else inferenceCache
+        self.questionIndex = QuestionIndex() if questionIndex is DEFAULT else questionIndex
+        self.scheduler = scheduler
+        self.tracer = Tracer() if tracer is None else tracer
+        self.formalMode = self.requireFormalMode(formalMode)
+        self.formaliser = getTemplateSentence if formaliser is None else formaliser
+        self.autoFormalTimeout = AUTO_FORMAL_TIMEOUT
+        self.qaMode = self.requireQaMode(qaMode)
+        self.localAnswerer = getLexicalAnswer if localAnswerer is None else localAnswerer
+        self.localConfidentScore = LOCAL_CONFIDENT_SCORE
+
+        self.qaModels = list(QA_MODELS)
+        self.formalAnswerModel = FORMAL_ANSWER_MODEL
+        self.serperApiUrl = SERPER_API_URL
+
+        # Identical in Flight Work is Coalesced: whole Questions, Searches, Article Fetches per URL and Inferences per Cache Key
+        self.answerFlight = SingleFlight()
+        self.searchFlight = SingleFlight()
+        self.articleFlight = SingleFlight()
+        self.inferenceFlight = SingleFlight()
+        self.modelWarmer = None
+
+    ######## API Keys ########
+
+    def setHuggingFaceApiKey(self, apiKey: str):
+        if (apiKey == ""):
+            raise ValueError("APIKey Cannot be Empty")
+
+        self.huggingFaceApiKey = apiKey
+
+    def setSerperApiKey(self, apiKey: str):
+        if (apiKey == ""):
+            raise ValueError("APIKey Cannot be Empty")
+
+        self.serperApiKey = apiKey
+
+    def requireHuggingFaceApiKey(self):
+        if (self.huggingFaceApiKey == ""):
+            raise ValueError(
+                "You must Assign your Hugging Face API Key First!\nUse: `setHuggingFaceApiKey(apiKey)` to Assign")
+
+    def requireSerperApiKey(self):
+        if (self.serperApiKey == ""):
+            raise ValueError(
+                "You must Assign your Serper API Key First!\nUse: `setSerperApiKey(apiKey)` to Assign")
+
+    # Check the Formal Mode, `None` is the Default Mode of the Client
+    def requireFormalMode(self, formalMode):
+        if (formalMode is None):
+            return self.formalMode
+
+        if (formalMode not in FORMAL_MODES):
+            raise ValueError(
+                "formalMode can only be either `local`, `remote` or `auto`")
+
+        return formalMode
+
+    # Check the QnA Mode, `None` is the Default Mode of the Client
+    def requireQaMode(self, qaMode):
+        if (qaMode is None):
+            return self.qaMode
+
+        if (qaMode not in QA_MODES):
+            raise ValueError(
+                "qaMode can only be either `remote`, `local` or `auto`")
+
+        return qaMode
+
+    # Transport of the Client, the Default Transport if not Given
+    def getTransport(self):
+        return self.transport or getTransport()
+
+    # Map the Question to its recently asked Equivalent
+    def resolveQuestion(self, question: str):
+        if (self.questionIndex is None):
+            return question
+
+        return self.questionIndex.resolve(question)
+
+    # Wait for a Slot of the Upstream ("serper" or the Model URL) in the Scheduler
+    @contextmanager
+    def upstreamSlot(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        if (self.scheduler is None):
+            yield
+            return
+
+        startTime = time.monotonic()
+        with self.scheduler.slot(upstream, priority):
+            setSpanAttributes(queueWait=time.monotonic() - startTime)
+            yield
+
+    # Run the Answer Function in a new Trace, kept in the Returned Result
+    def runTraced(self, name: str, attributes: dict, function, *args):
+        with self.tracer.trace(name, **attributes) as trace:
+            result = function(*args)
+
+        result.trace = trace
+        return result
+
+    # Call / Shared Counters of every Stage
+    def getFlightStats(self):
+        return {
+            "answer": self.answerFlight.stats(),
+            "search": self.searchFlight.stats(),
+            "article": self.articleFlight.stats(),
+            "inference": self.inferenceFlight.stats()
+        }
+
+    ######## Search Functions ########
+
+    # Get Google Search Results, Cached by the normalized Query. Identical in Flight Searches are Coalesced
+    def getGoogleSearchResults(self, query, num_results=3):
+        with span("search", provider="google", query=query) as searchSpan:
+            cacheKey = f"search:{num_results}:{normalizeQuery(query)}"
+            if (self.searchCache is not None):
+                searchResults = self.searchCache.get(cacheKey)
+                if (searchResults is not None):
+                    searchSpan.set(cached=True, results=len(searchResults))
+                    return searchResults
+
+            searchResults = self.searchFlight.do(
+                cacheKey, self.fetchGoogleSearchResults, query, num_results, cacheKey)
+            searchSpan.set(cached=False, results=len(searchResults or []))
+            return searchResults
+
+    def fetchGoogleSearchResults(self, query, num_results, cacheKey):
+        searchResults = articleparser.getGoogleSearchResults(
+            query=query, num_results=num_results)
+        if (self.searchCache is not None) and (searchResults):
+            self.searchCache.set(cacheKey, searchResults)
+
+        return searchResults
+
+    # Get Serper API result, Cached by the normalized Query. Identical in Flight Searches are Coalesced
+    def getSerperApiResult(self, query, priority=PRIORITY_INTERACTIVE):
+        with span("search", provider="serper", query=query) as searchSpan:
+            cacheKey = f"serper:{normalizeQuery(query)}"
+            if (self.searchCache is not None):
+                apiResults = self.searchCache.get(cacheKey)
+                if (apiResults is not None):
+                    searchSpan.set(cached=True, results=len(
+                        apiResults.get("organic", [])))
+                    return apiResults
+
+            apiResults = self.searchFlight.do(
+                cacheKey, self.fetchSerperApiResult, query, cacheKey, priority)
+            searchSpan.set(cached=False, results=len(
+                apiResults.get("organic", [])))
+            return apiResults
+
+    def fetchSerperApiResult(self, query, cacheKey, priority=PRIORITY_INTERACTIVE):
+        payload = json.dumps({
+            "q": query
+        })
+        headers = {
+            "X-API-KEY": self.serperApiKey,
+            "Content-Type": "application/json"
+        }
+
+        with self.upstreamSlot("serper", priority):
+            response = self.getTransport().post(
+                self.serperApiUrl, headers=headers, data=payload)
+        apiResults = response.json()
+        # Don't Cache the Errors
+        if (self.searchCache is not None) and ("organic" in apiResults):
+            self.searchCache.set(cacheKey, apiResults)
+
+        return apiResults
+
+    ######## Article Parsing Functions ########
+
+    # Parse Article Content of a single Search Result. Returns `None` if nothing could be Extracted. Concurrent Fetches of the same URL are Coalesced
+    def parseArticleContent(self, item, timeout=10):
+        with span("article", url=item["url"]) as articleSpan:
+            if (self.hostHealth is not None) and (not self.hostHealth.allow(item["url"])):
+                articleSpan.set(skipped="circuitOpen", extracted=False)
+                return None
+
+            articleData = self.articleFlight.do(
+                item["url"], self.fetchArticleData, item["url"], timeout)
+            if (articleData is None) or (not articleData["content"].strip()):
+                articleSpan.set(extracted=False)
+                return None
+
+            articleSpan.set(extracted=True, chars=len(articleData["content"]))
+            return articleData["content"]
+
+    # Fetch and Extract the Article of the URL, Recording the Health of its Host
+    def fetchArticleData(self, url: str, timeout):
+        startTime = time.monotonic()
+        try:
+            articleData = fetchArticle(url, timeout=timeout, transport=self.getTransport(), cache=self.articleCache,
+                                       maxBytes=self.articleMaxBytes, extractor=self.articleExtractor)
+        except Exception as e:
+            self.recordHostHealth(url, time.monotonic() - startTime, OUTCOME_ERROR)
+            raise
+
+        extracted = (articleData is not None) and (articleData["content"].strip() != "")
+        self.recordHostHealth(url, time.monotonic() - startTime,
+                              OUTCOME_OK if extracted else OUTCOME_EMPTY)
+        return articleData
+
+    # Record the Fetch in the Host Health. Links which are never Requested don't count
+    def recordHostHealth(self, url: str, latency: float, outcome: str):
+        if (self.hostHealth is not None) and (getSkippedUrlReason(url) is None):
+            self.hostHealth.record(url, latency, outcome)
+
+    # Drop the Near Duplicate Articles and Passages before the Context is Assembled. The Dropped Characters are Recorded on the current Span
+    def getDistinctArticles(self, articles, searchResults):
+        if not (self.articleDeduplication):
+            return articles, searchResults
+
+        articles, searchResults, stats = deduplicateArticles(
+            articles, searchResults)
+        setSpanAttributes(duplicateArticles=stats["articles"],
+                          duplicatePassages=stats["passages"], charsSaved=stats["charsSaved"])
+        return articles, searchResults
+
+    # The first `count` Search Results to Fetch, Healthy Hosts first and Tripped ones last
+    def selectSearchResults(self, searchResults, count: int):
+        if (self.hostHealth is not None):
+            searchResults = self.hostHealth.orderSearchResults(searchResults)
+
+        return searchResults[:count]
+
+    # Parse Article of a single Search Result
+    def parseArticleFromSearchResult(self, item, timeout=10):
+        content = self.parseArticleContent(item, timeout=timeout)
+        if (content is None):
+            return getSearchResultSnippet(item)
+
+        return content
+
+    # Parse Articles from Search Results
+    def parseArticlesFromSearchResults(self, searchResults, parseArticles=True, timeout=10, printProgress=False, concurrent=True, maxWorkers=8, deadline=None):
+        """
+        Description: Parse the Articles of the given Search Results. Articles are returned in Search Result order
+        Parameters:
+            searchResults: Search Results to parse the Articles from
+            parseArticles: Parse Article of Every URL, else use Title + Description (Default: True)
+            timeout: Timeout of Article URL Request (Default: 10s)
+            printProgress: Print the progress of the Executions (Default: False)
+            concurrent: Fetch all the URLs in parallel (Default: True)
+            maxWorkers: Max number of parallel Fetches if `concurrent` is `True` (Default: 8)
+            deadline: Overall time budget in seconds for all Fetches if `concurrent` is `True`. URLs missing the budget fall back to Title + Description (Default: None)
+        """
+        if (parseArticles) and (concurrent) and (len(searchResults) > 0):
+            return self.parseArticlesConcurrently(searchResults, timeout=timeout, printProgress=printProgress, maxWorkers=maxWorkers, deadline=deadline)
+
+        articles = []
+        for i, item in enumerate(searchResults):
+            try:
+                if (parseArticles):
+                    article = self.parseArticleFromSearchResult(
+                        item, timeout=timeout)
+                else:
+                    article = getSearchResultSnippet(item)
+
+                articles.append(article)
+                if (printProgress):
+                    print("Article Parsed:", i + 1, flush=1)
+            except Exception as e:
+                pass
+
+        return articles
+
+    # Parse Articles from Search Results in parallel within an overall deadline
+    def parseArticlesConcurrently(self, searchResults, timeout=10, printProgress=False, maxWorkers=8, deadline=None):
+        articles = [getSearchResultSnippet(item) for item in searchResults]
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(maxWorkers, len(searchResults))))
+        futures = {submitTraced(executor, self.parseArticleFromSearchResult, item, timeout): i
+                   for i, item in enumerate(searchResults)}
+
+        parsed = 0
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                try:
+                    articles[futures[future]] = future.result()
+                except Exception as e:
+                    continue
+
+                parsed += 1
+                if (printProgress):
+                    print("Article Parsed:", parsed, flush=1)
+        except FuturesTimeoutError:
+            if (printProgress):
+                print("Article Deadline Reached:", parsed, "of",
+                      len(searchResults), "Parsed", flush=1)
+        finally:
+            # Don't wait for the Stragglers, their Fallback is already in place
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return articles
+
+    # Parse the first `num_results` good Articles out of `num_results + hedge` Candidates
+    def parseArticlesHedged(self, searchResults, num_results, hedge=2, timeout=10, printProgress=False, maxWorkers=8, deadline=None, minArticleLength=200):
+        """
+        Description: Fetch more Candidate URLs than needed and keep the first `num_results` which extract real Content. Stragglers are abandoned
+        Return: (articles, searchResults) both in Search Result order, so they can be combined together
+        Parameters:
+            searchResults: Search Results to parse the Articles from
+            num_results: Number of Articles wanted
+            hedge: Number of extra Candidate URLs to fetch (Default: 2)
+            timeout: Timeout of Article URL Request (Default: 10s)
+            printProgress: Print the progress of the Executions (Default: False)
+            maxWorkers: Max number of parallel Fetches (Default: 8)
+            deadline: Overall time budget in seconds for all Fetches (Default: None)
+            minArticleLength: Minimum length of an Extracted Article to be accepted (Default: 200)
+        """
+        candidates = self.selectSearchResults(
+            searchResults, num_results + hedge)
+        if (len(candidates) == 0):
+            return [], []
+
+        accepted = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(maxWorkers, len(candidates))))
+        futures = {submitTraced(executor, self.parseArticleContent, item, timeout): i
+                   for i, item in enumerate(candidates)}
+
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    continue
+
+                if (content is None) or (len(content) < minArticleLength):
+                    continue
+
+                accepted[futures[future]] = content
+                if (printProgress):
+                    print("Article Parsed:", len(accepted), flush=1)
+
+                if (len(accepted) >= num_results):
+                    break
+        except FuturesTimeoutError:
+            if (printProgress):
+                print("Article Deadline Reached:", len(accepted), "of",
+                      num_results, "Parsed", flush=1)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Not enough good Articles: fill up with the best ranked Snippets
+        for i in range(len(candidates)):
+            if (len(accepted) >= num_results):
+                break
+            if (i not in accepted):
+                accepted[i] = getSearchResultSnippet(candidates[i])
+
+        order = sorted(accepted.keys())
+        return [accepted[i] for i in order], [candidates[i] for i in order]
+
+    # Parse the Articles and run the QnA Model on each one as it arrives, until an Answer is Confident enough
+    def parseArticlesUntilConfident(self, question: str, searchResults, confidenceThreshold, timeout=10, modelIndex=0, printProgress=False, maxWorkers=8, deadline=None, qaMode=None):
+        """
+        Description: Fetch the Articles in parallel and Answer the Question from every Article as soon as it is Parsed. Stops Fetching once an Answer scores at least `confidenceThreshold`
+        Return: (articles, answerOutput). `answerOutput` is `None` if no Answer was Confident enough. Articles not Parsed are replaced by Title + Description
+        Parameters:
+            question: User Question
+            searchResults: Search Results to parse the Articles from
+            confidenceThreshold: Min `score` of the QnA Answer to stop (0 - 1)
+            timeout: Timeout of Article URL Request (Default: 10s)
+            modelIndex: Use the corresponding QnA Model (Default: 0)
+            printProgress: Print the progress of the Executions (Default: False)
+            maxWorkers: Max number of parallel Fetches (Default: 8)
+            deadline: Overall time budget in seconds for all Fetches (Default: None)
+            qaMode: `remote`, `local` or `auto`, `None` for the Mode of the Client (Default: None)
+        """
+        articles = [getSearchResultSnippet(item) for item in searchResults]
+        if (len(searchResults) == 0):
+            return articles, None
+
+        def parseAndAnswer(item):
+            article = self.parseArticleFromSearchResult(item, timeout=timeout)
+            context = buildContext(question, [article], [item])
+            return article, self.getAIQuestionAnswerChunked(context, question, modelIndex=modelIndex, qaMode=qaMode)
+
+        confidentOutput = None
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(maxWorkers, len(searchResults))))
+        futures = {submitTraced(executor, parseAndAnswer, item): i
+                   for i, item in enumerate(searchResults)}
+
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                try:
+                    article, answerOutput = future.result()
+                except Exception as e:
+                    continue
+
+                articles[futures[future]] = article
+                if (printProgress):
+                    print("Article Parsed:", futures[future] + 1, flush=1)
+
+                if (answerOutput["success"]) and (answerOutput["result"].get("score", 0) >= confidenceThreshold):
+                    confidentOutput = answerOutput
+                    break
+        except FuturesTimeoutError:
+            pass
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return articles, confidentOutput
+
+    ######## AI Parsing Functions ########
+
+    # Get the Answer from Context with the QnA Mode
+    def getAIQuestionAnswer(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE, qaMode=None):
+        qaMode = self.requireQaMode(qaMode)
+        if (qaMode == "remote"):
+            return self.getRemoteQuestionAnswer(context, question, modelIndex=modelIndex, maxWait=maxWait, priority=priority)
+
+        return self.getLocalFirstQuestionAnswer(context, question, qaMode, self.getRemoteQuestionAnswer, context, question, modelIndex, maxWait, priority)
+
+    # Get the Answer from the Hosted QnA Model
+    def getRemoteQuestionAnswer(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE):
+        payload = {"inputs": {
+            "question": question,
+            "context": context
+        }}
+
+        return self.queryModel(self.qaModels[modelIndex], payload, "answer", maxWait=maxWait, priority=priority)
+
+    # Get the Answer with the Local Answerer, no Request is made
+    def getLocalQuestionAnswer(self, context, question):
+        with span("inference", model="local") as inferenceSpan:
+            try:
+                result = self.localAnswerer(question, context)
+            except Exception as e:
+                return {"success": False, "result": {"error": str(e)}}
+
+            # Nothing in the Context Matches the Question
+            if not (str(result.get("answer", "")).strip()):
+                inferenceSpan.set(cached=False, success=False)
+                return {"success": False, "result": {"error": "No Answer Found in the Context", "answerer": "local"}}
+
+            inferenceSpan.set(cached=False, success=True,
+                              score=result.get("score", 0))
+            return {"success": True, "result": dict(result, answerer="local")}
+
+    # Answer Locally first. The `auto` Mode calls the Remote Function only if the Local Answer is not Confident, and keeps the Local one if the Model fails (Loading, Rate Limited...)
+    def getLocalFirstQuestionAnswer(self, context, question, qaMode, remoteFunction, *args):
+        localOutput = self.getLocalQuestionAnswer(context, question)
+        if (qaMode == "local"):
+            return localOutput
+
+        if (localOutput["success"]) and (localOutput["result"].get("score", 0) >= self.localConfidentScore):
+            return localOutput
+
+        output = remoteFunction(*args)
+        if (not output["success"]) and (localOutput["success"]):
+            return localOutput
+
+        return output
+
+    # Get the Answer from a Context of any length: Split into overlapping Chunks, Query them in parallel and keep the best scored Span
+    def getAIQuestionAnswerChunked(self, context, question, modelIndex=0, maxWait=MODEL_MAX_WAIT, chunkWords=QA_CHUNK_WORDS, overlapWords=QA_CHUNK_OVERLAP_WORDS, maxWorkers=4, qaMode=None):
+        """
+        Description: Get the Answer from the Context in model sized Chunks. Returns the same Output as `getAIQuestionAnswer`, `start` and `end` are relative to the whole Context
+        Parameters:
+            context: Context of the Question
+            question: User Question
+            modelIndex: Use the corresponding QnA Model (Default: 0)
+            maxWait: Max total seconds to wait for the Model to be Loaded (Default: 120s)
+            chunkWords: Words per Chunk (Default: 300)
+            overlapWords: Words shared by two consecutive Chunks (Default: 50)
+            maxWorkers: Max number of parallel Requests (Default: 4)
+            qaMode: `remote`, `local` (the whole Context at once) or `auto`, `None` for the Mode of the Client (Default: None)
+        """
+        # The Local Answerer has no Input Limit, so the Context is not Chunked
+        qaMode = self.requireQaMode(qaMode)
+        if (qaMode != "remote"):
+            return self.getLocalFirstQuestionAnswer(context, question, qaMode, self.getAIQuestionAnswerChunked, context, question,
+                                                    modelIndex, maxWait, chunkWords, overlapWords, maxWorkers, "remote")
+
+        chunks = splitContextChunks(
+            context, chunkWords=chunkWords, overlapWords=overlapWords)
+        if (len(chunks) == 1):
+            return self.getRemoteQuestionAnswer(context, question, modelIndex=modelIndex, maxWait=maxWait)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(chunks)))) as executor:
+            futures = [submitTraced(executor, self.getRemoteQuestionAnswer, chunk, question, modelIndex=modelIndex, maxWait=maxWait)
+                       for offset, chunk in chunks]
+            outputs = [future.result() for future in futures]
+
+        bestOutput = None
+        for (offset, chunk), output in zip(chunks, outputs):
+            if (not output["success"]):
+                continue
+
+            result = dict(output["result"])
+            if ("start" in result) and ("end" in result):
+                result["start"] += offset
+                result["end"] += offset
+
+            if (bestOutput is None) or (result.get("score", 0) > bestOutput["result"].get("score", 0)):
+                bestOutput = {"success": True, "result": result}
+
+        if (bestOutput is None):
+            return outputs[0]
+
+        return bestOutput
+
+    # Convert easy answer tot Formal Answer. This one is Optional
+    def getAIFormalAnswer(self, question, answer, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE, formalMode=None):
+        """
+        Description: Generate the Formal Answer with the Formal Mode. The Result has the `generated_text` and the `formaliser` (`local` / `remote`) which Generated it
+        Return:
+                If Success: {"success": True, "result": {"generated_text": FormalAnswer, "formaliser": "local" / "remote"}}
+                If Unsuccess: {"success": False, "result": ContainingErrorData}
+        Parameters:
+            question: User Question
+            answer: Short Answer of the Question
+            maxWait: Max total seconds to wait for the Model to be Loaded, `remote` Mode only (Default: 120s)
+            priority: Priority of the Model Request in the Scheduler (Default: PRIORITY_INTERACTIVE)
+            formalMode: `local`, `remote` or `auto`, `None` for the Mode of the Client (Default: None)
+        """
+        formalMode = self.requireFormalMode(formalMode)
+        with span("formalAnswer", mode=formalMode) as formalSpan:
+            if (formalMode == "local"):
+                output = self.getLocalFormalAnswer(question, answer)
+            elif (formalMode == "remote"):
+                output = self.getRemoteFormalAnswer(
+                    question, answer, maxWait=maxWait, priority=priority)
+            else:
+                output = self.getAutoFormalAnswer(
+                    question, answer, priority=priority)
+
+            if (output["success"]):
+                formalSpan.set(formaliser=output["result"]["formaliser"])
+            return output
+
+    # Formal Answer from the Template of the Question Type, no Request is made. Without a Template, the Answer is made a Sentence, or `None` is Returned if not `fallback`
+    def getLocalFormalAnswer(self, question, answer, fallback=True):
+        if not (str(answer).strip()):
+            return {"success": False, "result": {"error": "No Answer to Formalise", "formaliser": "local"}}
+
+        try:
+            formalAnswer = self.formaliser(question, answer)
+        except Exception as e:
+            return {"success": False, "result": {"error": str(e)}}
+
+        if (formalAnswer is None) and (not fallback):
+            return None
+        if (formalAnswer is None):
+            formalAnswer = getAnswerSentence(answer)
+
+        return {"success": True, "result": {"generated_text": formalAnswer, "formaliser": "local"}}
+
+    # Formal Answer from the Formal Answer Model
+    def getRemoteFormalAnswer(self, question, answer, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE):
+        prompt = FORMAL_ANSWER_PROMPT.format(question, answer)
+
+        payload = {"inputs": prompt}
+
+        output = self.queryModel(self.formalAnswerModel, payload, "generated_text", maxWait=maxWait, priority=priority)
+        if (not output["success"]):
+            return output
+
+        return {"success": True, "result": dict(output["result"], formaliser="remote")}
+
+    # Formal Answer from the Template if one fits the Question, else from the Model if it Answers within `autoFormalTimeout`, else the Answer as a Sentence
+    def getAutoFormalAnswer(self, question, answer, priority=PRIORITY_INTERACTIVE):
+        output = self.getLocalFormalAnswer(question, answer, fallback=False)
+        if (output is not None) and (output["success"]):
+            return output
+
+        # A Loading Model is not Waited for. A Slow Request keeps running, so its Result is Cached for the next Questions
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = submitTraced(executor, self.getRemoteFormalAnswer,
+                              question, answer, 0, priority)
+        try:
+            output = future.result(timeout=self.autoFormalTimeout)
+        except Exception as e:
+            output = None
+        finally:
+            executor.shutdown(wait=False)
+
+        if (output is None) or (not output["success"]):
+            return self.getLocalFormalAnswer(question, answer)
+
+        return output
+
+    # Query the Model, concurrent Queries of the same Model and Payload are Coalesced
+    def queryModel(self, url: str, payload: dict, expectedKey: str, maxWait=MODEL_MAX_WAIT, priority=PRIORITY_INTERACTIVE):
+        with span("inference", model=url) as inferenceSpan:
+            cacheKey = getInferenceCacheKey(url, payload)
+            # Cache Hits don't need a Slot of the Model
+            if (self.inferenceCache is not None):
+                result = self.inferenceCache.get(cacheKey)
+                if (result is not None):
+                    inferenceSpan.set(cached=True, success=True)
+                    return {"success": True, "result": result}
+
+            output = self.inferenceFlight.do(
+                cacheKey, self.fetchModelResult, url, payload, expectedKey, maxWait, priority)
+            inferenceSpan.set(cached=False, success=output["success"])
+            return output
+
+    def fetchModelResult(self, url: str, payload: dict, expectedKey: str, maxWait, priority):
+        with self.upstreamSlot(url, priority):
+            return queryModel(url, payload, self.huggingFaceApiKey, expectedKey, maxWait=maxWait,
+                              transport=self.getTransport(), cache=self.inferenceCache)
+
+    ######## Model Warm Up Functions ########
+
+    # Start Pinging the QnA and Formal Answer Models at Startup and then Periodically
+    def startModelWarmer(self, interval=300, modelIndex=None):
+        """
+        Description: Keep the Models Warm in the Background, so the Questions don't pay the Model Loading time
+        Parameters:
+            interval: Seconds between two Pings (Default: 300s)
+            modelIndex: Only keep this QnA Model warm, `None` for all of them (Default: None)
+        """
+        self.requireHuggingFaceApiKey()
+        self.stopModelWarmer()
+
+        qaModels = self.qaModels if modelIndex is None else [
+            self.qaModels[modelIndex]]
+        models = [(url, QA_WARMUP_PAYLOAD) for url in qaModels]
+        # The `local` Mode never uses the Formal Answer Model
+        if (self.formalMode != "local"):
+            models.append((self.formalAnswerModel, FORMAL_WARMUP_PAYLOAD))
+
+        self.modelWarmer = ModelWarmer(
+            models, self.huggingFaceApiKey, interval=interval, transport=self.transport)
+        self.modelWarmer.start()
+        return self.modelWarmer
+
+    # Stop the Background Warmer
+    def stopModelWarmer(self):
+        if (self.modelWarmer is not None):
+            self.modelWarmer.stop()
+            self.modelWarmer = None
+
+    ######## Answer Functions ########
+
+    # Get the Answer after AI finished Parsing
+    def getAIAnswer(self, question: str, searchResults, preParsedArticles=None, timeout=10, parseArticles=True, preParsedAnswer=None, filter=False, modelIndex=0, printProgress=False, deadline=None, confidenceThreshold=None, preParsedAnswerOutput=None, answer=None, onAnswer=None, formalMode=None, qaMode=None):
+        """
+        Description: Takes `Question` and `Search Results` as Required Input
+        Generates Answer using Article parsing and AI
+        Return: `AnswerResult` of the Question
+        Parameters:
+            question: User Question
+            searchResults: Search Results of the Question Searched
+            timeout: Timeout of Article URL Request (Default: 10s)
+            parseArticles: Parse Article of Every URL and Use it as Description (Default: True)
+            preParsedAnswer: If the Answer is already parsed via other source but Still want to Be accurate, so parse the answer via this parameter (Default: None)
+            filter: Filter the Articles to contain the Searched Description (Default: False)
+            modelIndex: Use the corresponding QnA Model (Default: 0)
+            printProgress: Print the progress of the Executions (Default: False)
+            deadline: Overall time budget in seconds for parsing all the Articles (Default: None)
+            confidenceThreshold: Run the QnA Model on every Article as it arrives and stop Fetching once an Answer scores at least this (Default: None)
+            preParsedAnswerOutput: Output of the QnA Model if it is already parsed (Default: None)
+            answer: `AnswerResult` to fill, a new one if not Given (Default: None)
+            onAnswer: Called with the Output of the QnA Model before the Formal Answer is Generated (Default: None)
+            formalMode: `local` (Template), `remote` (Formal Answer Model) or `auto`, `None` for the Mode of the Client (Default: None)
+            qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) or `auto`, `None` for the Mode of the Client (Default: None)
+        """
+        if (answer is None):
+            answer = AnswerResult(question)
+        answer.searchResults = searchResults
+
+        answerOutput = preParsedAnswerOutput
+        if (preParsedArticles is None) and (parseArticles) and (confidenceThreshold is not None) and (answerOutput is None):
+            articles, answerOutput = self.parseArticlesUntilConfident(question, searchResults, confidenceThreshold, timeout=timeout,
+                                                                      modelIndex=modelIndex, printProgress=printProgress, deadline=deadline, qaMode=qaMode)
+        elif (preParsedArticles is None):
+            articles = self.parseArticlesFromSearchResults(
+                searchResults, parseArticles=parseArticles, timeout=timeout, printProgress=printProgress, deadline=deadline)
+        else:
+            articles = preParsedArticles
+
+        answer.articles = articles
+        if (answerOutput is None):
+            with span("context", charsIn=sum(len(article) for article in articles)) as contextSpan:
+                if (parseArticles):
+                    contextArticles, contextResults = self.getDistinctArticles(
+                        articles, searchResults)
+                    combinedArticle = combineArticles(
+                        contextArticles, contextResults, filter=filter, question=question)
+                else:
+                    combinedArticle = "\n\n".join(articles)
+
+                if (preParsedAnswer):
+                    combinedArticle = preParsedAnswer + "\n\n" + combinedArticle
+
+                contextSpan.set(charsOut=len(combinedArticle))
+
+            answer.combinedArticle = combinedArticle
+
+            answerOutput = self.getAIQuestionAnswerChunked(
+                combinedArticle, question, modelIndex=modelIndex, qaMode=qaMode)
+            if (not answerOutput["success"]):
+                answer.output = answerOutput
+                return answer
+
+        answer.answerOutput = answerOutput
+        if (onAnswer is not None):
+            onAnswer(answerOutput)
+        if (printProgress):
+            print("\nAnswer Parsed\n", flush=1)
+
+        formalAnswerOutput = self.getAIFormalAnswer(
+            question, answerOutput["result"]["answer"], formalMode=formalMode)
+        if (not formalAnswerOutput["success"]):
+            answer.output = formalAnswerOutput
+            return answer
+
+        answer.formalAnswerOutput = formalAnswerOutput
+        if (printProgress):
+            print("Formal Answer Parsed\n", flush=1)
+
+        answer.formalAnswer = formalAnswerOutput["result"]["generated_text"]
+        answer.output = {"success": True, "result": answer.formalAnswer}
+
+        return answer
+
+    # Get the Formal Answer of the Serper Direct Answer
+    def getDirectFormalAnswer(self, question: str, directAnswer: dict, answer=None, formalMode=None):
+        if (answer is None):
+            answer = AnswerResult(question)
+
+        answerOutput = self.getAIFormalAnswer(
+            question, directAnswer["answer"], formalMode=formalMode)
+        answer.formalAnswerOutput = answerOutput
+        if (answerOutput["success"]):
+            answer.formalAnswer = answerOutput["result"]["generated_text"]
+            answerOutput = {"success": True, "result": answer.formalAnswer}
+
+        answer.output = answerOutput
+        return answer
+
+    # Get the Answer via Parsing Search URLs using GoogleSearch_Python
+    def getAnswerViaGoogleSearch(self, question: str, num_results=3, timeout=10, filter=False, modelIndex=0, printProgress=False, deadline=None, confidenceThreshold=None, formalMode=None, qaMode=None):
+        """
+        Description: Get Question's answer Google Search
+        Return: `AnswerResult` of the Question
+        Parameters: Same as `getAnswerViaGoogleSearch`
+        """
+        self.requireHuggingFaceApiKey()
+
+        # Identical Questions in Flight share one Answer
+        question = self.resolveQuestion(question)
+        formalMode = self.requireFormalMode(formalMode)
+        qaMode = self.requireQaMode(qaMode)
+        flightKey = ("search", question, num_results, timeout,
+                     filter, modelIndex, deadline, confidenceThreshold, formalMode, qaMode)
+        return self.answerFlight.do(flightKey, self.runTraced, "answer", {"question": question, "parseType": "search"}, self.fetchAnswerViaGoogleSearch, question, num_results,
+                                    timeout, filter, modelIndex, printProgress, deadline, confidenceThreshold, formalMode, qaMode)
+
+    def fetchAnswerViaGoogleSearch(self, question: str, num_results, timeout, filter, modelIndex, printProgress, deadline, confidenceThreshold, formalMode, qaMode):
+        searchResults = self.getGoogleSearchResults(
+            question, num_results=num_results)
+
+        return self.getAIAnswer(question, searchResults, timeout=timeout, filter=filter, modelIndex=modelIndex,
+                                printProgress=printProgress, deadline=deadline, confidenceThreshold=confidenceThreshold, formalMode=formalMode, qaMode=qaMode)
+
+    # Get The answer using Serper API
+    def getAnswerViaSerperApi(self, question: str, num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, printProgress=False, deadline=None, hedge=0, confidenceThreshold=None, formalMode=None, qaMode=None):
+        """
+        Description: Get Question's answer using Serper API.
+        Return: `AnswerResult` of the Question
+        Parameters: Same as `getAnswerViaSerperApi`
+        """
+        self.requireSerperApiKey()
+        self.requireHuggingFaceApiKey()
+
+        # Identical Questions in Flight share one Answer
+        question = self.resolveQuestion(question)
+        formalMode = self.requireFormalMode(formalMode)
+        qaMode = self.requireQaMode(qaMode)
+        flightKey = ("serper", question, num_results, timeout, forceAi,
+                     fast, modelIndex, deadline, hedge, confidenceThreshold, formalMode, qaMode)
+        return self.answerFlight.do(flightKey, self.runTraced, "answer", {"question": question, "parseType": "serper"}, self.fetchAnswerViaSerperApi, question, num_results,
+                                    timeout, forceAi, fast, modelIndex, printProgress, deadline, hedge, confidenceThreshold, formalMode, qaMode)
+
+    def fetchAnswerViaSerperApi(self, question: str, num_results, timeout, forceAi, fast, modelIndex, printProgress, deadline, hedge, confidenceThreshold, formalMode, qaMode):
+        answer = AnswerResult(question)
+
+        apiResults = self.getSerperApiResult(question)
+        answer.apiResults = apiResults
+
+        organicSearches = apiResults["organic"]
+
+        searchResults = formatSerperSearchResults(organicSearches)
+        answer.searchResults = searchResults
+
+        if (printProgress):
+            print("API Results Parsed\n", flush=1)
+
+        directAnswer = parseSerperApiAnswer(apiResults)
+        answer.directAnswer = directAnswer
+
+        if (printProgress):
+            print("Direct Answer Parsed\n", flush=1)
+
+        if (directAnswer is not None) and (not forceAi):
+            self.getDirectFormalAnswer(
+                question, directAnswer, answer=answer, formalMode=formalMode)
+            if (printProgress):
+                print("Formal Answer parsed\n", flush=1)
+
+        elif (directAnswer is not None) and (forceAi):
+            parsedArticles, parsedSearchResults = None, self.selectSearchResults(
+                searchResults, num_results)
+            if (hedge > 0) and (not fast):
+                parsedArticles, parsedSearchResults = self.parseArticlesHedged(
+                    searchResults, num_results, hedge=hedge, timeout=timeout, printProgress=printProgress, deadline=deadline)
+
+            self.getAIAnswer(question, parsedSearchResults, preParsedArticles=parsedArticles, timeout=timeout, parseArticles=(
+                not fast), preParsedAnswer=f"{directAnswer['title']} - {directAnswer['answer']}", printProgress=printProgress, deadline=deadline, answer=answer, formalMode=formalMode, qaMode=qaMode)
+            if (printProgress):
+                print("AI Answer Parsed with Direct Answer\n", flush=1)
+        else:
+            parsedArticles, parsedSearchResults = None, self.selectSearchResults(
+                searchResults, num_results)
+            if (hedge > 0):
+                parsedArticles, parsedSearchResults = self.parseArticlesHedged(
+                    searchResults, num_results, hedge=hedge, timeout=timeout, printProgress=printProgress, deadline=deadline)
+
+            self.getAIAnswer(question, parsedSearchResults, preParsedArticles=parsedArticles, timeout=timeout, modelIndex=modelIndex,
+                             printProgress=printProgress, deadline=deadline, confidenceThreshold=confidenceThreshold, answer=answer, formalMode=formalMode, qaMode=qaMode)
+            if (printProgress):
+                print("Regular (Full) Answer parsed\n", flush=1)
+
+        return answer
+
+    # Answer many Questions together: Searches run concurrently, shared URLs are Fetched once and Inference is Batched
+    def getAnswersInBatch(self, questions: list, parseType="serper", num_results=3, timeout=10, forceAi=False, fast=True, modelIndex=0, printProgress=False, deadline=None, maxWorkers=8, batchSize=8, priority=PRIORITY_BATCH, formalMode=None, qaMode=None):
+        """
+        Description: Answer a List of Questions at once. Every Stage runs for all the Questions together, so the Throughput scales with `maxWorkers` and `batchSize`, not with the number of Questions
+        Return: `BatchAnswerResult` of the Questions
+        Parameters:
+            questions: List of User Questions
+            parseType: Search via `search` (Google Search) or `serper` (Serper API) (Default: serper)
+            num_results: Number of Search Results to parse per Question (Default: 3)
+            timeout: Timeout of Article URL Request (Default: 10s)
+            forceAi: Use AI even if Serper gave a Direct Answer (Default: False)
+            fast: Don't parse the Articles if Serper gave a Direct Answer (Default: True)
+            modelIndex: Use the corresponding QnA Model (Default: 0)
+            printProgress: Print the progress of the Executions (Default: False)
+            deadline: Overall time budget in seconds for Fetching all the Articles (Default: None)
+            maxWorkers: Max number of parallel Searches / Fetches (Default: 8)
+            batchSize: Max number of Inputs per Inference Request (Default: 8)
+            priority: Priority of the Serper and Model Requests in the Scheduler, the lower goes first (Default: PRIORITY_BATCH)
+            formalMode: `local` (Template), `remote` (Formal Answer Model) or `auto`, `None` for the Mode of the Client (Default: None)
+            qaMode: `remote` (Hosted QnA Model), `local` (Lexical Answerer) or `auto`, `None` for the Mode of the Client (Default: None)
+        """
+        if (parseType not in ["search", "serper"]):
+            raise ValueError(
+                "parseType can only be either `search` or `serper`")
+
+        self.requireHuggingFaceApiKey()
+        if (parseType == "serper"):
+            self.requireSerperApiKey()
+        formalMode = self.requireFormalMode(formalMode)
+        qaMode = self.requireQaMode(qaMode)
+
+        return self.runTraced("batch", {"questions": len(questions)}, self.fetchAnswersInBatch, questions, parseType, num_results, timeout, forceAi, fast,
+                              modelIndex, printProgress, deadline, maxWorkers, batchSize, priority, formalMode, qaMode)
+
+    def fetchAnswersInBatch(self, questions: list, parseType, num_results, timeout, forceAi, fast, modelIndex, printProgress, deadline, maxWorkers, batchSize, priority, formalMode, qaMode):
+        batch = BatchAnswerResult()
+        batch.answers = [AnswerResult(self.resolveQuestion(question))
+                         for question in questions]
+        startTime = stageTime = time.monotonic()
+
+        # Search every Question concurrently. Identical Questions are Coalesced by the Search Flight. A failed Search only fails its own Question
+        def search(answer):
+            if (parseType == "search"):
+                answer.searchResults = self.getGoogleSearchResults(
+                    answer.question, num_results=num_results)
+                if (answer.searchResults is None):
+                    raise ValueError("Google Search Failed")
+                return
+
+            answer.apiResults = self.getSerperApiResult(
+                answer.question, priority=priority)
+            if not (isinstance(answer.apiResults, dict)) or ("organic" not in answer.apiResults):
+                raise ValueError(
+                    f"Serper Search Failed: {(answer.apiResults or {}).get('message', 'No Results')}")
+            answer.searchResults = self.selectSearchResults(formatSerperSearchResults(
+                answer.apiResults["organic"]), num_results)
+            answer.directAnswer = parseSerperApiAnswer(answer.apiResults)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(batch.answers)))) as executor:
+            for answer, future in [(answer, submitTraced(executor, search, answer)) for answer in batch.answers]:
+                try:
+                    future.result()
+                except Exception as e:
+                    answer.output = {"success": False,
+                                     "result": {"error": str(e)}}
+
+        batch.timing["search"] = time.monotonic() - stageTime
+        if (printProgress):
+            print("Searches Done:", len(batch.answers), flush=1)
+
+        # Questions needing the QnA Model, and the ones needing their Articles
+        aiAnswers = [answer for answer in batch.answers if (answer.output is None) and (
+            (answer.directAnswer is None) or (forceAi))]
+        parseAnswers = [answer for answer in aiAnswers if (
+            answer.directAnswer is None) or (not fast)]
+
+        # Fetch every URL only once, even if it is shared by many Questions
+        stageTime = time.monotonic()
+        items = {}
+        for answer in parseAnswers:
+            for item in answer.searchResults:
+                items.setdefault(item["url"], item)
+
+        contents = {}
+        if (len(items) > 0):
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, min(maxWorkers, len(items))))
+            futures = {submitTraced(executor, self.parseArticleContent, item, timeout): url
+                       for url, item in items.items()}
+            try:
+                for future in as_completed(futures, timeout=deadline):
+                    try:
+                        contents[futures[future]] = future.result()
+                    except Exception as e:
+                        continue
+            except FuturesTimeoutError:
+                if (printProgress):
+                    print("Article Deadline Reached:", len(contents), "of",
+                          len(items), "Parsed", flush=1)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        batch.timing["articles"] = time.monotonic() - stageTime
+        if (printProgress):
+            print("Articles Parsed:", len(contents), flush=1)
+
+        # Assemble the Contexts, then Answer all the Chunks of all the Questions in Batched Requests
+        stageTime = time.monotonic()
+        qaInputs = []
+        localOutputs = {}
+        for answer in aiAnswers:
+            if (answer in parseAnswers):
+                answer.articles = [contents.get(item["url"]) or getSearchResultSnippet(item)
+                                   for item in answer.searchResults]
+            else:
+                answer.articles = [getSearchResultSnippet(
+                    item) for item in answer.searchResults]
+
+            with span("context", charsIn=sum(len(article) for article in answer.articles)) as contextSpan:
+                if (answer in parseAnswers):
+                    contextArticles, contextResults = self.getDistinctArticles(
+                        answer.articles, answer.searchResults)
+                    combinedArticle = combineArticles(
+                        contextArticles, contextResults, filter=False, question=answer.question)
+                else:
+                    combinedArticle = "\n\n".join(answer.articles)
+
+                if (answer.directAnswer is not None):
+                    combinedArticle = f"{answer.directAnswer['title']} - {answer.directAnswer['answer']}\n\n" + combinedArticle
+
+                contextSpan.set(charsOut=len(combinedArticle))
+
+            answer.combinedArticle = combinedArticle
+
+            # Local first: a Confident Local Answer needs no Model Request
+            if (qaMode != "remote"):
+                localOutput = self.getLocalQuestionAnswer(
+                    combinedArticle, answer.question)
+                if (qaMode == "local") or ((localOutput["success"]) and (localOutput["result"].get("score", 0) >= self.localConfidentScore)):
+                    answer.answerOutput = localOutput if localOutput["success"] else None
+                    answer.output = None if localOutput["success"] else localOutput
+                    continue
+                localOutputs[answer] = localOutput
+
+            for offset, chunk in splitContextChunks(combinedArticle, chunkWords=QA_CHUNK_WORDS, overlapWords=QA_CHUNK_OVERLAP_WORDS):
+                qaInputs.append((answer, offset, {"inputs": {
+                    "question": answer.question,
+                    "context": chunk
+                }}))
+
+        qaOutputs = self.queryModelInBatches(
+            self.qaModels[modelIndex], [payload for answer, offset, payload in qaInputs], "answer", batchSize=batchSize, maxWorkers=maxWorkers, priority=priority,
+            maxWait=MODEL_MAX_WAIT)
+
+        # Keep the best scored Span of every Question
+        for (answer, offset, payload), output in zip(qaInputs, qaOutputs):
+            if (not output["success"]):
+                if (answer.answerOutput is None) and (answer.output is None):
+                    answer.output = output
+                continue
+
+            result = dict(output["result"])
+            if ("start" in result) and ("end" in result):
+                result["start"] += offset
+                result["end"] += offset
+
+            if (answer.answerOutput is None) or (result.get("score", 0) > answer.answerOutput["result"].get("score", 0)):
+                answer.answerOutput = {"success": True, "result": result}
+                answer.output = None
+
+        # The `auto` Mode keeps the Local Answer if the Model failed
+        for answer, localOutput in localOutputs.items():
+            if (answer.answerOutput is None) and (localOutput["success"]):
+                answer.answerOutput = localOutput
+                answer.output = None
+
+        batch.timing["answers"] = time.monotonic() - stageTime
+        if (printProgress):
+            print("Answers Parsed:", len(aiAnswers), flush=1)
+
+        # Formal Answers of the QnA Answers and of the Serper Direct Answers, in Batched Requests
+        stageTime = time.monotonic()
+        formalAnswers = []
+        for answer in batch.answers:
+            if (answer.answerOutput is not None):
+                formalAnswers.append(
+                    (answer, answer.answerOutput["result"]["answer"]))
+            elif (answer.output is None) and (answer.directAnswer is not None):
+                formalAnswers.append((answer, answer.directAnswer["answer"]))
+
+        # The `auto` Mode only asks the Model for the Questions without a Template, and doesn't wait for a Loading Model
+        formalOutputs = [None] * len(formalAnswers)
+        if (formalMode == "auto"):
+            formalOutputs = [self.getLocalFormalAnswer(answer.question, easyAnswer, fallback=False)
+                             for answer, easyAnswer in formalAnswers]
+            formalOutputs = [output if (output is not None) and (output["success"]) else None
+                             for output in formalOutputs]
+
+        remoteIndexes = [] if formalMode == "local" else [
+            i for i, output in enumerate(formalOutputs) if output is None]
+        if (len(remoteIndexes) > 0):
+            remoteOutputs = self.queryModelInBatches(self.formalAnswerModel, [{"inputs": FORMAL_ANSWER_PROMPT.format(formalAnswers[i][0].question, formalAnswers[i][1])}
+                                                                              for i in remoteIndexes], "generated_text", batchSize=batchSize, maxWorkers=maxWorkers, priority=priority,
+                                                     maxWait=0 if formalMode == "auto" else MODEL_MAX_WAIT)
+            for i, output in zip(remoteIndexes, remoteOutputs):
+                formalOutputs[i] = {"success": True, "result": dict(
+                    output["result"], formaliser="remote")} if output["success"] else output
+
+        for (answer, easyAnswer), output in zip(formalAnswers, formalOutputs):
+            if (output is None) or ((formalMode == "auto") and (not output["success"])):
+                output = self.getLocalFormalAnswer(answer.question, easyAnswer)
+
+            if (not output["success"]):
+                answer.output = output
+                continue
+
+            answer.formalAnswerOutput = output
+            answer.formalAnswer = output["result"]["generated_text"]
+            answer.output = {"success": True, "result": answer.formalAnswer}
+
+        batch.timing["formalAnswers"] = time.monotonic() - stageTime
+        batch.timing["total"] = time.monotonic() - startTime
+        batch.stats = {
+            "questions": len(batch.answers),
+            "urls": sum(len(answer.searchResults) for answer in parseAnswers),
+            "uniqueUrls": len(items),
+            "qaInputs": len(qaInputs),
+            "formalInputs": len(formalAnswers)
+        }
+        if (printProgress):
+            print("Formal Answers Parsed:", len(formalAnswers), flush=1)
+
+        return batch
+
+    # Query the Model with the Payloads, `batchSize` Inputs per Request and the Requests in parallel
+    def queryModelInBatches(self, url: str, payloads: list, expectedKey: str, batchSize=8, maxWorkers=8, priority=PRIORITY_BATCH, maxWait=MODEL_MAX_WAIT):
+        if (len(payloads) == 0):
+            return []
+
+        def queryBatch(batchPayloads):
+            with span("inference", model=url, inputs=len(batchPayloads)) as inferenceSpan:
+                # The Batched Request and every Request of the Fallback take their own Slot
+                outputs = queryModelBatch(url, batchPayloads, self.huggingFaceApiKey, expectedKey, maxWait=maxWait, transport=self.getTransport(),
+                                          cache=self.inferenceCache, slot=lambda: self.upstreamSlot(url, priority))
+
+                inferenceSpan.set(success=sum(
+                    output["success"] for output in outputs))
+                return outputs
+
+        batches = [payloads[i:i + batchSize]
+                   for i in range(0, len(payloads), batchSize)]
+        with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(batches)))) as executor:
+            futures = [submitTraced(executor, queryBatch, batchPayloads)
+                       for batchPayloads in batches]
+            batchOutputs = [future.result() for future in futures]
+
+        return [output for outputs in batchOutputs for output in outputs]
+
+    # Stop the Background Work of the Client
+    def close(self):
+        self.stopModelWarmer()
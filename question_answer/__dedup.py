@@ -0,0 +1,102 @@
+import hashlib
+import re
+
+from .__retrieval import splitPassages
+
+#### Const Variables ####
+
+# Words per Shingle, the Fingerprints are built from the Hashes of the Shingles
+SHINGLE_WORDS = 4
+
+# Max Hamming Distance between the SimHashes of two Near Duplicate Articles (of 64 Bits)
+MAX_SIMHASH_DISTANCE = 3
+
+# Share of the Shingles of a Passage already in the kept Articles, from which it is a Duplicate
+MAX_PASSAGE_OVERLAP = 0.8
+
+
+# Stable 64 Bit Hash of a Shingle. The builtin Hash is Salted per Process, so the Near Duplicates would change from run to run
+def getShingleHash(shingle: str):
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+# 64 Bit Hashes of the Word Shingles of the Text. Texts shorter than a Shingle are one Shingle
+def getShingleHashes(text: str, shingleWords=SHINGLE_WORDS):
+    words = re.findall(r"\w+", text.lower())
+    if (len(words) == 0):
+        return []
+
+    shingles = [" ".join(words[i:i + shingleWords])
+                for i in range(max(1, len(words) - shingleWords + 1))]
+    return [getShingleHash(shingle) for shingle in shingles]
+
+
+# SimHash Fingerprint of the distinct Shingle Hashes: every Bit is the Majority Vote of the Shingles
+def getSimHash(hashes):
+    # Count the set Bits column by column of the Binary Strings, much faster than shifting every Hash 64 times
+    columns = zip(*(format(value, "064b") for value in hashes))
+    bits = "".join("1" if column.count("1") * 2 > len(hashes) else "0" for column in columns)
+    return int(bits, 2)
+
+
+def getHammingDistance(a: int, b: int):
+    return bin(a ^ b).count("1")
+
+
+# Drop the Near Duplicate Articles and Passages, keeping the Version of the highest Ranked Search Result
+def deduplicateArticles(articles: list, searchResults: list, maxDistance=MAX_SIMHASH_DISTANCE, maxOverlap=MAX_PASSAGE_OVERLAP):
+    """
+    Description: Mirrored / Syndicated Articles are Dropped when their SimHash is within `maxDistance` Bits of a higher Ranked one. Of the kept Articles, the Passages whose Shingles are mostly in the higher Ranked Articles already are Dropped too
+    Return: (articles, searchResults, stats). The Lists keep the Search Result order, `stats` is {"articles": Dropped Articles, "passages": Dropped Passages of the kept Articles, "charsSaved": Characters of the Dropped Articles and Passages}
+    Parameters:
+        articles: Parsed Articles, best Ranked first
+        searchResults: Search Results of the Articles (Same Order)
+        maxDistance: Max Hamming Distance of the SimHashes of Near Duplicate Articles (Default: 3)
+        maxOverlap: Share of the Shingles of a Passage seen before, from which it is Dropped (Default: 0.8)
+    """
+    stats = {"articles": 0, "passages": 0, "charsSaved": 0}
+    keptArticles, keptResults, keptSimHashes = [], [], []
+    seenShingles = set()
+
+    for article, searchResult in zip(articles, searchResults):
+        passages = splitPassages(article)
+        passageHashes = [getShingleHashes(passage) for passage in passages]
+        allHashes = [value for hashes in passageHashes for value in hashes]
+        if (len(allHashes) == 0):
+            keptArticles.append(article)
+            keptResults.append(searchResult)
+            continue
+
+        articleShingles = set(allHashes)
+        simHash = getSimHash(articleShingles)
+        if (any(getHammingDistance(simHash, kept) <= maxDistance for kept in keptSimHashes)):
+            stats["articles"] += 1
+            stats["charsSaved"] += len(article)
+            continue
+
+        keptPassages, droppedPassages, droppedChars = [], 0, 0
+        for passage, hashes in zip(passages, passageHashes):
+            if (len(hashes) > 0) and (sum(1 for value in hashes if value in seenShingles) >= maxOverlap * len(hashes)):
+                droppedPassages += 1
+                droppedChars += len(passage)
+                continue
+            keptPassages.append(passage)
+
+        # Shingles of this Article only count for the lower Ranked ones, so its own repeated Passages are kept
+        seenShingles.update(articleShingles)
+        keptSimHashes.append(simHash)
+        # An Article without any new Passage is Counted as a Dropped Article, not as its Passages
+        if (len(keptPassages) == 0):
+            stats["articles"] += 1
+            stats["charsSaved"] += len(article)
+            continue
+
+        if (len(keptPassages) < len(passages)):
+            stats["passages"] += droppedPassages
+            stats["charsSaved"] += droppedChars
+            article = "\n".join(keptPassages)
+
+        keptArticles.append(article)
+        keptResults.append(searchResult)
+
+    return keptArticles, keptResults, stats
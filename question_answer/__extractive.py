@@ -0,0 +1,169 @@
+import re
+
+from .__formal import getQuestionType
+from .__retrieval import BM25Index, getTermTokens
+
+#### Const Variables ####
+
+# Ways to Answer from the Context: `remote` (Hosted QnA Model), `local` (Lexical Answerer, no Request) or `auto` (Local first, Model if it is not Confident)
+QA_MODES = ["remote", "local", "auto"]
+DEFAULT_QA_MODE = "remote"
+
+# Min `score` of a Local Answer which the `auto` Mode Accepts without Querying the Model
+LOCAL_CONFIDENT_SCORE = 0.6
+
+# Question Words, they never have to be Matched in the Context
+QUESTION_WORDS = ["who", "whom", "whose", "when", "where", "which", "why", "how", "many", "much"]
+
+MONTH_PATTERN = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?"
+
+# Candidate Answers of every Question Type, the first Pattern is the most Specific
+DATE_PATTERNS = [
+    rf"\b{MONTH_PATTERN}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b",
+    rf"\b\d{{1,2}}(?:st|nd|rd|th)?\s+(?:of\s+)?{MONTH_PATTERN},?\s+\d{{4}}\b",
+    r"\b\d{4}-\d{2}-\d{2}\b",
+    rf"\b{MONTH_PATTERN}\s+\d{{4}}\b",
+    rf"\b{MONTH_PATTERN}\s+\d{{1,2}}(?:st|nd|rd|th)?\b",
+    r"\b(?:1[0-9]|20)\d{2}s?\b",
+    r"\b\d{1,2}(?:st|nd|rd|th)\s+century\b"
+]
+NUMBER_PATTERNS = [
+    r"[$€£¥]\s?\d[\d,]*(?:\.\d+)?(?:\s?(?:thousand|million|billion|trillion|[kKmMbB]n?)\b)?",
+    r"\b\d[\d,]*(?:\.\d+)?\s?(?:%|percent\b|(?:thousand|million|billion|trillion)\b)",
+    r"\b\d[\d,]*(?:\.\d+)?\s?(?:km|kg|mph|km/h|miles?|meters?|feet|ft|lbs?|pounds|dollars|years?|days?|hours?|minutes?|people)\b",
+    r"\b\d[\d,]*(?:\.\d+)?\b",
+    r"\b(?:one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|twenty|thirty|hundred)\b"
+]
+VERSION_PATTERNS = [r"\bv?\d+(?:\.\d+){1,3}(?:[-+.]?[A-Za-z0-9]+)?\b"]
+# "X is <Answer>" of the "What is X" Questions, the `answer` Group is the Candidate
+DEFINITION_PATTERNS = [
+    r"\b(?:is|are|was|were|refers to|means)\s+(?P<answer>[^,;:()]+)"]
+NAME_PATTERNS = [
+    r"\b[A-Z][\w.&'-]*(?:\s+(?:of|the|de|von|van|and|&)?\s*[A-Z][\w.&'-]*)*"]
+
+# Weight of a Candidate by how well its Pattern fits the Question Type. A whole Sentence is the last Resort
+TYPE_MATCH_WEIGHT = 1.0
+NAME_MATCH_WEIGHT = 0.7
+SENTENCE_MATCH_WEIGHT = 0.4
+
+
+# Split the Context into Sentences, without the "Title:" / "Body:" Labels of the Combined Articles. Returns [(charOffset, sentenceText)]
+def splitSentenceSpans(context: str):
+    spans = []
+    for match in re.finditer(r"[^\n.!?]+(?:[.!?](?=\S)[^\n.!?]*)*[.!?]*", context):
+        text = match.group(0)
+        label = re.match(r"\s*(?:(?:Title|Description|Body):\s*)*", text)
+        stripped = text[label.end():].strip()
+        if (len(stripped) > 0):
+            spans.append((match.start() + label.end() + text[label.end():].index(stripped[0]), stripped))
+
+    return spans
+
+
+# Candidate Patterns of the Question: ([patterns], weight) in the Order they are Tried
+def getCandidatePatterns(question: str):
+    questionType = getQuestionType(question)
+    questionTokens = getTermTokens(question)
+
+    if (("version" in questionTokens) or ("release" in questionTokens)) and (questionType != "when"):
+        return [(VERSION_PATTERNS, TYPE_MATCH_WEIGHT), (NUMBER_PATTERNS, NAME_MATCH_WEIGHT)]
+
+    # "How many People use it every Month" is still a Count
+    if (questionType in ["howMany", "howMuch"]):
+        return [(NUMBER_PATTERNS, TYPE_MATCH_WEIGHT)]
+
+    if (questionType == "when") or (any(token in questionTokens for token in ["year", "date", "day", "month", "century"])):
+        return [(DATE_PATTERNS, TYPE_MATCH_WEIGHT)]
+
+    if (questionType in ["who", "where", "which"]):
+        return [(NAME_PATTERNS, TYPE_MATCH_WEIGHT)]
+
+    if (questionType == "what") and (re.match(r"\s*what(?:'s|\s+(?:is|are|was|were))\b", question.lower())):
+        return [(DEFINITION_PATTERNS, TYPE_MATCH_WEIGHT), (NAME_PATTERNS, NAME_MATCH_WEIGHT), (DATE_PATTERNS + NUMBER_PATTERNS, NAME_MATCH_WEIGHT)]
+
+    return [(NAME_PATTERNS, NAME_MATCH_WEIGHT), (DATE_PATTERNS + NUMBER_PATTERNS, NAME_MATCH_WEIGHT)]
+
+
+# Candidate Answers of a Sentence: [(start, end, weight)], relative to the Sentence
+def getSentenceCandidates(sentence: str, candidatePatterns: list, questionTerms: set):
+    candidates = []
+    for patterns, weight in candidatePatterns:
+        taken = []
+        for pattern in patterns:
+            for match in re.finditer(pattern, sentence):
+                group = "answer" if "answer" in match.groupdict() else 0
+                start, end = match.span(group)
+                text = match.group(group).strip(" ,.")
+                if (len(text) == 0) or (any(start < takenEnd and end > takenStart for takenStart, takenEnd in taken)):
+                    continue
+
+                # A Span which only repeats the Question is not an Answer
+                terms = set(getTermTokens(text))
+                if (len(terms) > 0) and (terms <= questionTerms):
+                    continue
+
+                end = start + len(match.group(group).rstrip(" ,."))
+                taken.append((start, end))
+                candidates.append((start, end, weight))
+
+        if (len(candidates) > 0):
+            break
+
+    return candidates
+
+
+# Closeness of the Candidate to the Question Terms in the Sentence (0 - 1)
+def getProximity(sentence: str, start: int, end: int, questionTerms: set):
+    positions = [match.start() for match in re.finditer(r"[a-z0-9]+(?:\.[0-9]+)*", sentence.lower())
+                 if match.group(0) in questionTerms]
+    if (len(positions) == 0):
+        return 0
+
+    distance = min(0 if start <= position < end else min(abs(position - start), abs(position - end))
+                   for position in positions)
+    return 1 / (1 + distance / 40)
+
+
+# Answer the Question from the Context without any Model
+def getLexicalAnswer(question: str, context: str):
+    """
+    Description: Extractive Answerer which needs no Network or GPU: Splits the Context into Sentences, Scores them by the (IDF weighted) Question Terms they contain and Extracts the Candidate which fits the Question Type (Dates for `when`, Numbers for `how many`, Versions, Names...) closest to the Terms
+    Return: {"answer": Answer, "score": 0 - 1, "start": Start in Context, "end": End in Context}, same as the Hosted QnA Models
+    Parameters:
+        question: User Question
+        context: Context to Extract the Answer from
+    """
+    questionTerms = set(token for token in getTermTokens(question)
+                        if token not in QUESTION_WORDS)
+    sentences = splitSentenceSpans(context)
+    if (len(sentences) == 0) or (len(questionTerms) == 0):
+        return {"answer": "", "score": 0.0, "start": 0, "end": 0}
+
+    index = BM25Index([sentence for offset, sentence in sentences])
+    weights = {term: index.getIdf(term) for term in questionTerms}
+    totalWeight = sum(weights.values())
+    candidatePatterns = getCandidatePatterns(question)
+
+    best = None
+    for i, bm25Score in index.search(" ".join(questionTerms)):
+        offset, sentence = sentences[i]
+        sentenceTerms = set(getTermTokens(sentence))
+        coverage = sum(weight for term, weight in weights.items()
+                       if term in sentenceTerms) / totalWeight
+
+        candidates = getSentenceCandidates(
+            sentence, candidatePatterns, questionTerms)
+        if (len(candidates) == 0):
+            candidates = [(0, len(sentence), SENTENCE_MATCH_WEIGHT)]
+
+        for start, end, weight in candidates:
+            proximity = getProximity(sentence, start, end, questionTerms)
+            score = coverage * weight * (0.7 + 0.3 * proximity)
+            if (best is None) or (score > best[0]):
+                best = (score, offset + start, offset + end)
+
+    if (best is None):
+        return {"answer": "", "score": 0.0, "start": 0, "end": 0}
+
+    score, start, end = best
+    return {"answer": context[start:end], "score": round(score, 4), "start": start, "end": end}
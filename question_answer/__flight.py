@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+# Coalesces identical Calls which are in Flight at the same time
+class SingleFlight:
+    """
+    Description: Only one Call per Key runs at a time, the concurrent Callers with the same Key share its Result
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._inFlight = {}
+        self._lock = threading.Lock()
+
+    # Run the Function, or wait for the in Flight Call of the same Key
+    def do(self, key, function, *args, **kwargs):
+        with self._lock:
+            future = self._inFlight.get(key)
+            leader = future is None
+            if (leader):
+                future = Future()
+                self._inFlight[key] = future
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not (leader):
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inFlight[key]
+
+    # Call / Shared Counters
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "inFlight": len(self._inFlight)}
+
+
+# Async version of `SingleFlight`, the concurrent Callers await the same Task
+class AsyncSingleFlight:
+    """
+    Description: Only one Coroutine per Key runs at a time, the concurrent Callers with the same Key share its Result
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+
+        self._inFlight = {}
+
+    # Run the Coroutine Function, or await the in Flight Call of the same Key
+    async def do(self, key, function, *args, **kwargs):
+        task = self._inFlight.get(key)
+        if (task is None):
+            task = asyncio.ensure_future(function(*args, **kwargs))
+            self._inFlight[key] = task
+            task.add_done_callback(lambda done: self._inFlight.pop(key, None))
+            self.calls += 1
+        else:
+            self.shared += 1
+
+        # Shielded, so a cancelled Caller doesn't cancel the Call of the others
+        return await asyncio.shield(task)
+
+    # Call / Shared Counters
+    def stats(self):
+        return {"calls": self.calls, "shared": self.shared, "inFlight": len(self._inFlight)}
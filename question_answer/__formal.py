@@ -0,0 +1,297 @@
+import re
+
+#### Const Variables ####
+
+# Ways to Generate the Formal Answer: `local` (Template, no Request), `remote` (Formal Answer Model) or `auto` (Template if one fits the Question, else the Model, `local` if it is Loading or Slow)
+FORMAL_MODES = ["local", "remote", "auto"]
+DEFAULT_FORMAL_MODE = "local"
+
+# Max seconds the `auto` Mode waits for the Formal Answer Model before using the Template
+AUTO_FORMAL_TIMEOUT = 3
+
+# Verbs which are followed by the Subject in a Question
+BE_VERBS = ["is", "are", "was", "were"]
+DO_VERBS = ["do", "does", "did"]
+MODAL_VERBS = ["can", "could", "will", "would", "should", "has", "have", "had"]
+
+# Words starting the Subject of a Question, so they are never taken as its Verb
+DETERMINERS = ["the", "a", "an", "this", "that", "these", "those", "his", "her", "their", "its", "our", "your", "my"]
+
+# Common Question Verbs, used to find the Verb after the Subject ("When did Apple release the iPhone")
+COMMON_VERBS = ["have", "release", "start", "end", "begin", "die", "win", "become", "launch", "come", "go", "invent", "found", "make",
+                "take", "get", "live", "play", "write", "happen", "occur", "open", "close", "join", "leave", "buy", "sell", "build",
+                "create", "discover", "cost", "mean", "say", "lose", "score", "earn", "weigh", "last", "take", "use", "need"]
+
+# Past Tense of the Irregular Verbs
+IRREGULAR_PAST = {"have": "had", "begin": "began", "become": "became", "come": "came", "go": "went", "win": "won", "make": "made",
+                  "take": "took", "get": "got", "write": "wrote", "buy": "bought", "sell": "sold", "build": "built", "say": "said",
+                  "lose": "lost", "find": "found", "give": "gave", "know": "knew", "run": "ran", "see": "saw", "leave": "left",
+                  "think": "thought", "bring": "brought", "fall": "fell", "grow": "grew", "speak": "spoke", "sing": "sang", "be": "was"}
+
+# Third Person Form of the Irregular Verbs
+IRREGULAR_PRESENT = {"have": "has", "be": "is", "do": "does", "go": "goes"}
+
+MONTHS = ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october", "november", "december",
+          "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"]
+
+# Nouns of "What Year / Which Day..." Questions, their Answer is a Time
+TIME_NOUNS = ["year", "day", "date", "month", "time", "century", "decade"]
+
+PREPOSITIONS = ["in", "on", "at", "by", "from", "near", "inside", "within", "around", "during", "since", "before", "after", "between"]
+
+# Past Participles of the Irregular Verbs, the Regular ones end with "ed"
+IRREGULAR_PARTICIPLES = ["born", "built", "made", "written", "found", "known", "given", "taken", "sold", "bought", "won", "begun", "become",
+                         "held", "seen", "done", "drawn", "driven", "grown", "led", "lost", "paid", "sent", "spoken", "stolen", "thrown",
+                         "chosen", "broken", "beaten", "told", "brought", "caught", "taught", "fought", "left", "kept", "shown", "sung", "run"]
+
+
+# Type of the Question: who, what, when, where, which, howMany, howMuch, how, why, yesNo or other
+def getQuestionType(question: str):
+    words = re.findall(r"[a-z0-9]+", question.lower())
+    if (len(words) == 0):
+        return "other"
+
+    if (words[0] == "how") and (len(words) > 1) and (words[1] in ["many", "much"]):
+        return "howMany" if words[1] == "many" else "howMuch"
+
+    if (words[0] in ["who", "whom", "whose"]):
+        return "who"
+
+    if (words[0] in ["what", "when", "where", "which", "how", "why"]):
+        return words[0]
+
+    if (words[0] in BE_VERBS + DO_VERBS + MODAL_VERBS):
+        return "yesNo"
+
+    return "other"
+
+
+# Upper Case the first Letter, the rest is not Changed
+def capitalizeFirst(text: str):
+    return text[:1].upper() + text[1:]
+
+
+# End the Sentence with a Full Stop
+def endSentence(text: str):
+    text = text.strip()
+    if (text[-1:] in [".", "!", "?"]):
+        return text
+
+    return text + "."
+
+
+# Past Tense / Third Person Form of a Verb
+def conjugateVerb(verb: str, auxiliary: str):
+    if (auxiliary == "do"):
+        return verb
+
+    if (auxiliary == "did"):
+        if (verb in IRREGULAR_PAST):
+            return IRREGULAR_PAST[verb]
+        if (verb.endswith("e")):
+            return verb + "d"
+        if (re.search(r"[^aeiou]y$", verb)):
+            return verb[:-1] + "ied"
+        return verb + "ed"
+
+    if (verb in IRREGULAR_PRESENT):
+        return IRREGULAR_PRESENT[verb]
+    if (re.search(r"(s|sh|ch|x|z|o)$", verb)):
+        return verb + "es"
+    if (re.search(r"[^aeiou]y$", verb)):
+        return verb[:-1] + "ies"
+    return verb + "s"
+
+
+# Split "Apple release the iPhone" to ("Apple", "release", "the iPhone"). Returns `None` if no known Verb is Found
+def splitSubjectVerb(words: list):
+    for i, word in enumerate(words[1:], 1):
+        if (word.lower() in COMMON_VERBS) and (words[i - 1].lower() not in DETERMINERS):
+            return " ".join(words[:i]), word.lower(), " ".join(words[i + 1:])
+
+    return None
+
+
+# Check if the Word is a Past Participle ("born", "released"). "need" / "speed" / "red" are not
+def isParticiple(word: str):
+    word = word.lower()
+    return (word in IRREGULAR_PARTICIPLES) or ((len(word) > 3) and (word.endswith("ed")) and (not word.endswith("eed")))
+
+
+# Position of the Participle of a Passive Subject: "Obama born" -> 1, "invented by Edison" -> 0, "the telephone invented by" -> 2. Returns `None` if the Subject is not Passive
+def getPassiveIndex(words: list):
+    for i, word in enumerate(words):
+        following = [word.lower() for word in words[i + 1:]]
+        # The Participle ends the Subject, or only a "by ..." Agent / a Preposition follows it
+        if not (isParticiple(word)) or not ((len(following) == 0) or (following[0] == "by") or (following in [[preposition] for preposition in PREPOSITIONS + ["to", "for", "with"]])):
+            continue
+
+        # "the speed" is a Noun, not a Subject and its Participle
+        if (i == 0) or (any(word.lower() not in DETERMINERS for word in words[:i])):
+            return i
+
+    return None
+
+
+# Put the Auxiliary of a Passive Question before its Participle: "Obama" + "was" + "born" + "in Hawaii". Returns `None` if there is no Subject before the Participle
+def getPassiveFormalAnswer(words: list, i: int, auxiliary: str, answerPart: str):
+    if (i == 0):
+        return None
+
+    return f"{capitalizeFirst(' '.join(words[:i]))} {auxiliary} {' '.join(words[i:])} {answerPart}"
+
+
+# Preposition to put before a Time / Place Answer, "" if the Answer already has one
+def getAnswerPreposition(answer: str, questionType: str):
+    words = answer.lower().split()
+    if (len(words) == 0) or (words[0] in PREPOSITIONS):
+        return ""
+
+    if (questionType == "where"):
+        return "in "
+
+    if (re.search(r"\d{1,2}(:\d{2})?\s*(am|pm|a\.m\.|p\.m\.)", answer.lower())):
+        return "at "
+
+    # A Day (March 5, 5 March 2020, 2020-03-05) is "on", a Month / Year / Century is "in"
+    hasMonth = any(word.strip(",.") in MONTHS for word in words)
+    hasDay = re.search(r"\b\d{1,2}(st|nd|rd|th)?\b", answer) is not None
+    if (re.search(r"\d{4}-\d{2}-\d{2}", answer)) or ((hasMonth) and (hasDay)):
+        return "on "
+
+    if (hasMonth) or (re.fullmatch(r"(the\s+)?\d{2,4}s?|(the\s+)?\d{1,2}(st|nd|rd|th)\s+century", answer.lower().strip())):
+        return "in "
+
+    return ""
+
+
+# Rephrase "When did X <verb> Y" / "How many N does X <verb>" around the Answer
+def getDoFormalAnswer(auxiliary: str, words: list, answerPart: str):
+    split = splitSubjectVerb(words)
+    if (split is None):
+        return None
+
+    subject, verb, rest = split
+    parts = [capitalizeFirst(subject), conjugateVerb(verb, auxiliary), rest, answerPart]
+    return " ".join(part for part in parts if part)
+
+
+# "How many People live in Tokyo" + "14 million" -> "14 million People live in Tokyo", the Words the Answer already ends with are not Repeated
+def getCountFormalAnswer(words: list, answer: str):
+    answerWords = answer.lower().split()
+    for i in range(min(len(words), len(answerWords)), 0, -1):
+        if ([word.lower() for word in words[:i]] == answerWords[-i:]):
+            return " ".join([answer] + words[i:])
+
+    return " ".join([answer] + words)
+
+
+# Word / Phrase Answer made a Sentence ("v21.1.0" is kept as it is), the Formal Answer of the Questions without a Template
+def getAnswerSentence(answer: str):
+    answer = str(answer).strip().rstrip(".")
+    if (re.fullmatch(r"[A-Za-z]+", answer)) or (" " in answer):
+        return endSentence(capitalizeFirst(answer))
+
+    return answer
+
+
+# Generate the Formal Answer from a Template of the Question Type, without any Model
+def getTemplateFormalAnswer(question: str, answer: str):
+    """
+    Description: Splice the Answer into the Question (`Who is Iron Man?` + `Tony Stark` -> `Tony Stark is Iron Man.`). Deterministic and Local, the Answer is never Modified. Without a Template of the Question, the Answer is made a Sentence
+    Return: Formal Answer
+    Parameters:
+        question: User Question
+        answer: Short Answer of the Question
+    """
+    formalAnswer = getTemplateSentence(question, answer)
+    if (formalAnswer is None):
+        return getAnswerSentence(answer)
+
+    return formalAnswer
+
+
+# Formal Answer from the Template of the Question Type. Returns `None` if no Template fits the Question
+def getTemplateSentence(question: str, answer: str):
+    answer = str(answer).strip().rstrip(".")
+    if (answer == ""):
+        return None
+
+    # Already a Sentence
+    if (len(answer.split()) >= 8):
+        return endSentence(capitalizeFirst(answer))
+
+    questionType = getQuestionType(question)
+    text = re.sub(r"[?!.\s]+$", "", question.strip())
+    text = re.sub(r"^(\w+)'s\b", r"\1 is", text)
+    words = text.split()
+
+    formalAnswer = None
+    if (questionType in ["who", "what", "which"]) and (len(words) > 1):
+        words = words[1:]
+        # Which Planet is ... / What Year did ...
+        noun = None
+        if (questionType != "who") and (len(words) > 2) and (words[1].lower() in BE_VERBS + DO_VERBS):
+            noun, words = words[0].lower(), words[1:]
+
+        auxiliary = words[0].lower()
+        answerPart = answer
+        if (noun in TIME_NOUNS):
+            answerPart = getAnswerPreposition(answer, "when") + answer
+
+        if (auxiliary in BE_VERBS) and (len(words) > 1):
+            subject = " ".join(words[1:])
+            passiveIndex = getPassiveIndex(words[1:])
+            # What was invented by Edison -> The Answer is the Subject. What Year was Python released -> Python was released in 1991
+            if (passiveIndex == 0):
+                formalAnswer = f"{answer} {auxiliary} {subject}"
+            elif (passiveIndex is not None):
+                formalAnswer = getPassiveFormalAnswer(
+                    words[1:], passiveIndex, auxiliary, answerPart)
+            # Who is Iron Man / Which Planet is the Largest -> The Answer goes first
+            elif (questionType == "who") or ((questionType == "which") and (noun is not None)):
+                formalAnswer = f"{answer} {auxiliary} {subject}"
+            else:
+                formalAnswer = f"{capitalizeFirst(subject)} {auxiliary} {answerPart}"
+        elif (auxiliary in DO_VERBS):
+            formalAnswer = getDoFormalAnswer(auxiliary, words[1:], answerPart)
+        elif (auxiliary not in MODAL_VERBS):
+            # Who invented the Telephone -> Bell invented the Telephone
+            formalAnswer = f"{answer} {' '.join(words)}"
+
+    elif (questionType in ["when", "where"]) and (len(words) > 2):
+        auxiliary = words[1].lower()
+        answerPart = getAnswerPreposition(answer, questionType) + answer
+        passiveIndex = getPassiveIndex(words[2:])
+        # Where was Obama born -> Obama was born in Hawaii
+        if (auxiliary in BE_VERBS) and (passiveIndex is not None):
+            formalAnswer = getPassiveFormalAnswer(
+                words[2:], passiveIndex, auxiliary, answerPart)
+        elif (auxiliary in BE_VERBS):
+            formalAnswer = f"{capitalizeFirst(' '.join(words[2:]))} {auxiliary} {answerPart}"
+        elif (auxiliary in DO_VERBS):
+            formalAnswer = getDoFormalAnswer(auxiliary, words[2:], answerPart)
+
+    elif (questionType in ["howMany", "howMuch"]) and (len(words) > 2):
+        words = words[2:]
+        auxiliaries = [i for i, word in enumerate(words) if word.lower() in BE_VERBS + DO_VERBS]
+        if (len(auxiliaries) > 0):
+            i = auxiliaries[0]
+            noun, auxiliary, rest = " ".join(words[:i]), words[i].lower(), words[i + 1:]
+            answerPart = f"{answer} {noun}".strip()
+            if (auxiliary in BE_VERBS) and (len(rest) > 0) and (rest[0].lower() == "there"):
+                formalAnswer = f"There {auxiliary} {answerPart} {' '.join(rest[1:])}"
+            elif (auxiliary in BE_VERBS) and (noun == ""):
+                formalAnswer = f"{capitalizeFirst(' '.join(rest))} {auxiliary} {answer}"
+            elif (auxiliary in BE_VERBS):
+                formalAnswer = f"{answerPart} {auxiliary} {' '.join(rest)}"
+            else:
+                formalAnswer = getDoFormalAnswer(auxiliary, rest, answerPart)
+        # How many People live in Tokyo -> The Noun and the Verb follow the Answer
+        elif (splitSubjectVerb(words) is not None):
+            formalAnswer = getCountFormalAnswer(words, answer)
+
+    if (formalAnswer is None):
+        return None
+
+    return endSentence(capitalizeFirst(re.sub(r"\s+", " ", formalAnswer)))
@@ -0,0 +1,256 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+#### Const Variables ####
+
+# Outcomes of an Article Fetch: Extracted an Article, Answered but nothing could be Extracted (Blocked, Error Status...) or Failed (Timeout, Connection Error)
+OUTCOME_OK = "ok"
+OUTCOME_EMPTY = "empty"
+OUTCOME_ERROR = "error"
+
+# Seconds a Half Open Host waits for its Probe Fetch before another one is Allowed
+PROBE_TIMEOUT = 60
+
+# Latency (seconds) at which the Score of a Host is halved
+SLOW_HOST_LATENCY = 5
+
+
+# Host of the URL, without the `www.` Prefix
+def getUrlHost(url: str):
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+# New Health State of a Host, Optimistic until it is Measured
+def getInitialHostState():
+    return {"requests": 0, "latency": 0.0, "failureRate": 0.0, "yield": 1.0, "consecutiveFailures": 0,
+            "trips": 0, "openUntil": 0.0, "probing": 0.0, "updated": 0.0}
+
+
+# Per Host Health and Circuit Breaker of the Article Sources, In Memory
+class HostHealthRegistry:
+    """
+    Description: Records the Latency, Failure Rate and Extraction Yield of every Host the Articles are Fetched from. A Host failing `failureThreshold` times in a row, or whose Failure Rate / Yield is too bad, is Skipped for `cooldown` seconds (Doubled on every Trip up to `maxCooldown`), then one Probe Fetch decides if it is Closed again
+    Initial Parameters:
+        failureThreshold: Consecutive Failures (Errors or Empty Extractions) which Trip the Breaker (Default: 3)
+        maxFailureRate: Failure Rate which Trips the Breaker, once the Host has `minRequests` Requests (Default: 0.5)
+        minYield: Extraction Yield under which the Breaker Trips, once the Host has `minRequests` Requests (Default: 0.2)
+        minRequests: Requests needed before the Rates can Trip the Breaker (Default: 5)
+        cooldown: Seconds a Tripped Host is Skipped for (Default: 300s)
+        maxCooldown: Max Seconds a Host which keeps Tripping is Skipped for (Default: 3600s)
+        alpha: Weight of the last Fetch in the moving Averages (Default: 0.2)
+        poorScore: Hosts Scoring under it are Fetched after the others (Default: 0.3)
+    """
+
+    def __init__(self, failureThreshold=3, maxFailureRate=0.5, minYield=0.2, minRequests=5, cooldown=300, maxCooldown=3600, alpha=0.2, poorScore=0.3) -> None:
+        self.failureThreshold = failureThreshold
+        self.maxFailureRate = maxFailureRate
+        self.minYield = minYield
+        self.minRequests = minRequests
+        self.cooldown = cooldown
+        self.maxCooldown = maxCooldown
+        self.alpha = alpha
+        self.poorScore = poorScore
+
+        self._states = {}
+        self._lock = threading.Lock()
+
+    ######## Storage, Overridden by the Shared Registries ########
+
+    def readStates(self, hosts: list):
+        with self._lock:
+            return {host: dict(self._states[host]) for host in hosts if host in self._states}
+
+    # Apply `function(state) -> newState` to the State of the Host atomically. `None` keeps the State
+    def updateState(self, host: str, function):
+        with self._lock:
+            state = self._states.get(host)
+            newState = function(None if state is None else dict(state))
+            if (newState is not None):
+                self._states[host] = newState
+            return newState
+
+    def deleteStates(self, host=None):
+        with self._lock:
+            if (host is None):
+                self._states.clear()
+            else:
+                self._states.pop(host, None)
+
+    def listHosts(self):
+        with self._lock:
+            return list(self._states.keys())
+
+    ######## Circuit Breaker ########
+
+    # Check if the Host of the URL can be Fetched. A Host whose Cooldown is over is Allowed one Probe Fetch
+    def allow(self, url: str):
+        now = time.time()
+        allowed = []
+
+        def probe(state):
+            if (state is None) or (state["openUntil"] == 0):
+                allowed.append(True)
+                return None
+
+            if (now < state["openUntil"]) or (now - state["probing"] < PROBE_TIMEOUT):
+                allowed.append(False)
+                return None
+
+            allowed.append(True)
+            state["probing"] = now
+            return state
+
+        self.updateState(getUrlHost(url), probe)
+        return allowed[0]
+
+    # Record a Fetch of the URL: its Latency and Outcome (`ok`, `empty` or `error`)
+    def record(self, url: str, latency: float, outcome: str):
+        now = time.time()
+
+        def update(state):
+            state = getInitialHostState() if state is None else state
+            failed = outcome == OUTCOME_ERROR
+            state["requests"] += 1
+            state["latency"] += self.alpha * (latency - state["latency"])
+            state["failureRate"] += self.alpha * \
+                ((1.0 if failed else 0.0) - state["failureRate"])
+            if not (failed):
+                state["yield"] += self.alpha * \
+                    ((1.0 if outcome == OUTCOME_OK else 0.0) - state["yield"])
+            state["updated"] = now
+
+            if (outcome == OUTCOME_OK):
+                state.update(consecutiveFailures=0, trips=0,
+                             openUntil=0.0, probing=0.0)
+                return state
+
+            state["consecutiveFailures"] += 1
+            # A failed Probe, or a Host which keeps Failing, is Skipped again for longer
+            if (state["openUntil"] != 0) or (self.shouldTrip(state)):
+                state["trips"] += 1
+                state["openUntil"] = now + \
+                    min(self.cooldown * (2 ** (state["trips"] - 1)), self.maxCooldown)
+                state["probing"] = 0.0
+
+            return state
+
+        self.updateState(getUrlHost(url), update)
+
+    def shouldTrip(self, state: dict):
+        if (state["consecutiveFailures"] >= self.failureThreshold):
+            return True
+
+        return (state["requests"] >= self.minRequests) and ((state["failureRate"] >= self.maxFailureRate) or (state["yield"] < self.minYield))
+
+    ######## Health ########
+
+    # Score of the Host (0 - 1): Extraction Yield, lowered by the Failure Rate and the Latency
+    def getScore(self, state):
+        if (state is None):
+            return 1.0
+
+        return state["yield"] * (1 - state["failureRate"]) / (1 + state["latency"] / SLOW_HOST_LATENCY)
+
+    # Health of the Host of the URL (or of the Host itself): its State, `score` and `open`. Returns `None` if the Host was never Fetched
+    def getHealth(self, urlOrHost: str):
+        host = getUrlHost(urlOrHost) if "://" in urlOrHost else urlOrHost
+        state = self.readStates([host]).get(host)
+        if (state is None):
+            return None
+
+        state["score"] = self.getScore(state)
+        state["open"] = time.time() < state["openUntil"]
+        return state
+
+    # Order the Search Results so the Healthy Hosts are Fetched first: Healthy, Poor, then Tripped Hosts, in Search Result order
+    def orderSearchResults(self, searchResults: list):
+        states = self.readStates(
+            list(set(getUrlHost(item["url"]) for item in searchResults)))
+        now = time.time()
+
+        def rank(item):
+            state = states.get(getUrlHost(item["url"]))
+            if (state is not None) and (now < state["openUntil"]):
+                return 2
+            return 0 if self.getScore(state) >= self.poorScore else 1
+
+        return sorted(searchResults, key=rank)
+
+    # Forget the Health of the Host, or of every Host
+    def reset(self, host=None):
+        self.deleteStates(host)
+
+    # Number of Hosts, and the Hosts Tripped right now
+    def stats(self):
+        hosts = self.listHosts()
+        states = self.readStates(hosts)
+        now = time.time()
+        return {"hosts": len(hosts), "open": sorted(host for host, state in states.items() if now < state["openUntil"])}
+
+
+# Per Host Health and Circuit Breaker backed by SQLite. Can be shared across Processes
+class SQLiteHostHealthRegistry(HostHealthRegistry):
+    """
+    Description: `HostHealthRegistry` stored in a SQLite Database, so every Worker Process skips the Hosts another one found Bad
+    Initial Parameters:
+        path: Path of the Database File
+        **options: Initial Parameters of `HostHealthRegistry`
+    """
+
+    def __init__(self, path: str, **options) -> None:
+        super().__init__(**options)
+        self.path = path
+
+        with self.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS host_health (host TEXT PRIMARY KEY, state TEXT, updated REAL)")
+
+    # Open a Connection, Commits and Closes it after use
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def readStates(self, hosts: list):
+        if (len(hosts) == 0):
+            return {}
+
+        with self.connect() as connection:
+            rows = connection.execute(f"SELECT host, state FROM host_health WHERE host IN ({', '.join('?' * len(hosts))})",
+                                      list(hosts)).fetchall()
+
+        return {host: json.loads(state) for host, state in rows}
+
+    # The Write Lock is taken before reading, so concurrent Processes don't overwrite each other's Updates
+    def updateState(self, host: str, function):
+        with self.connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT state FROM host_health WHERE host = ?", (host,)).fetchone()
+            newState = function(None if row is None else json.loads(row[0]))
+            if (newState is not None):
+                connection.execute("INSERT OR REPLACE INTO host_health (host, state, updated) VALUES (?, ?, ?)",
+                                   (host, json.dumps(newState), newState["updated"]))
+
+        return newState
+
+    def deleteStates(self, host=None):
+        with self.connect() as connection:
+            if (host is None):
+                connection.execute("DELETE FROM host_health")
+            else:
+                connection.execute(
+                    "DELETE FROM host_health WHERE host = ?", (host,))
+
+    def listHosts(self):
+        with self.connect() as connection:
+            return [row[0] for row in connection.execute("SELECT host FROM host_health").fetchall()]
@@ -1,3 +1,16 @@
-from .__ask import setHuggingFaceApiKey, setSerperApiKey, GetQuestionAnswer, getAnswerViaGoogleSearch, getAnswerViaSerperApi
+from .__ask import setHuggingFaceApiKey, setSerperApiKey, GetQuestionAnswer, getAnswerViaGoogleSearch, getAnswerViaSerperApi, startModelWarmer, stopModelWarmer, setSearchCache, getSearchCache, setArticleCache, getArticleCache, setArticleExtractor, getArticleExtractor, setHostHealth, getHostHealth, setInferenceCache, getInferenceCache, setQuestionIndex, getQuestionIndex, getDefaultClient, getAnswersInBatch, setScheduler, getScheduler, getTracer, setFormalMode, getFormalMode, setQaMode, getQaMode
+from .__client import QuestionAnswerClient, AnswerResult, BatchAnswerResult, AnswerEvent
+from .__cache import MemoryCache, SQLiteCache, ArticleCache
+from .__article import ArticleExtractor
+from .__health import HostHealthRegistry, SQLiteHostHealthRegistry
+from .__question import QuestionIndex, canonicalizeQuestion
+from .__flight import SingleFlight, AsyncSingleFlight
+from .__async import AsyncQuestionAnswerClient, AsyncGetQuestionAnswer, AsyncTransport
+from .__scheduler import RequestScheduler, TokenBucket, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from .__formal import getTemplateFormalAnswer, getTemplateSentence, getQuestionType
+from .__extractive import getLexicalAnswer
+from .__dedup import deduplicateArticles
+from .__trace import Tracer, Trace, Span, MetricsRegistry
+from .__transport import Transport, getTransport, setTransportOptions
 
 __version__ = "1.0"
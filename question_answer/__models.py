@@ -0,0 +1,337 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from .__transport import getTransport
+from .__trace import setSpanAttributes
+
+#### Const Variables ####
+
+# Max seconds to wait for a Model to be Loaded
+MODEL_MAX_WAIT = 120
+
+# Status Codes retried by the Transport. 503 is left out as it means "Model is Loading", which is handled here
+MODEL_RETRY_STATUS_CODES = [429, 500, 502, 504]
+
+# Status Codes of a Model which Rejects the Batched Inputs (`{"inputs": [...]}`)
+BATCH_REJECTED_STATUS_CODES = [400, 413, 422]
+
+
+# Check if the Inference Result is the "Model is Loading" Error
+def isModelLoadingError(result: dict):
+    error = result.get("error")
+    if not (isinstance(error, str)):
+        return False
+
+    return all(x in error.lower() for x in ["model", "loading"])
+
+
+# Seconds to wait before Re-Issuing the Request of a Loading Model
+def getLoadingBackoff(result: dict, attempt: int, remaining: float):
+    backoff = min(2 ** attempt, 30)
+    estimatedTime = result.get("estimated_time")
+    if (isinstance(estimatedTime, (int, float))) and (estimatedTime > 0):
+        backoff = min(backoff, estimatedTime)
+
+    return max(0, min(max(backoff, 0.5), remaining))
+
+
+# Read the Inference Result out of the Response. Returns (result, None) or (None, Unsuccessful Output)
+def readModelResponse(response):
+    try:
+        result = response.json()
+    except ValueError:
+        return None, {"success": False, "result": {"error": response.text, "status_code": response.status_code}}
+
+    if (type(result) == list) and (len(result) > 0):
+        result = result[0]
+
+    if (type(result) != dict):
+        return None, {"success": False, "result": result}
+
+    return result, None
+
+
+# Cache Key of an Inference Request: Model URL + Hash of the Payload (Question and Context / Prompt)
+def getInferenceCacheKey(url: str, payload: dict):
+    payloadHash = hashlib.sha256(json.dumps(
+        payload, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{url}:{payloadHash}"
+
+
+# Check if the Model Rejected the Batched Inputs: a Client Error Status, or a Successful Response which is not one Result per Input
+def isBatchRejected(response, results, count: int):
+    if (response.status_code in BATCH_REJECTED_STATUS_CODES):
+        return True
+
+    if (response.status_code != 200):
+        return False
+
+    if (type(results) == dict):
+        return "error" not in results.keys()
+
+    return (type(results) != list) or (len(results) != count)
+
+
+# Query a Hugging Face Inference Model, Waits (by Re-Issuing the Request) while the Model is Loading
+def queryModel(url: str, payload: dict, apiKey: str, expectedKey: str, maxWait=MODEL_MAX_WAIT, transport=None, cache=None):
+    """
+    Description: Send the Payload to the Model and Re-Issue it with Backoff while the Model is Loading
+    Return:
+            If Success: {"success": True, "result": ModelResult}
+            If Unsuccess: {"success": False, "result": ContainingErrorData}
+    Parameters:
+        url: Model API URL
+        payload: Request Payload
+        apiKey: Hugging Face API Key
+        expectedKey: Key which must exist in a Successful Result
+        maxWait: Max total seconds to wait for the Model to be Loaded (Default: 120s)
+        transport: Transport to use (Default: Default Transport)
+        cache: Cache of the Successful Results, Keyed by Model and Payload (Default: None)
+    """
+    if (transport is None):
+        transport = getTransport()
+
+    if (cache is not None):
+        cacheKey = getInferenceCacheKey(url, payload)
+        result = cache.get(cacheKey)
+        if (result is not None):
+            return {"success": True, "result": result}
+
+    headers = {"Authorization": "Bearer " + apiKey}
+    startTime = time.monotonic()
+    attempt = 0
+    loadingWait = 0
+    while (True):
+        response = transport.post(url, headers=headers, json=payload,
+                                  retryStatusCodes=MODEL_RETRY_STATUS_CODES)
+        result, failedOutput = readModelResponse(response)
+        if (failedOutput is not None):
+            return failedOutput
+
+        if ("error" not in result.keys()):
+            break
+
+        remaining = maxWait - (time.monotonic() - startTime)
+        if (not isModelLoadingError(result)) or (remaining <= 0):
+            return {"success": False, "result": result}
+
+        backoff = getLoadingBackoff(result, attempt, remaining)
+        time.sleep(backoff)
+        attempt += 1
+        loadingWait += backoff
+        setSpanAttributes(loadingWait=loadingWait, attempts=attempt + 1)
+
+    if (expectedKey not in result.keys()):
+        return {"success": False, "result": result}
+
+    if (cache is not None):
+        cache.set(cacheKey, result)
+
+    return {"success": True, "result": result}
+
+
+# Query a Model with many Inputs in one Request. Falls back to one Request per Input if the Model Rejects the Batched Inputs
+def queryModelBatch(url: str, payloads: list, apiKey: str, expectedKey: str, maxWait=MODEL_MAX_WAIT, transport=None, cache=None, maxWorkers=4, slot=None):
+    """
+    Description: Send the Inputs of the Payloads as one Batched Request (`{"inputs": [...]}`). Results are Cached per Payload, so they are shared with `queryModel`. If the Batched Request Fails (Model Error, still Loading...), every Input gets its Error
+    Return: List of the `queryModel` Outputs, in Payload order
+    Parameters:
+        url: Model API URL
+        payloads: List of Single Input Payloads (`{"inputs": Input}`)
+        apiKey: Hugging Face API Key
+        expectedKey: Key which must exist in a Successful Result
+        maxWait: Max total seconds to wait for the Model to be Loaded (Default: 120s)
+        transport: Transport to use (Default: Default Transport)
+        cache: Cache of the Successful Results, Keyed by Model and Payload (Default: None)
+        maxWorkers: Max number of parallel Requests of the Fallback (Default: 4)
+        slot: Function Returning the Context Manager every Request is Sent in, e.g. a Slot of the Scheduler (Default: None)
+    """
+    if (transport is None):
+        transport = getTransport()
+    if (slot is None):
+        slot = nullcontext
+
+    outputs = [None] * len(payloads)
+    pending = []
+    for i, payload in enumerate(payloads):
+        result = cache.get(getInferenceCacheKey(
+            url, payload)) if (cache is not None) else None
+        if (result is not None):
+            outputs[i] = {"success": True, "result": result}
+        else:
+            pending.append(i)
+
+    def querySingle(i):
+        with slot():
+            return queryModel(url, payloads[i], apiKey, expectedKey, maxWait=maxWait, transport=transport, cache=cache)
+
+    if (len(pending) == 1):
+        outputs[pending[0]] = querySingle(pending[0])
+        return outputs
+    if (len(pending) == 0):
+        return outputs
+
+    headers = {"Authorization": "Bearer " + apiKey}
+    batchPayload = {"inputs": [payloads[i]["inputs"] for i in pending]}
+    startTime = time.monotonic()
+    attempt = 0
+    loadingWait = 0
+    while (True):
+        with slot():
+            response = transport.post(url, headers=headers, json=batchPayload,
+                                      retryStatusCodes=MODEL_RETRY_STATUS_CODES)
+        try:
+            results = response.json()
+        except ValueError:
+            results = {"error": response.text,
+                       "status_code": response.status_code}
+
+        remaining = maxWait - (time.monotonic() - startTime)
+        if (type(results) != dict) or (not isModelLoadingError(results)) or (remaining <= 0):
+            break
+
+        backoff = getLoadingBackoff(results, attempt, remaining)
+        time.sleep(backoff)
+        attempt += 1
+        loadingWait += backoff
+        setSpanAttributes(loadingWait=loadingWait, attempts=attempt + 1)
+
+    # The Model doesn't Batch: every Input is Sent alone, each in its own Slot
+    if (isBatchRejected(response, results, len(pending))):
+        setSpanAttributes(batchRejected=True)
+        with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(pending)))) as executor:
+            singleOutputs = list(executor.map(querySingle, pending))
+        for i, output in zip(pending, singleOutputs):
+            outputs[i] = output
+
+        return outputs
+
+    if (type(results) != list):
+        for i in pending:
+            outputs[i] = {"success": False, "result": results}
+
+        return outputs
+
+    for i, result in zip(pending, results):
+        if (type(result) == list) and (len(result) > 0):
+            result = result[0]
+
+        if (type(result) != dict) or (expectedKey not in result.keys()):
+            outputs[i] = {"success": False, "result": result}
+            continue
+
+        if (cache is not None):
+            cache.set(getInferenceCacheKey(url, payloads[i]), result)
+        outputs[i] = {"success": True, "result": result}
+
+    return outputs
+
+
+# Async version of `queryModel`, the Transport must be an `AsyncTransport`
+async def queryModelAsync(url: str, payload: dict, apiKey: str, expectedKey: str, transport, maxWait=MODEL_MAX_WAIT, cache=None):
+    if (cache is not None):
+        cacheKey = getInferenceCacheKey(url, payload)
+        result = cache.get(cacheKey)
+        if (result is not None):
+            return {"success": True, "result": result}
+
+    headers = {"Authorization": "Bearer " + apiKey}
+    startTime = time.monotonic()
+    attempt = 0
+    loadingWait = 0
+    while (True):
+        response = await transport.post(url, headers=headers, json=payload,
+                                        retryStatusCodes=MODEL_RETRY_STATUS_CODES)
+        result, failedOutput = readModelResponse(response)
+        if (failedOutput is not None):
+            return failedOutput
+
+        if ("error" not in result.keys()):
+            break
+
+        remaining = maxWait - (time.monotonic() - startTime)
+        if (not isModelLoadingError(result)) or (remaining <= 0):
+            return {"success": False, "result": result}
+
+        backoff = getLoadingBackoff(result, attempt, remaining)
+        await asyncio.sleep(backoff)
+        attempt += 1
+        loadingWait += backoff
+        setSpanAttributes(loadingWait=loadingWait, attempts=attempt + 1)
+
+    if (expectedKey not in result.keys()):
+        return {"success": False, "result": result}
+
+    if (cache is not None):
+        cache.set(cacheKey, result)
+
+    return {"success": True, "result": result}
+
+
+# Keeps the Models Warm by Pinging them in the Background
+class ModelWarmer:
+    """
+    Description: Pings the Models at Start and then Periodically, so the Users never pay the Cold Start
+    Initial Parameters:
+        models: List of (Model API URL, Ping Payload)
+        apiKey: Hugging Face API Key
+        interval: Seconds between two Pings (Default: 300s)
+        transport: Transport to use (Default: Default Transport)
+    """
+
+    def __init__(self, models: list, apiKey: str, interval=300, transport=None) -> None:
+        self.models = models
+        self.apiKey = apiKey
+        self.interval = interval
+        self.transport = transport
+        self.lastPing = {}
+
+        self._stopEvent = threading.Event()
+        self._thread = None
+
+    # Ping a single Model. Loading is triggered by the Request itself so it is not Waited for
+    def ping(self, url: str, payload: dict):
+        transport = self.transport or getTransport()
+        try:
+            response = transport.post(url, headers={"Authorization": "Bearer " + self.apiKey}, json=payload,
+                                      retryStatusCodes=MODEL_RETRY_STATUS_CODES)
+            self.lastPing[url] = {"time": time.time(),
+                                  "status_code": response.status_code}
+        except Exception as e:
+            self.lastPing[url] = {"time": time.time(), "error": str(e)}
+
+    # Ping all the Models once, in parallel
+    def warmUp(self):
+        if (len(self.models) == 0):
+            return
+
+        with ThreadPoolExecutor(max_workers=len(self.models)) as executor:
+            for url, payload in self.models:
+                executor.submit(self.ping, url, payload)
+
+    def run(self):
+        while (not self._stopEvent.is_set()):
+            self.warmUp()
+            self._stopEvent.wait(self.interval)
+
+    # Start the Background Pinging
+    def start(self):
+        if (self._thread is not None) and (self._thread.is_alive()):
+            return
+
+        self._stopEvent.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="ModelWarmer", daemon=True)
+        self._thread.start()
+
+    # Stop the Background Pinging
+    def stop(self):
+        self._stopEvent.set()
+        if (self._thread is not None):
+            self._thread.join(timeout=1)
+            self._thread = None
@@ -0,0 +1,213 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+#### Const Variables ####
+
+# Words which don't change the Meaning of a Question. Who / When / Where / Which / How / Why, the Tense and the Negation are kept
+STOPWORDS = ["a", "an", "the", "is", "are", "am", "be", "what", "whats", "of", "for", "to", "in", "on", "at", "by",
+             "about", "do", "does", "me", "tell", "please", "can", "you", "i", "my", "it", "its", "there"]
+
+# Words with the Same Meaning in a Question
+SYNONYMS = {
+    "newest": "latest",
+    "recent": "latest",
+    "current": "latest",
+    "last": "latest",
+    "ver": "version",
+    "versions": "version",
+    "v": "version"
+}
+
+
+# Words which don't name what the Question is about, two Equivalent Questions may differ by them
+LOOSE_WORDS = ["latest", "version", "release", "new", "now", "today", "currently", "stable", "know", "want", "find", "show", "give",
+               "info", "information", "details"]
+
+# Words after which the Order of the Naming Words changes the Meaning of the Question
+ORDER_WORDS = ["than", "vs", "versus", "before", "after", "from", "into", "beat", "beats"]
+
+
+# Tokenize the Question into Case / Punctuation / Stopword normalized Tokens, in their Order
+def getQuestionTokens(question: str):
+    tokens = []
+    for token in re.findall(r"[a-z0-9]+(?:[.'][a-z0-9]+)*", question.lower()):
+        # "node.js" -> "nodejs", "what's" -> "whats", but "3.11" is kept
+        if not (re.fullmatch(r"[0-9.]+", token)):
+            token = re.sub(r"[.']", "", token)
+
+        token = SYNONYMS.get(token, token)
+        if (token not in STOPWORDS):
+            tokens.append(token)
+
+    return tokens
+
+
+# Canonical Form of the Question: its normalized Tokens in their Order
+def canonicalizeQuestion(question: str):
+    return " ".join(getQuestionTokens(question))
+
+
+# Key of the Question in the Index: the Canonical Form without the Spaces, so "node js" and "node.js" share it. Two Numbers stay apart ("3 11" is not "311")
+def getQuestionKey(question: str):
+    return getTokensKey(getQuestionTokens(question))
+
+
+def getTokensKey(tokens: list):
+    key = ""
+    for token in tokens:
+        if (key) and (key[-1].isdigit()) and (token[0].isdigit()):
+            key += " "
+        key += token
+
+    return key
+
+
+# Join the adjacent Tokens which are one Token of the other Question: ["node", "js"] -> ["nodejs"] if the other Question has "nodejs". Two Numbers are never Joined
+def mergeCompoundTokens(tokens: list, otherTokens: set):
+    merged = []
+    i = 0
+    while (i < len(tokens)):
+        if (i + 1 < len(tokens)) and (tokens[i] not in otherTokens) and (tokens[i] + tokens[i + 1] in otherTokens) and \
+                not ((tokens[i][-1].isdigit()) and (tokens[i + 1][0].isdigit())):
+            merged.append(tokens[i] + tokens[i + 1])
+            i += 2
+            continue
+
+        merged.append(tokens[i])
+        i += 1
+
+    return merged
+
+
+# Tokens which name what the Question is about (Entities, Numbers, Tense...): everything but the Loose Words
+def getNamingTokens(tokens: list):
+    return [token for token in tokens if token not in LOOSE_WORDS]
+
+
+# Anchor of the Question in the Index: the sorted Characters of its Naming Tokens. Equivalent Questions always share it, whatever their Order and Spacing
+def getQuestionAnchor(tokens: list):
+    return "".join(sorted("".join(getNamingTokens(tokens))))
+
+
+# Jaccard Similarity of two Token Sets
+def getJaccardSimilarity(first: set, second: set):
+    if (len(first) == 0) and (len(second) == 0):
+        return 1.0
+
+    return len(first & second) / len(first | second)
+
+
+# Check if two Questions are Equivalent: the same Naming Tokens (in the same Order if the Order matters) and Similar Token Sets
+def areEquivalentTokens(first: list, second: list, threshold=0.75):
+    first, second = mergeCompoundTokens(first, set(second)), mergeCompoundTokens(second, set(first))
+    firstNames, secondNames = getNamingTokens(first), getNamingTokens(second)
+    # A different Entity, Number or Tense is another Question, however Similar the rest is
+    if (sorted(firstNames) != sorted(secondNames)):
+        return False
+
+    # "Is Python faster than Java?" is not "Is Java faster than Python?"
+    if (any(token in ORDER_WORDS for token in firstNames)) and (firstNames != secondNames):
+        return False
+
+    return getJaccardSimilarity(set(first), set(second)) >= threshold
+
+
+# Index of the recently asked Questions
+class QuestionIndex:
+    """
+    Description: Maps a new Question to a recently asked Equivalent one (Paraphrase). Two Questions are Equivalent if their Token Sets (ignoring the Case, the Punctuation, the Spacing, the Stopwords and the known Synonyms) have a Jaccard Similarity of at least `threshold`, and they name the same Entities, Numbers and Tense. The Order of the Words only matters with Comparison Words ("than", "vs"...)
+    Initial Parameters:
+        threshold: Min Jaccard Similarity of the Token Sets of two Equivalent Questions (Default: 0.75)
+        ttl: Seconds a Question stays in the Index, `None` for never (Default: 300s)
+        maxSize: Max number of Questions in the Index (Default: 4096)
+    """
+
+    def __init__(self, threshold=0.75, ttl=300, maxSize=4096) -> None:
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._anchors = {}
+        self._lock = threading.Lock()
+
+    def isExpired(self, entry: dict):
+        return (self.ttl is not None) and (entry["time"] + self.ttl <= time.time())
+
+    def removeEntry(self, key: str):
+        entry = self._entries.pop(key)
+        keys = self._anchors.get(entry["anchor"])
+        if (keys is not None):
+            keys.discard(key)
+            if (len(keys) == 0):
+                del self._anchors[entry["anchor"]]
+
+    # Find the recently asked Equivalent of the Question. Returns `None` if not Found
+    def find(self, question: str):
+        tokens = getQuestionTokens(question)
+        with self._lock:
+            return self.findEntry(getTokensKey(tokens), tokens)
+
+    # Only the Questions with the same Anchor can be Equivalent, so few are Compared
+    def findEntry(self, key: str, tokens: list):
+        entry = self._entries.get(key)
+        if (entry is not None) and (not self.isExpired(entry)):
+            return entry["question"]
+
+        bestQuestion, bestSimilarity = None, -1.0
+        for candidate in self._anchors.get(getQuestionAnchor(tokens), ()):
+            entry = self._entries[candidate]
+            if (self.isExpired(entry)) or not (areEquivalentTokens(tokens, entry["tokens"], self.threshold)):
+                continue
+
+            similarity = getJaccardSimilarity(set(tokens), set(entry["tokens"]))
+            if (similarity > bestSimilarity):
+                bestQuestion, bestSimilarity = entry["question"], similarity
+
+        return bestQuestion
+
+    # Map the Question to its recently asked Equivalent, or Register it if there is none
+    def resolve(self, question: str):
+        """
+        Description: Get the recently asked Equivalent of the Question (so they share the Cache Entries). If not Found, the Question itself is Registered and Returned
+        Parameters:
+            question: User Question
+        """
+        tokens = getQuestionTokens(question)
+        key = getTokensKey(tokens)
+        # Only Stopwords: nothing to tell the Questions apart
+        if not (key):
+            return question
+
+        with self._lock:
+            equivalent = self.findEntry(key, tokens)
+            if (equivalent is not None):
+                self.hits += 1
+                return equivalent
+
+            self.misses += 1
+            if (key in self._entries):
+                self.removeEntry(key)
+
+            anchor = getQuestionAnchor(tokens)
+            self._entries[key] = {"question": question, "tokens": tokens,
+                                  "anchor": anchor, "time": time.time()}
+            self._anchors.setdefault(anchor, set()).add(key)
+            while (len(self._entries) > self.maxSize):
+                self.removeEntry(next(iter(self._entries)))
+
+        return question
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._anchors.clear()
+
+    # Hit / Miss Counters of the Index
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
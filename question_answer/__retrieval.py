@@ -0,0 +1,159 @@
+import math
+import re
+from collections import Counter
+
+from .__question import STOPWORDS
+
+#### Const Variables ####
+
+# Default Token Budget of the assembled Context
+CONTEXT_TOKEN_BUDGET = 1024
+
+
+# Lowercase Word Tokens of the Text, without Stopwords
+def getTermTokens(text: str):
+    return [token for token in re.findall(r"[a-z0-9]+(?:\.[0-9]+)*", text.lower()) if token not in STOPWORDS]
+
+
+# Approximate number of Model Tokens of the Text (Words and Punctuations)
+def countTokens(text: str):
+    return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+# Split the Text into Passages of about `passageTokens` Tokens, without cutting Sentences
+def splitPassages(text: str, passageTokens=120):
+    sentences = []
+    for paragraph in re.split(r"\n+", text):
+        sentences.extend(sentence for sentence in re.split(
+            r"(?<=[.!?])\s+", paragraph.strip()) if sentence)
+
+    passages = []
+    current, currentTokens = [], 0
+    for sentence in sentences:
+        tokens = countTokens(sentence)
+        if (current) and (currentTokens + tokens > passageTokens):
+            passages.append(" ".join(current))
+            current, currentTokens = [], 0
+
+        current.append(sentence)
+        currentTokens += tokens
+
+    if (current):
+        passages.append(" ".join(current))
+
+    return passages
+
+
+# Small In Memory BM25 Index of Passages
+class BM25Index:
+    """
+    Description: Inverted Index of the Passages, Ranks them against a Query with BM25
+    Initial Parameters:
+        passages: List of Passage Texts
+        k1: Term Frequency Saturation (Default: 1.5)
+        b: Length Normalization (Default: 0.75)
+    """
+
+    def __init__(self, passages: list, k1=1.5, b=0.75) -> None:
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+
+        self.lengths = []
+        self.postings = {}
+        for i, passage in enumerate(passages):
+            terms = getTermTokens(passage)
+            self.lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                self.postings.setdefault(term, []).append((i, frequency))
+
+        self.averageLength = (
+            sum(self.lengths) / len(self.lengths)) if self.lengths else 0
+
+    # Inverse Document Frequency of the Term
+    def getIdf(self, term: str):
+        documentFrequency = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.passages) - documentFrequency + 0.5) / (documentFrequency + 0.5))
+
+    # Rank the Passages against the Query. Returns [(passageIndex, score)] with the best first
+    def search(self, query: str, topK=None):
+        scores = {}
+        for term in set(getTermTokens(query)):
+            idf = self.getIdf(term)
+            for i, frequency in self.postings.get(term, ()):
+                norm = self.k1 * (1 - self.b + self.b *
+                                  self.lengths[i] / (self.averageLength or 1))
+                scores[i] = scores.get(i, 0) + idf * \
+                    frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+        return ranked if topK is None else ranked[:topK]
+
+
+# Assemble the most Relevant Passages of the Articles as the Context of the Question
+def buildContext(question: str, articles: list, searchResults: list, tokenBudget=CONTEXT_TOKEN_BUDGET, passageTokens=120):
+    """
+    Description: Split the Articles into Passages, Rank them against the Question with BM25 and Assemble the best ones within the Token Budget
+    Parameters:
+        question: User Question
+        articles: Parsed Articles
+        searchResults: Search Results of the Articles (Same Order)
+        tokenBudget: Max number of Tokens of the Context (Default: 1024)
+        passageTokens: Approximate Tokens of a Passage (Default: 120)
+    """
+    passages, sources = [], []
+    for i, (article, searchResult) in enumerate(zip(articles, searchResults)):
+        # The Search Snippet is a Passage too, it is usually the most Relevant part
+        for passage in [searchResult["description"]] + splitPassages(article, passageTokens=passageTokens):
+            passages.append(passage)
+            sources.append(i)
+
+    if (len(passages) == 0):
+        return ""
+
+    index = BM25Index(passages)
+    ranked = index.search(question)
+    # Unmatched Passages are only used if nothing Matched
+    if (len(ranked) == 0):
+        ranked = [(i, 0) for i in range(len(passages))]
+
+    selected = {}
+    usedTokens = 0
+    seen = set()
+    for i, score in ranked:
+        if (passages[i] in seen):
+            continue
+
+        tokens = countTokens(passages[i])
+        if (usedTokens + tokens > tokenBudget):
+            continue
+
+        seen.add(passages[i])
+        selected.setdefault(sources[i], []).append(i)
+        usedTokens += tokens
+
+    # Group the Passages by their Article, in Search Result order
+    contextSet = []
+    for source in sorted(selected.keys()):
+        contextSet.append("Title: " + searchResults[source]["title"] +
+                          "\nBody: " + " ".join(passages[i] for i in sorted(selected[source])))
+
+    return "\n\n".join(contextSet)
+
+
+# Split the Context into overlapping Model sized Chunks. Returns [(charOffset, chunkText)]
+def splitContextChunks(context: str, chunkWords=300, overlapWords=50):
+    words = list(re.finditer(r"\S+", context))
+    if (len(words) <= chunkWords):
+        return [(0, context)]
+
+    step = max(1, chunkWords - overlapWords)
+    chunks = []
+    for start in range(0, len(words), step):
+        end = min(start + chunkWords, len(words))
+        startChar, endChar = words[start].start(), words[end - 1].end()
+        chunks.append((startChar, context[startChar:endChar]))
+        if (end == len(words)):
+            break
+
+    return chunks
@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+
+#### Const Variables ####
+
+# Priorities of the Requests, the lower goes first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# Limits of the Upstreams: Requests per second, Burst size and Max concurrent Requests. Model Endpoints use the Default Limit
+UPSTREAM_LIMITS = {
+    "serper": {"rate": 5, "burst": 10, "concurrency": 8}
+}
+DEFAULT_UPSTREAM_LIMIT = {"rate": 5, "burst": 10, "concurrency": 4}
+
+# Max seconds an async Waiter sleeps before checking its Turn again
+ASYNC_POLL_INTERVAL = 0.05
+
+
+# Token Bucket of a single Upstream
+class TokenBucket:
+    """
+    Description: Allows `rate` Requests per second on average, with Bursts of up to `burst` Requests. Not Thread safe, the Scheduler holds the Lock
+    Initial Parameters:
+        rate: Tokens added per second
+        burst: Max number of Tokens
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens +
+                          (now - self.updated) * self.rate)
+        self.updated = now
+
+    # Seconds until a Token is available, 0 if one is available now
+    def getWait(self):
+        self.refill()
+        if (self.tokens >= 1):
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+
+# Schedules the Requests of the Rate Limited Upstreams (Serper, Hugging Face Model Endpoints)
+class RequestScheduler:
+    """
+    Description: Every Upstream has a Token Bucket, a Concurrency Cap and a Priority Queue, so Interactive Questions go ahead of Batch Refreshes and Bursts never exceed the Quotas
+    Initial Parameters:
+        limits: {upstream: {"rate", "burst", "concurrency"}}, `None` Values are Unlimited (Default: UPSTREAM_LIMITS)
+        defaultLimit: Limit of the Upstreams not in `limits` (Default: DEFAULT_UPSTREAM_LIMIT)
+    """
+
+    def __init__(self, limits=None, defaultLimit=None) -> None:
+        self.limits = dict(UPSTREAM_LIMITS if limits is None else limits)
+        self.defaultLimit = dict(
+            DEFAULT_UPSTREAM_LIMIT if defaultLimit is None else defaultLimit)
+
+        self._upstreams = {}
+        self._counter = itertools.count()
+        # Reentrant, `acquire` holds it while `tryAcquire` takes it again
+        self._condition = threading.Condition(threading.RLock())
+
+    # Change the Limit of an Upstream. Only the given Values are changed
+    def setLimit(self, upstream: str, rate=None, burst=None, concurrency=None):
+        with self._condition:
+            limit = dict(self.limits.get(upstream, self.defaultLimit))
+            for key, value in [("rate", rate), ("burst", burst), ("concurrency", concurrency)]:
+                if (value is not None):
+                    limit[key] = value
+
+            self.limits[upstream] = limit
+            state = self._upstreams.pop(upstream, None)
+            # Keep the Waiters and the Counters of the Upstream
+            if (state is not None):
+                newState = self.getState(upstream)
+                newState.update(
+                    {key: state[key] for key in ["queue", "inFlight", "acquired", "totalWait", "maxWait", "maxQueueDepth"]})
+
+            self._condition.notify_all()
+
+    def getState(self, upstream: str):
+        state = self._upstreams.get(upstream)
+        if (state is None):
+            limit = self.limits.get(upstream, self.defaultLimit)
+            bucket = None
+            if (limit.get("rate") is not None):
+                bucket = TokenBucket(limit["rate"], limit.get(
+                    "burst") or max(1, limit["rate"]))
+
+            state = {"bucket": bucket, "concurrency": limit.get("concurrency"), "queue": [], "inFlight": 0,
+                     "acquired": 0, "totalWait": 0, "maxWait": 0, "maxQueueDepth": 0}
+            self._upstreams[upstream] = state
+
+        return state
+
+    # Put a Waiter in the Queue of the Upstream. Returns its Ticket
+    def enqueue(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        with self._condition:
+            state = self.getState(upstream)
+            ticket = (priority, next(self._counter),
+                      upstream, time.monotonic())
+            heapq.heappush(state["queue"], ticket)
+            state["maxQueueDepth"] = max(
+                state["maxQueueDepth"], len(state["queue"]))
+
+        return ticket
+
+    # Take a Slot if it is the Turn of the Ticket. Returns 0 if Acquired, else the Seconds to wait (`None` until a Slot is Released)
+    def tryAcquire(self, ticket):
+        upstream = ticket[2]
+        with self._condition:
+            state = self.getState(upstream)
+            if (state["queue"][0] != ticket):
+                return None
+
+            if (state["concurrency"] is not None) and (state["inFlight"] >= state["concurrency"]):
+                return None
+
+            if (state["bucket"] is not None):
+                wait = state["bucket"].getWait()
+                if (wait > 0):
+                    return wait
+                state["bucket"].take()
+
+            heapq.heappop(state["queue"])
+            state["inFlight"] += 1
+            state["acquired"] += 1
+            wait = time.monotonic() - ticket[3]
+            state["totalWait"] += wait
+            state["maxWait"] = max(state["maxWait"], wait)
+
+            # The next Waiter may be able to go too
+            self._condition.notify_all()
+            return 0
+
+    # Remove a Waiter which gave up
+    def cancel(self, ticket):
+        with self._condition:
+            state = self.getState(ticket[2])
+            if (ticket in state["queue"]):
+                state["queue"].remove(ticket)
+                heapq.heapify(state["queue"])
+                self._condition.notify_all()
+
+    # Wait for a Slot of the Upstream
+    def acquire(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        ticket = self.enqueue(upstream, priority)
+        try:
+            # The Turn is Checked and Waited for under the same Lock, so a Release in between can't be missed
+            with self._condition:
+                while (True):
+                    wait = self.tryAcquire(ticket)
+                    if (wait == 0):
+                        return
+
+                    self._condition.wait(wait)
+        except BaseException:
+            self.cancel(ticket)
+            raise
+
+    # Async version of `acquire`, doesn't Block the Event Loop
+    async def acquireAsync(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        ticket = self.enqueue(upstream, priority)
+        try:
+            while (True):
+                wait = self.tryAcquire(ticket)
+                if (wait == 0):
+                    return
+
+                await asyncio.sleep(ASYNC_POLL_INTERVAL if wait is None else min(wait, ASYNC_POLL_INTERVAL))
+        except BaseException:
+            self.cancel(ticket)
+            raise
+
+    # Give the Slot back
+    def release(self, upstream: str):
+        with self._condition:
+            self.getState(upstream)["inFlight"] -= 1
+            self._condition.notify_all()
+
+    # Hold a Slot of the Upstream while the Request runs
+    @contextmanager
+    def slot(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        self.acquire(upstream, priority)
+        try:
+            yield
+        finally:
+            self.release(upstream)
+
+    @asynccontextmanager
+    async def slotAsync(self, upstream: str, priority=PRIORITY_INTERACTIVE):
+        await self.acquireAsync(upstream, priority)
+        try:
+            yield
+        finally:
+            self.release(upstream)
+
+    # Queue Depth and Wait Time Metrics of every Upstream
+    def stats(self):
+        with self._condition:
+            return {upstream: {
+                "queueDepth": len(state["queue"]),
+                "maxQueueDepth": state["maxQueueDepth"],
+                "inFlight": state["inFlight"],
+                "acquired": state["acquired"],
+                "averageWait": (state["totalWait"] / state["acquired"]) if state["acquired"] else 0,
+                "maxWait": state["maxWait"]
+            } for upstream, state in self._upstreams.items()}
@@ -0,0 +1,288 @@
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+#### Const Variables ####
+
+# Upper Bounds (seconds) of the Stage Duration Histogram Buckets
+DURATION_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+# Trace and Span of the running Code. Copied into the Worker Threads with `submitTraced`, asyncio Tasks copy them by themselves
+currentTrace = contextvars.ContextVar("currentTrace", default=None)
+currentSpan = contextvars.ContextVar("currentSpan", default=None)
+
+
+# A timed Stage of a Request
+class Span:
+    """
+    Description: Timed Stage of a Request (search, article, context, inference...) with its Attributes
+    Attributes:
+        name: Stage Name
+        attributes: Data of the Stage (url, bytes, status, model, queueWait...)
+        parent: Parent Span, `None` for the Root Span of a Trace
+        trace: `Trace` of the Span
+        startTime / endTime: `time.monotonic()` of the Start / End
+    """
+
+    def __init__(self, name: str, trace, parent=None, attributes=None) -> None:
+        self.name = name
+        self.trace = trace
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.startTime = time.monotonic()
+        self.endTime = None
+
+    # Seconds spent in the Stage, up to now if not Ended
+    @property
+    def duration(self):
+        return (self.endTime or time.monotonic()) - self.startTime
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def end(self):
+        if (self.endTime is None):
+            self.endTime = time.monotonic()
+
+    def toDict(self):
+        return {"name": self.name, "parent": None if self.parent is None else self.parent.name, "start": self.startTime - self.trace.root.startTime,
+                "duration": self.duration, "attributes": dict(self.attributes)}
+
+
+# Spans of a single Request
+class Trace:
+    """
+    Description: All the Spans of one Request, the Root Span covers the whole Request
+    Attributes:
+        id: Number of the Trace in its Tracer
+        root: Root `Span`
+        spans: Ended Spans, in End order
+    """
+
+    def __init__(self, tracer, name: str, id: int, attributes=None) -> None:
+        self.tracer = tracer
+        self.id = id
+        self.spans = []
+        self.root = Span(name, self, attributes=attributes)
+
+        self._lock = threading.Lock()
+
+    # Make the Trace the current one of the running Code
+    @contextmanager
+    def activate(self):
+        traceToken = currentTrace.set(self)
+        spanToken = currentSpan.set(self.root)
+        try:
+            yield self
+        finally:
+            currentSpan.reset(spanToken)
+            currentTrace.reset(traceToken)
+
+    def addSpan(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+        self.tracer.emit(span)
+
+    # End the Root Span and Report the whole Trace
+    def finish(self):
+        if (self.root.endTime is not None):
+            return
+
+        self.root.end()
+        self.addSpan(self.root)
+
+    # Total Seconds of every Stage
+    def summary(self):
+        with self._lock:
+            spans = list(self.spans)
+
+        totals = {}
+        for span in spans:
+            if (span is not self.root):
+                totals[span.name] = totals.get(span.name, 0) + span.duration
+
+        totals["total"] = self.root.duration
+        return totals
+
+    def toDict(self):
+        with self._lock:
+            spans = list(self.spans)
+
+        return {"id": self.id, "name": self.root.name, "attributes": dict(self.root.attributes),
+                "spans": [span.toDict() for span in spans]}
+
+
+# Counters and Histograms in the Prometheus Text Format
+class MetricsRegistry:
+    """
+    Description: Thread safe Counters and Histograms, exported in the Prometheus Text Format
+    Initial Parameters:
+        prefix: Prefix of the Metric Names (Default: "question_answer")
+        buckets: Upper Bounds of the Histogram Buckets (Default: DURATION_BUCKETS)
+    """
+
+    def __init__(self, prefix="question_answer", buckets=None) -> None:
+        self.prefix = prefix
+        self.buckets = list(DURATION_BUCKETS if buckets is None else buckets)
+
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels=None, value=1):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels=None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if (histogram is None):
+                histogram = {"buckets": [0] * len(self.buckets),
+                             "sum": 0, "count": 0}
+                self._histograms[key] = histogram
+
+            for i, bound in enumerate(self.buckets):
+                if (value <= bound):
+                    histogram["buckets"][i] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    def formatLabels(self, labels, extra=()):
+        labels = list(labels) + list(extra)
+        if (len(labels) == 0):
+            return ""
+
+        return "{" + ",".join(f'{key}="{str(value)}"' for key, value in labels) + "}"
+
+    # All the Metrics in the Prometheus Text Format
+    def exportPrometheus(self):
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+
+        typed = set()
+        for (name, labels), value in counters:
+            fullName = f"{self.prefix}_{name}"
+            if (fullName not in typed):
+                lines.append(f"# TYPE {fullName} counter")
+                typed.add(fullName)
+            lines.append(f"{fullName}{self.formatLabels(labels)} {value}")
+
+        for (name, labels), histogram in histograms:
+            fullName = f"{self.prefix}_{name}"
+            if (fullName not in typed):
+                lines.append(f"# TYPE {fullName} histogram")
+                typed.add(fullName)
+            for bound, count in zip(self.buckets, histogram["buckets"]):
+                lines.append(
+                    f"{fullName}_bucket{self.formatLabels(labels, [('le', bound)])} {count}")
+            lines.append(
+                f"{fullName}_bucket{self.formatLabels(labels, [('le', '+Inf')])} {histogram['count']}")
+            lines.append(
+                f"{fullName}_sum{self.formatLabels(labels)} {histogram['sum']}")
+            lines.append(
+                f"{fullName}_count{self.formatLabels(labels)} {histogram['count']}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Creates the Traces of a Client and Reports their Spans
+class Tracer:
+    """
+    Description: Starts a Trace per Request, calls the Hooks with every ended Span and Records the Metrics
+    Initial Parameters:
+        metrics: `MetricsRegistry` to Record the Stage Durations in, `None` to disable (Default: None)
+    """
+
+    def __init__(self, metrics=None) -> None:
+        self.metrics = metrics
+
+        self._hooks = []
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # Register a Hook, called as `hook(span)` every time a Span ends. The Root Span (`span.parent is None`) ends the Trace
+    def addHook(self, hook):
+        with self._lock:
+            self._hooks.append(hook)
+
+        return hook
+
+    def removeHook(self, hook):
+        with self._lock:
+            if (hook in self._hooks):
+                self._hooks.remove(hook)
+
+    def startTrace(self, name: str, **attributes):
+        return Trace(self, name, next(self._counter), attributes=attributes)
+
+    # Start a Trace and make it the current one until the Block ends
+    @contextmanager
+    def trace(self, name: str, **attributes):
+        trace = self.startTrace(name, **attributes)
+        try:
+            with trace.activate():
+                yield trace
+        finally:
+            trace.finish()
+
+    # Report an ended Span to the Metrics and the Hooks. A failing Hook never breaks the Request
+    def emit(self, span: Span):
+        if (self.metrics is not None):
+            labels = {"stage": span.name}
+            self.metrics.observe("stage_duration_seconds",
+                                 span.duration, labels)
+            self.metrics.increment("stage_total", dict(
+                labels, status="error" if "error" in span.attributes else "ok"))
+            if ("bytes" in span.attributes):
+                self.metrics.increment(
+                    "article_bytes_total", value=span.attributes["bytes"])
+
+        with self._lock:
+            hooks = list(self._hooks)
+
+        for hook in hooks:
+            try:
+                hook(span)
+            except Exception as e:
+                pass
+
+
+# Time a Stage inside the current Trace. Without a current Trace nothing is Recorded
+@contextmanager
+def span(name: str, **attributes):
+    trace = currentTrace.get()
+    parent = currentSpan.get()
+    if (trace is None):
+        yield Span(name, None, attributes=attributes)
+        return
+
+    stageSpan = Span(name, trace, parent=parent, attributes=attributes)
+    token = currentSpan.set(stageSpan)
+    try:
+        yield stageSpan
+    except BaseException as e:
+        stageSpan.set(error=repr(e))
+        raise
+    finally:
+        currentSpan.reset(token)
+        stageSpan.end()
+        trace.addSpan(stageSpan)
+
+
+# Set Attributes of the current Span, if there is one
+def setSpanAttributes(**attributes):
+    stageSpan = currentSpan.get()
+    if (stageSpan is not None) and (stageSpan.trace is not None):
+        stageSpan.set(**attributes)
+
+
+# Submit to the Executor with the current Trace, so the Spans of the Worker are Recorded in it
+def submitTraced(executor, function, *args, **kwargs):
+    return executor.submit(contextvars.copy_context().run, function, *args, **kwargs)
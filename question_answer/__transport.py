@@ -0,0 +1,202 @@
+import json
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+#### Const Variables ####
+
+# Response Status Codes which are worth Retrying
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Size of the Chunks the Bodies are Streamed in when their Size is Capped
+BODY_CHUNK_SIZE = 16 * 1024
+
+
+# Response with an already read (maybe Capped) Body. Has the Attributes of `requests.Response` used by the Package
+class TransportResponse:
+    def __init__(self, status_code: int, headers: dict, content: bytes, truncated=False) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        # `True` if the Body was not read to its End
+        self.truncated = truncated
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        pass
+
+
+# Max Bytes of the Body to read. `maxBytes` is a Number or a Function of the Response Headers, 0 skips the Body
+def getBodyLimit(maxBytes, headers):
+    limit = maxBytes(headers) if callable(maxBytes) else maxBytes
+    return max(0, int(limit))
+
+
+# Read the first `limit` Bytes of the Body Chunks. Returns (body, truncated)
+def readCappedChunks(chunks, limit: int, headers):
+    if (limit == 0):
+        return b"", headers.get("Content-Length", "") != "0"
+
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if (len(body) > limit):
+            return bytes(body[:limit]), True
+
+    return bytes(body), False
+
+
+# Pooled HTTP Sessions shared by every upstream call
+class Transport:
+    """
+    Description: Keeps one pooled keep-alive Session per upstream Host, with connect / read Timeouts and bounded Retries with jittered Backoff on 429 / 5xx
+    Initial Parameters:
+        connectTimeout: Timeout of opening the Connection (Default: 3.05s)
+        readTimeout: Timeout of reading the Response (Default: 30s)
+        maxRetries: Max number of Retries of a Request (Default: 2)
+        backoffFactor: Base Backoff in seconds, doubled on every Retry (Default: 0.5s)
+        maxBackoff: Max Backoff in seconds between two Retries (Default: 8s)
+        poolSize: Max number of kept-alive Connections per Host (Default: 10)
+    """
+
+    def __init__(self, connectTimeout=3.05, readTimeout=30, maxRetries=2, backoffFactor=0.5, maxBackoff=8, poolSize=10) -> None:
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.maxRetries = maxRetries
+        self.backoffFactor = backoffFactor
+        self.maxBackoff = maxBackoff
+        self.poolSize = poolSize
+
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    # Get the Session of the URL's Host, Creates it if not Exists
+    def getSession(self, url: str):
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host)
+            if (session is None):
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.poolSize)
+                session.mount(host, adapter)
+                self._sessions[host] = session
+
+        return session
+
+    # Backoff of the given Retry Attempt, Respects `Retry-After` if the Server sent it
+    def getBackoff(self, attempt: int, response=None):
+        if (response is not None):
+            retryAfter = response.headers.get("Retry-After", "")
+            if (retryAfter.isdigit()):
+                return min(float(retryAfter), self.maxBackoff)
+
+        backoff = min(self.backoffFactor * (2 ** attempt), self.maxBackoff)
+        return random.uniform(backoff / 2, backoff)
+
+    # Send a Request through the pooled Session of the Host
+    def request(self, method: str, url: str, timeout=None, retryStatusCodes=None, maxBytes=None, maxRetries=None, **kwargs):
+        """
+        Description: Send a Request, Retrying Connection Errors and Retryable Status Codes
+        Parameters:
+            method: HTTP Method
+            url: Request URL
+            timeout: Timeout of the Request, number or (connect, read) tuple (Default: Transport Timeouts)
+            retryStatusCodes: Status Codes to Retry (Default: RETRY_STATUS_CODES)
+            maxBytes: Stream the Body and stop reading it after this many Bytes, a Number or a Function of the Response Headers (0 skips the Body). Returns a `TransportResponse` with `truncated` set (Default: None, read it all)
+            maxRetries: Max number of Retries of this Request (Default: Transport maxRetries)
+            **kwargs: Passed to `requests.Session.request`
+        """
+        if (timeout is None):
+            timeout = (self.connectTimeout, self.readTimeout)
+
+        if (retryStatusCodes is None):
+            retryStatusCodes = RETRY_STATUS_CODES
+
+        if (maxRetries is None):
+            maxRetries = self.maxRetries
+
+        if (maxBytes is not None):
+            kwargs["stream"] = True
+
+        session = self.getSession(url)
+        attempt = 0
+        while (True):
+            try:
+                response = session.request(
+                    method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if (attempt >= maxRetries):
+                    raise
+                time.sleep(self.getBackoff(attempt))
+                attempt += 1
+                continue
+
+            if (response.status_code not in retryStatusCodes) or (attempt >= maxRetries):
+                if (maxBytes is None):
+                    return response
+                return self.readCappedResponse(response, maxBytes)
+
+            backoff = self.getBackoff(attempt, response)
+            response.close()
+            time.sleep(backoff)
+            attempt += 1
+
+    # Read at most `maxBytes` of the streamed Body, the rest is never Downloaded
+    def readCappedResponse(self, response, maxBytes):
+        try:
+            content, truncated = readCappedChunks(response.iter_content(
+                BODY_CHUNK_SIZE), getBodyLimit(maxBytes, response.headers), response.headers)
+        finally:
+            response.close()
+
+        return TransportResponse(response.status_code, response.headers, content, truncated)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    # Close all the pooled Sessions
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+# Transport used by the Module level Functions
+defaultTransport = Transport()
+
+
+######## Functions to configure the Transport ########
+
+# Get the Default Transport
+def getTransport():
+    return defaultTransport
+
+
+# Replace the Default Transport with the given Options
+def setTransportOptions(**options):
+    """
+    Description: Configure the Transport used for Hugging Face, Serper and Article Requests
+    Parameters:
+        **options: Initial Parameters of `Transport`
+    """
+    global defaultTransport
+    oldTransport = defaultTransport
+    defaultTransport = Transport(**options)
+    oldTransport.close()
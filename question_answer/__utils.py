@@ -0,0 +1,109 @@
+import re
+from .__retrieval import buildContext, CONTEXT_TOKEN_BUDGET
+
+######## Search Result Functions ########
+
+# Fallback Article of a Search Result (Title + Description)
+def getSearchResultSnippet(item):
+    return f"{item['title']}\n{item['description']}"
+
+
+# Parse Search Results to a Similar Format of Google Search
+def formatSerperSearchResults(serperSearchResults):
+    searchResults = []
+    for result in serperSearchResults:
+        searchResults.append({
+            "title": result["title"],
+            "url": result["link"],
+            "description": result["snippet"]
+        })
+
+    return searchResults
+
+# Parser the Automated Serper Answer
+
+
+def parseSerperApiAnswer(searchResults: dict):
+    if ("answerBox" not in searchResults.keys()):
+        return None
+
+    answerBox = searchResults["answerBox"]
+    answer = {
+        "title": answerBox["title"]
+    }
+    if ("answer" in answerBox.keys()):
+        answer["answer"] = answerBox["answer"]
+    elif ("snippet" in answerBox.keys()):
+        if ("snippetHighlighted" in answerBox.keys()):
+
+            answer["answer"] = answerBox["snippetHighlighted"][0]
+        else:
+            answer["answer"] = answerBox["snippet"]
+
+    return answer
+
+
+######## Article Combining Functions ########
+
+# Check if article contains the Description
+def articleContainsDesc(article: str, description: str):
+    # Replace more than 2 continuous dots with ".+"
+    pattern = re.sub(r'(\\\.){3,}', r".+", re.escape(description))
+    matches = re.findall(pattern, article, re.MULTILINE)
+
+    return len(matches) > 0
+
+
+# Trim the article
+def getTrimmedText(article: str, description: str, article_length: int):
+    pattern = re.compile(re.sub(r'(\\\.){3,}', r".+", re.escape(description)))
+    found = pattern.search(article)
+    if not (found):
+        return article[:article_length]
+
+    d_index = found.span()[0]
+
+    s_length = (article_length - d_index + len(description)) // 2
+    e_length = s_length
+
+    s_index = d_index - s_length
+    if (s_index < 0):
+        s_index = 0
+
+    e_index = s_index + s_length + len(description) + e_length
+
+    trimmedText = article[s_index:e_index]
+    # filtering to avoid cutout texts...
+    filteredText = " ".join(trimmedText.split(" ")[1:-2])
+
+    return filteredText
+
+
+# Combine all the articles as One
+def combineArticles(articles: list, searchResults: list, min_article_length=3000, max_combine_length=15000, filter=True, question=None, tokenBudget=CONTEXT_TOKEN_BUDGET):
+    """
+    Description: Combine the Articles as the Context of the Question. If the `question` is given, only the most Relevant Passages (BM25) within `tokenBudget` are kept, else every Article is Trimmed around its Search Description
+    """
+    if (filter):
+        filtered = [(article, searchResult) for article, searchResult in zip(articles, searchResults)
+                    if articleContainsDesc(article, searchResult["description"])]
+        articles = [article for article, searchResult in filtered]
+        searchResults = [searchResult for article, searchResult in filtered]
+
+    if (question is not None):
+        return buildContext(question, articles, searchResults, tokenBudget=tokenBudget)
+
+    average_article_length = len(articles) // max_combine_length
+    if (average_article_length < min_article_length):
+        average_article_length = min_article_length
+
+    articleDataSet = []
+    for article, searchResult in zip(articles, searchResults):
+        trimmed = "Title: " + searchResult["title"] + "\nDescription: " + searchResult["description"] + \
+            "\nBody: " + \
+            getTrimmedText(
+                article, searchResult["description"], average_article_length)
+        articleDataSet.append(trimmed)
+
+    articleData = "\n\n".join(articleDataSet)
+    return articleData
@@ -0,0 +1,54 @@
+from urllib.parse import urlencode
+
+import pytest
+
+from benchmarks.servers import FakeUpstreams
+from question_answer import QuestionAnswerClient, Transport
+
+#### Const Variables ####
+
+# The Fake Upstreams Answer at once, the Tests add Latency where they need it
+NO_LATENCY = {upstream: {"latency": 0, "jitter": 0}
+              for upstream in ["serper", "qa", "formal", "articles"]}
+
+# Options of the Test Clients: every Cache, the Question Index, the Host Health and the Scheduler are off unless a Test turns them on
+CLIENT_OPTIONS = {"searchCache": None, "inferenceCache": None, "questionIndex": None,
+                  "hostHealth": None, "scheduler": None}
+
+
+@pytest.fixture
+def upstreams():
+    with FakeUpstreams(NO_LATENCY) as upstreams:
+        yield upstreams
+
+
+# Build Clients pointed to the Fake Upstreams, each with its own Transport
+@pytest.fixture
+def makeClient(upstreams):
+    clients = []
+
+    def make(huggingFaceApiKey="hfKey", serperApiKey="serperKey", **options):
+        options = dict(CLIENT_OPTIONS, **options)
+        options.setdefault("transport", Transport(backoffFactor=0.01))
+        client = upstreams.configureClient(
+            QuestionAnswerClient(huggingFaceApiKey, serperApiKey, **options))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+        client.getTransport().close()
+
+
+# Build the Search Result of a Fake Article, the Query overrides the Article Config (latency, size, contentType, status)
+@pytest.fixture
+def articleItem(upstreams):
+    def make(package="pkg", i=0, **query):
+        url = f"{upstreams.url}/article/{package}/{i}"
+        if (query):
+            url += "?" + urlencode(query)
+
+        return {"title": f"{package} Releases {i}", "url": url, "description": f"The latest version of {package} is ..."}
+
+    return make
@@ -0,0 +1,143 @@
+import time
+
+from benchmarks.extraction import runExtractionBenchmark
+from benchmarks.servers import getPackageVersion
+from question_answer import Tracer, Transport
+from question_answer import __article as article_module
+from question_answer.__article import extractArticle, fetchArticle
+from question_answer.__trace import span
+from question_answer.__utils import getSearchResultSnippet
+
+
+def test_articlesAreFetchedConcurrently(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem(f"pkg{i}", latency=0.5) for i in range(4)]
+
+    startTime = time.monotonic()
+    articles = client.parseArticlesFromSearchResults(items)
+
+    assert time.monotonic() - startTime < 1.5
+    for i, article in enumerate(articles):
+        assert f"The latest version of pkg{i} is {getPackageVersion(f'pkg{i}')}" in article
+
+
+def test_articlesKeepTheSearchResultOrder(makeClient, articleItem):
+    client = makeClient()
+    # The first Result Arrives last
+    items = [articleItem(f"pkg{i}", latency=0.3 - i * 0.1) for i in range(3)]
+
+    articles = client.parseArticlesFromSearchResults(items)
+
+    assert [f"pkg{i} Releases" in article for i, article in enumerate(articles)] == [True] * 3
+
+
+def test_articlesMissingTheDeadlineFallBackToTheirSnippet(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem("fast"), articleItem("slow", latency=3)]
+
+    startTime = time.monotonic()
+    articles = client.parseArticlesFromSearchResults(items, deadline=0.5)
+
+    assert time.monotonic() - startTime < 1.5
+    assert "The latest version of fast is" in articles[0]
+    assert articles[1] == getSearchResultSnippet(items[1])
+
+
+def test_failedArticlesFallBackToTheirSnippet(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem("ok"), articleItem("missing", status=404)]
+
+    for concurrent in [True, False]:
+        articles = client.parseArticlesFromSearchResults(
+            items, concurrent=concurrent)
+
+        assert "The latest version of ok is" in articles[0]
+        assert articles[1] == getSearchResultSnippet(items[1])
+
+
+def test_hedgedFetchingKeepsTheFirstGoodArticles(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem("slow", latency=3), articleItem("missing", status=404),
+             articleItem("first"), articleItem("second")]
+
+    startTime = time.monotonic()
+    articles, searchResults = client.parseArticlesHedged(
+        items, 2, hedge=2)
+
+    assert time.monotonic() - startTime < 1.5
+    assert searchResults == items[2:]
+    assert "The latest version of first is" in articles[0]
+    assert "The latest version of second is" in articles[1]
+
+
+def test_hedgedFetchingFillsUpWithTheBestRankedSnippets(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem("missing", status=404), articleItem("good"),
+             articleItem("tiny", size=0)]
+
+    articles, searchResults = client.parseArticlesHedged(items, 2, hedge=1)
+
+    assert searchResults == items[:2]
+    assert articles[0] == getSearchResultSnippet(items[0])
+    assert "The latest version of good is" in articles[1]
+
+
+def test_articlesDeclaringMoreThanTheByteCapAreSkipped(articleItem):
+    tracer = Tracer()
+    ended = []
+    tracer.addHook(ended.append)
+    transport = Transport()
+
+    with tracer.trace("answer"):
+        for size in [2000, 50000]:
+            with span("article", size=size):
+                article = fetchArticle(articleItem("pkg", size=size)["url"], transport=transport,
+                                       maxBytes=10000)
+            assert (article is None) == (size > 10000)
+
+    transport.close()
+    attributes = [stageSpan.attributes for stageSpan in ended if stageSpan.name == "article"]
+    assert "skipped" not in attributes[0]
+    assert attributes[1]["skipped"] == "contentLength"
+    assert attributes[1]["contentLength"] > 10000
+
+
+def test_poorExtractionsAreParsedAgainWithArticleparser(monkeypatch, articleItem):
+    parsed = []
+
+    def parseArticle(url, timeout=10):
+        parsed.append(url)
+        return {"title": "Parsed", "content": "The latest version of tiny is 1.2.3. " * 10}
+
+    monkeypatch.setattr(article_module.articleparser, "parseArticle", parseArticle)
+    transport = Transport()
+    good, tiny = articleItem("good")["url"], articleItem("tiny", size=0)["url"]
+
+    assert "The latest version of good is" in fetchArticle(good, transport=transport)["content"]
+    assert fetchArticle(tiny, transport=transport)["title"] == "Parsed"
+    assert parsed == [tiny]
+    transport.close()
+
+
+def test_extractionKeepsTheTextOfLayoutTags():
+    article = extractArticle("<html><head><title>Releases</title><script>var x = 1;</script></head><body><nav>Home</nav>"
+                             "<div>Text in a div.<span> Text in a span.</span></div><p>Text in a paragraph.</p>"
+                             "<footer>Copyright</footer></body></html>", url="http://example.com")
+
+    assert article["title"] == "Releases"
+    assert article["content"].split("\n") == ["Text in a div. Text in a span.",
+                                              "Text in a paragraph."]
+
+
+def test_extractionDropsLinkListsOutsideTheBlockTags():
+    article = extractArticle("<div><a href='/'>Home</a> <a href='/blog'>Blog</a></div><div>Read the <a href='/docs'>docs</a> first.</div>"
+                             "<ul><li><a href='/a'>Linked item</a></li></ul>")
+
+    assert article["content"].split("\n") == ["Read the docs first.",
+                                              "Linked item"]
+
+
+def test_extractionBenchmarkFindsTheWholeArticle():
+    report = runExtractionBenchmark(extractors=["builtin"], repeat=1)
+
+    assert report["extractors"]["builtin"]["recall"] == 1.0
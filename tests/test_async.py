@@ -0,0 +1,100 @@
+import asyncio
+import re
+import time
+
+from benchmarks.servers import getPackageVersion
+from question_answer import ArticleCache, AsyncGetQuestionAnswer, AsyncQuestionAnswerClient, AsyncTransport, HostHealthRegistry
+
+# Seconds the Slow Cache / Health Registry Block for, as a Database on a busy Disk would
+BLOCKING_TIME = 0.2
+
+
+class SlowArticleCache(ArticleCache):
+    def get(self, url: str):
+        time.sleep(BLOCKING_TIME)
+        return super().get(url)
+
+    def set(self, url: str, article: dict, etag=None, lastModified=None):
+        time.sleep(BLOCKING_TIME)
+        super().set(url, article, etag=etag, lastModified=lastModified)
+
+
+class SlowHostHealth(HostHealthRegistry):
+    def allow(self, url: str):
+        time.sleep(BLOCKING_TIME)
+        return super().allow(url)
+
+    def record(self, url: str, latency: float, outcome: str):
+        time.sleep(BLOCKING_TIME)
+        super().record(url, latency, outcome)
+
+
+# Run the Coroutine with a Heartbeat on the same Event Loop. Returns (result, longest Gap between two Beats)
+async def runWithHeartbeat(coroutine):
+    gaps = []
+
+    async def beat():
+        lastBeat = time.monotonic()
+        while (True):
+            await asyncio.sleep(0.01)
+            gaps.append(time.monotonic() - lastBeat)
+            lastBeat = time.monotonic()
+
+    heartbeat = asyncio.create_task(beat())
+    try:
+        result = await coroutine
+    finally:
+        heartbeat.cancel()
+
+    return result, max(gaps)
+
+
+def test_asyncQuestionsRunConcurrentlyOnOneLoop(makeClient, upstreams):
+    upstreams.config["qa"].update(latency=0.3)
+    client = makeClient(formalMode="local", qaMode="remote")
+    questions = [f"latest version of pkg{i}" for i in range(8)]
+
+    async def main():
+        async with AsyncQuestionAnswerClient(client, AsyncTransport(backoffFactor=0.01)) as asyncClient:
+            return await asyncio.gather(*[asyncClient.getAnswerViaSerperApi(question, num_results=2)
+                                          for question in questions])
+
+    startTime = time.monotonic()
+    answers = asyncio.run(main())
+
+    assert time.monotonic() - startTime < 1.5
+    for question, answer in zip(questions, answers):
+        assert answer.success
+        assert answer.answerOutput["result"]["answer"] == getPackageVersion(re.sub(r"\W+", "-", question))
+
+
+def test_articleCacheAndHostHealthDontBlockTheLoop(tmp_path, makeClient, articleItem):
+    client = makeClient(articleCache=SlowArticleCache(str(tmp_path / "articles.db")), hostHealth=SlowHostHealth())
+    items = [articleItem(f"pkg{i}") for i in range(3)]
+
+    async def main():
+        async with AsyncQuestionAnswerClient(client, AsyncTransport(backoffFactor=0.01)) as asyncClient:
+            return await runWithHeartbeat(asyncClient.parseArticlesFromSearchResults(items))
+
+    articles, longestGap = asyncio.run(main())
+
+    assert longestGap < BLOCKING_TIME / 2
+    for i, article in enumerate(articles):
+        assert f"The latest version of pkg{i} is" in article
+
+
+def test_asyncQuestionObjectAnswersStageByStage(makeClient):
+    client = makeClient(formalMode="local", qaMode="remote")
+
+    async def main():
+        async with AsyncQuestionAnswerClient(client, AsyncTransport(backoffFactor=0.01)) as asyncClient:
+            questionAnswer = AsyncGetQuestionAnswer("serper", num_results=2, client=asyncClient)
+            await questionAnswer.searchQuestion("latest version of pkg")
+            await questionAnswer.parseArticles()
+            return questionAnswer, await questionAnswer.getFinalAnswer()
+
+    questionAnswer, output = asyncio.run(main())
+
+    assert output["success"]
+    assert len(questionAnswer.parsedArticles) == 2
+    assert getPackageVersion("latest-version-of-pkg") in output["result"]
@@ -0,0 +1,29 @@
+from benchmarks.run import SCENARIOS, runBenchmark
+
+#### Const Variables ####
+
+# The Fake Upstreams Answer at once
+NO_LATENCY = {upstream: {"latency": 0, "jitter": 0}
+              for upstream in ["serper", "qa", "formal", "articles"]}
+
+
+def test_benchmarkAnswersEveryQuestionOfEveryScenario():
+    report = runBenchmark(requests=3, concurrency=2,
+                          upstreamConfig=NO_LATENCY, warmup=1)
+
+    assert report["config"]["requests"] == 3
+    assert list(report["scenarios"].keys()) == SCENARIOS
+    for scenario, result in report["scenarios"].items():
+        assert (result["requests"], result["successes"], result["errors"]) == (3, 3, 0)
+        assert result["latency"]["p50"] <= result["latency"]["p99"] <= result["latency"]["max"]
+        assert result["upstreamRequests"]["serper"] == 3
+        assert result["stages"]
+
+
+def test_benchmarkReportsTheErrorsOfTheFailingUpstreams():
+    upstreamConfig = dict(NO_LATENCY, serper={"latency": 0, "failureRate": 1})
+
+    report = runBenchmark(scenarios=["serper"], requests=2, concurrency=1,
+                          upstreamConfig=upstreamConfig, warmup=0)
+
+    assert report["scenarios"]["serper"]["successes"] == 0
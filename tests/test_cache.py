@@ -0,0 +1,92 @@
+import time
+
+from question_answer import ArticleCache, MemoryCache, SQLiteCache
+from question_answer.__cache import normalizeQuery
+
+
+def test_queriesTypedDifferentlyShareTheirKey():
+    assert normalizeQuery("  What is the  Latest version of Node.js?? ") == \
+        normalizeQuery("what is the latest version of node.js")
+
+
+def test_memoryCacheExpiresAndEvictsTheLeastRecentlyUsed():
+    cache = MemoryCache(maxSize=2, ttl=0.2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    time.sleep(0.25)
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 3
+
+
+def test_sqliteCacheIsSharedBetweenInstancesAndExpires(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SQLiteCache(path).set("key", {"organic": [1, 2]})
+
+    assert SQLiteCache(path).get("key") == {"organic": [1, 2]}
+    expiring = SQLiteCache(path, ttl=0)
+    expiring.set("old", 1)
+    assert expiring.get("old") is None
+
+
+def test_serperResultsAreCachedByNormalizedQuery(makeClient, upstreams):
+    client = makeClient(searchCache=MemoryCache())
+
+    first = client.getSerperApiResult("Latest version of pkg?")
+    second = client.getSerperApiResult("  latest VERSION of pkg ")
+
+    assert second == first
+    assert upstreams.counters["serper"] == 1
+
+
+def test_serperErrorsAreNotCached(makeClient, upstreams):
+    client = makeClient(searchCache=MemoryCache())
+    client.transport.maxRetries = 0
+    upstreams.config["serper"]["failureRate"] = 1
+
+    assert "organic" not in client.getSerperApiResult("latest version of pkg")
+    upstreams.config["serper"]["failureRate"] = 0
+    assert "organic" in client.getSerperApiResult("latest version of pkg")
+    assert upstreams.counters["serper"] == 2
+
+
+def test_articleCacheServesFreshArticlesWithoutARequest(tmp_path, makeClient, articleItem, upstreams):
+    cache = ArticleCache(str(tmp_path / "articles.db"))
+    client = makeClient(articleCache=cache)
+    items = [articleItem("cached")]
+
+    first = client.parseArticlesFromSearchResults(items)
+    second = client.parseArticlesFromSearchResults(items)
+
+    assert first == second
+    assert "The latest version of cached is" in first[0]
+    assert upstreams.counters["articles"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_staleArticlesAreRevalidatedWithTheirETag(tmp_path, makeClient, articleItem, upstreams):
+    cache = ArticleCache(str(tmp_path / "articles.db"), freshness=0)
+    client = makeClient(articleCache=cache)
+    items = [articleItem("stale")]
+
+    first = client.parseArticlesFromSearchResults(items)
+    second = client.parseArticlesFromSearchResults(items)
+
+    assert first == second
+    assert upstreams.counters["revalidations"] == 1
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_articleCacheEvictsTheLeastRecentlyUsed(tmp_path):
+    cache = ArticleCache(str(tmp_path / "articles.db"), maxBytes=120)
+    cache.set("http://a", {"content": "a" * 40})
+    cache.set("http://b", {"content": "b" * 40})
+    cache.get("http://a")
+    cache.set("http://c", {"content": "c" * 40})
+
+    assert cache.get("http://b") is None
+    assert cache.get("http://a")["article"]["content"] == "a" * 40
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,77 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import question_answer
+from benchmarks.servers import getPackageVersion
+from question_answer import GetQuestionAnswer
+
+
+# Version the Fake Upstreams Answer to the Question
+def getExpectedVersion(question: str):
+    return getPackageVersion(re.sub(r"\W+", "-", question).strip("-"))
+
+
+def test_concurrentQuestionsKeepTheirOwnResults(makeClient):
+    client = makeClient(formalMode="local", qaMode="remote")
+    questions = [f"latest version of pkg{i}" for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        answers = list(executor.map(
+            lambda question: client.getAnswerViaSerperApi(question, num_results=2), questions))
+
+    for question, answer in zip(questions, answers):
+        assert answer.success
+        assert answer.question == question
+        assert answer.answerOutput["result"]["answer"] == getExpectedVersion(question)
+        assert all(question.replace(" ", "-") in item["title"] for item in answer.searchResults)
+
+
+def test_clientsUseTheirOwnApiKeys(makeClient, upstreams):
+    clients = [makeClient(huggingFaceApiKey=f"hf{i}", serperApiKey=f"serper{i}", qaMode="remote")
+               for i in range(2)]
+
+    threads = [threading.Thread(target=client.getAnswerViaSerperApi, args=(f"latest version of pkg{i}",), kwargs={"num_results": 1})
+               for i, client in enumerate(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert upstreams.apiKeys["serper"] == {"serper0", "serper1"}
+    assert upstreams.apiKeys["qa"] == {"hf0", "hf1"}
+    assert question_answer.getDefaultClient().huggingFaceApiKey not in ["hf0", "hf1"]
+
+
+def test_questionObjectsOfOneClientDontShareState(makeClient):
+    client = makeClient(formalMode="local", qaMode="remote")
+    first = GetQuestionAnswer("serper", num_results=1, client=client)
+    second = GetQuestionAnswer("serper", num_results=1, client=client)
+
+    first.searchQuestion("latest version of first")
+    second.searchQuestion("latest version of second")
+    outputs = [first.getFinalAnswer(), second.getFinalAnswer()]
+
+    assert [output["success"] for output in outputs] == [True, True]
+    assert first.answer.answerOutput["result"]["answer"] == getExpectedVersion("latest version of first")
+    assert second.answer.answerOutput["result"]["answer"] == getExpectedVersion("latest version of second")
+
+
+def test_failedSearchOnlyFailsItsQuestionInABatch(makeClient, articleItem):
+    client = makeClient(qaMode="local")
+    getSerperApiResult = client.getSerperApiResult
+    client.getSerperApiResult = lambda query, priority=None: {"message": "Quota Exceeded"} if "broken" in query \
+        else getSerperApiResult(query, priority=priority)
+
+    outputs = client.getAnswersInBatch(["What is the latest version of broken?",
+                                        "What is the latest version of pkg?"], num_results=1).outputs
+
+    assert outputs[0] == {"success": False, "result": {"error": "Serper Search Failed: Quota Exceeded"}}
+    assert outputs[1]["success"]
+
+    client.getGoogleSearchResults = lambda query, num_results=3: None if "broken" in query else [articleItem("pkg")]
+    outputs = client.getAnswersInBatch(["What is the latest version of broken?",
+                                        "What is the latest version of pkg?"], parseType="search", num_results=1).outputs
+
+    assert outputs[0]["success"] is False
+    assert outputs[1]["success"]
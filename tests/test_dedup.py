@@ -0,0 +1,56 @@
+from question_answer.__dedup import deduplicateArticles
+from question_answer.__retrieval import splitPassages
+
+
+# Passage of distinct Words, long enough to be a Passage of its own
+def getPassage(name: str, words=100):
+    return " ".join(f"{name}{i}" for i in range(words)) + "."
+
+
+def test_mirroredArticlesAreDroppedKeepingTheBestRankedOne():
+    article = "\n".join([getPassage("release"), getPassage("notes")])
+    mirror = article.replace("release0", "Release0") + "\nShared from the original."
+    other = getPassage("other")
+    results = [{"url": "http://a"}, {"url": "http://b"}, {"url": "http://c"}]
+
+    articles, searchResults, stats = deduplicateArticles(
+        [article, mirror, other], results)
+
+    assert articles == [article, other]
+    assert searchResults == [results[0], results[2]]
+    assert stats == {"articles": 1, "passages": 0, "charsSaved": len(mirror)}
+
+
+def test_repeatedPassagesAreDroppedAndOnlyTheirCharactersCount():
+    shared, unique = getPassage("shared"), getPassage("unique")
+    first = "\n".join([getPassage("first"), shared])
+    # The Separators are not Characters of a Dropped Passage
+    second = "\n\n\n".join([shared, unique, getPassage("more")])
+    assert len(splitPassages(second)) == 3
+
+    articles, searchResults, stats = deduplicateArticles(
+        [first, second], [{"url": "http://a"}, {"url": "http://b"}])
+
+    assert articles == [first, "\n".join([unique, getPassage("more")])]
+    assert stats == {"articles": 0, "passages": 1, "charsSaved": len(shared)}
+
+
+def test_partialMirrorLosingEveryPassageIsOnlyADroppedArticle():
+    first, second, third = getPassage("first"), getPassage("second"), getPassage("third")
+    article = "\n".join([first, second, third])
+    # Different enough to not be a Mirror, but every Passage is in the first Article
+    partialMirror = "\n\n".join([third, first])
+
+    articles, searchResults, stats = deduplicateArticles(
+        [article, partialMirror], [{"url": "http://a"}, {"url": "http://b"}])
+
+    assert articles == [article]
+    assert stats == {"articles": 1, "passages": 0, "charsSaved": len(partialMirror)}
+
+
+def test_articlesWithoutWordsAreKept():
+    articles, searchResults, stats = deduplicateArticles(
+        ["", "..."], [{"url": "http://a"}, {"url": "http://b"}])
+
+    assert articles == ["", "..."]
+    assert stats["charsSaved"] == 0
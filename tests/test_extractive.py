@@ -0,0 +1,82 @@
+import pytest
+
+from question_answer import getLexicalAnswer
+
+CONTEXT = ("Title: Node.js Releases\nBody: Node.js was created by Ryan Dahl in 2009. "
+           "The latest version of Node.js is 22.1.0, released on May 2, 2024. "
+           "About 6.3 million people use it every month.")
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("What is the latest version of Node.js?", "22.1.0"),
+    ("When was the latest version of Node.js released?", "May 2, 2024"),
+    ("Who created Node.js?", "Ryan Dahl"),
+    ("How many people use Node.js every month?", "6.3 million")
+])
+def test_lexicalAnswerFitsTheQuestionType(question, answer):
+    result = getLexicalAnswer(question, CONTEXT)
+
+    assert result["answer"] == answer
+    assert CONTEXT[result["start"]:result["end"]] == answer
+    assert 0 < result["score"] <= 1
+
+
+def test_unrelatedContextGivesALowScore():
+    result = getLexicalAnswer("What is the capital of Peru?", CONTEXT)
+
+    assert result["score"] < 0.6
+    assert getLexicalAnswer("Who?", "") == {"answer": "", "score": 0.0, "start": 0, "end": 0}
+
+
+def test_localModeNeedsNoRequest(makeClient, upstreams):
+    client = makeClient(qaMode="local")
+
+    output = client.getAIQuestionAnswer(CONTEXT, "What is the latest version of Node.js?")
+
+    assert output["result"]["answer"] == "22.1.0"
+    assert output["result"]["answerer"] == "local"
+    assert upstreams.counters.get("qa", 0) == 0
+
+
+def test_autoModeAsksTheModelOnlyWhenNotConfident(makeClient, upstreams):
+    client = makeClient(qaMode="auto")
+
+    confident = client.getAIQuestionAnswer(CONTEXT, "What is the latest version of Node.js?")
+    unsure = client.getAIQuestionAnswer("The version is 1.2.3 or so.", "What is the capital of Peru?")
+
+    assert confident["result"]["answerer"] == "local"
+    assert "answerer" not in unsure["result"]
+    assert upstreams.counters["qa"] == 1
+
+
+def test_autoModeKeepsTheLocalAnswerIfTheModelFails(makeClient, upstreams):
+    upstreams.config["qa"].update(loadingRequests=100)
+    client = makeClient(qaMode="auto")
+
+    output = client.getAIQuestionAnswer("The version is 1.2.3 or so.", "What is the latest version?", maxWait=0)
+
+    assert output["success"]
+    assert output["result"]["answer"] == "1.2.3"
+    assert output["result"]["answerer"] == "local"
+
+
+def test_contextWithoutAnAnswerFailsTheLocalMode(makeClient, upstreams):
+    client = makeClient(qaMode="local")
+
+    output = client.getAIQuestionAnswer("The version is 1.2.3 or so.", "What is the capital of Peru?")
+    formalOutput = client.getAIFormalAnswer("What is the capital of Peru?", "")
+
+    assert output == {"success": False, "result": {"error": "No Answer Found in the Context", "answerer": "local"}}
+    assert formalOutput["success"] is False
+    assert upstreams.counters.get("qa", 0) == 0
+
+
+def test_autoModeWaitsForTheLoadingModelWithoutALocalAnswer(makeClient, upstreams):
+    upstreams.config["qa"].update(loadingRequests=1, estimatedTime=0.2)
+    client = makeClient(qaMode="auto")
+
+    output = client.getAIQuestionAnswer("The version is 1.2.3 or so.", "What is the capital of Peru?")
+
+    assert output["success"]
+    assert "answerer" not in output["result"]
+    assert upstreams.counters["qa"] == 2
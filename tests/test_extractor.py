@@ -0,0 +1,70 @@
+import asyncio
+import os
+
+from benchmarks.servers import getArticleHtml, getPackageVersion
+from question_answer import ArticleExtractor
+from question_answer.__article import extractArticleFromBody
+
+#### Const Variables ####
+
+# Pages over and under the Inline Extraction Size
+LARGE_BODY = getArticleHtml("large", 64 * 1024).encode("utf-8")
+SMALL_BODY = getArticleHtml("small", 4 * 1024).encode("utf-8")
+
+
+def test_largeBodiesAreExtractedInThePool():
+    extractor = ArticleExtractor(maxWorkers=2)
+    try:
+        large = extractor.extract(LARGE_BODY, "text/html", "http://example.com/large")
+        small = extractor.extract(SMALL_BODY, "text/html", "http://example.com/small")
+
+        assert large == extractArticleFromBody(LARGE_BODY, "text/html", "http://example.com/large")
+        assert small == extractArticleFromBody(SMALL_BODY, "text/html", "http://example.com/small")
+        assert extractor.stats() == {"workers": 2, "inline": 1, "pooled": 1}
+    finally:
+        extractor.close()
+
+
+def test_asyncExtractionUsesThePool():
+    extractor = ArticleExtractor(maxWorkers=1)
+
+    async def extractAll():
+        return await asyncio.gather(*[extractor.extractAsync(LARGE_BODY, "text/html") for i in range(3)])
+
+    try:
+        articles = asyncio.run(extractAll())
+
+        assert articles == [extractArticleFromBody(LARGE_BODY, "text/html")] * 3
+        assert extractor.stats()["pooled"] == 3
+    finally:
+        extractor.close()
+
+
+def test_crashedPoolFallsBackInlineAndIsStartedAgain():
+    extractor = ArticleExtractor(maxWorkers=1)
+    try:
+        # A Process dying breaks the whole Pool
+        future = extractor.getExecutor().submit(os._exit, 1)
+        assert future.exception() is not None
+
+        assert extractor.extract(LARGE_BODY, "text/html") is not None
+        assert extractor.stats()["inline"] == 1
+
+        assert extractor.extract(LARGE_BODY, "text/html") is not None
+        assert extractor.stats()["pooled"] == 1
+    finally:
+        extractor.close()
+
+
+def test_clientExtractsTheFetchedArticlesInTheExtractor(makeClient, articleItem):
+    extractor = ArticleExtractor(maxWorkers=2)
+    client = makeClient(articleExtractor=extractor)
+    try:
+        articles = client.parseArticlesFromSearchResults(
+            [articleItem(f"pkg{i}", size=64 * 1024) for i in range(3)])
+
+        for i, article in enumerate(articles):
+            assert f"The latest version of pkg{i} is {getPackageVersion(f'pkg{i}')}" in article
+        assert extractor.stats()["pooled"] == 3
+    finally:
+        extractor.close()
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from question_answer.__flight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrentCallsOfOneKeyShareTheResult():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch(key):
+        calls.append(key)
+        time.sleep(0.2)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: flight.do("key", fetch, "key"), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"calls": 1, "shared": 7, "inFlight": 0}
+
+
+def test_errorsAreSharedButNotRemembered():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("upstream failed")
+
+    def follow():
+        started.wait()
+        return flight.do("key", lambda: "not called")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        follower = executor.submit(follow)
+        for future in [leader, follower]:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_cancelledAsyncCallerDoesntCancelTheOthers():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.2)
+        return "result"
+
+    async def main():
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(main()) == ("result", True)
+    assert flight.stats() == {"calls": 1, "shared": 1, "inFlight": 0}
+
+
+def test_identicalQuestionsInFlightAreAnsweredOnce(makeClient, upstreams):
+    upstreams.config["serper"].update(latency=0.3)
+    client = makeClient(formalMode="local", qaMode="remote")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        answers = list(executor.map(lambda i: client.getAnswerViaSerperApi("latest version of pkg", num_results=2), range(4)))
+
+    assert all(answer.success for answer in answers)
+    assert upstreams.counters["serper"] == 1
+    assert upstreams.counters["qa"] == 1
+    assert client.getFlightStats()["answer"]["shared"] == 3
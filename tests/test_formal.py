@@ -0,0 +1,90 @@
+import pytest
+
+from question_answer import getTemplateFormalAnswer, getTemplateSentence
+from question_answer.__formal import splitSubjectVerb
+
+
+@pytest.mark.parametrize("question, answer, formalAnswer", [
+    ("Who is Iron Man?", "Tony Stark", "Tony Stark is Iron Man."),
+    ("What is the latest version of Node.js?", "22.1.0", "The latest version of Node.js is 22.1.0."),
+    ("When did Apple release the iPhone?", "2007", "Apple released the iPhone in 2007."),
+    ("Where is the Eiffel Tower?", "Paris", "The Eiffel Tower is in Paris."),
+    ("How many moons does Mars have?", "two", "Mars has two moons."),
+    ("How many planets are there?", "8", "There are 8 planets."),
+    ("How many people live in Tokyo?", "14 million", "14 million people live in Tokyo."),
+    ("How many people live in Tokyo?", "14 million people", "14 million people live in Tokyo."),
+    ("Who invented the telephone?", "Alexander Graham Bell", "Alexander Graham Bell invented the telephone.")
+])
+def test_templatesSpliceTheAnswerIntoTheQuestion(question, answer, formalAnswer):
+    assert getTemplateFormalAnswer(question, answer) == formalAnswer
+
+
+@pytest.mark.parametrize("question, answer, formalAnswer", [
+    ("Where was Obama born?", "Hawaii", "Obama was born in Hawaii."),
+    ("When was Python 3.12 released?", "October 2, 2023", "Python 3.12 was released on October 2, 2023."),
+    ("What was invented by Edison?", "the light bulb", "The light bulb was invented by Edison."),
+    ("What year was Python released?", "1991", "Python was released in 1991."),
+    ("Which company was founded by Steve Jobs?", "Apple", "Apple was founded by Steve Jobs."),
+    ("Who was the telephone invented by?", "Alexander Graham Bell", "The telephone was invented by Alexander Graham Bell."),
+    ("Where is the Red Cross based?", "Geneva", "The Red Cross is based in Geneva."),
+    ("What is the speed of light?", "299,792 km/s", "The speed of light is 299,792 km/s.")
+])
+def test_passiveQuestionsKeepTheParticipleAfterTheAuxiliary(question, answer, formalAnswer):
+    assert getTemplateSentence(question, answer) == formalAnswer
+
+
+def test_passiveQuestionsWithoutASubjectHaveNoTemplate():
+    assert getTemplateSentence("When was born?", "1990") is None
+
+
+@pytest.mark.parametrize("question, answer, formalAnswer", [
+    ("What does CPU stand for?", "Central Processing Unit", "Central Processing Unit."),
+    ("How many countries exist?", "195", "195"),
+    ("Is Python faster than Java?", "no", "No.")
+])
+def test_questionsWithoutATemplateGetTheAnswerAsASentence(question, answer, formalAnswer):
+    assert getTemplateSentence(question, answer) is None
+    assert getTemplateFormalAnswer(question, answer) == formalAnswer
+
+
+def test_subjectWithoutAKnownVerbIsNotSplit():
+    assert splitSubjectVerb(["Apple", "release", "the", "iPhone"]) == ("Apple", "release", "the iPhone")
+    assert splitSubjectVerb(["CPU", "stand", "for"]) is None
+
+
+def test_autoModeUsesTheTemplateBeforeTheModel(makeClient, upstreams):
+    client = makeClient(formalMode="auto")
+
+    output = client.getAIFormalAnswer("What is the latest version of Node.js?", "15.0.10")
+
+    assert output["result"] == {"generated_text": "The latest version of Node.js is 15.0.10.", "formaliser": "local"}
+    assert upstreams.counters.get("formal", 0) == 0
+
+
+def test_autoModeAsksTheModelWithoutATemplate(makeClient, upstreams):
+    client = makeClient(formalMode="auto")
+
+    output = client.getAIFormalAnswer("What does CPU stand for?", "Central Processing Unit")
+
+    assert output["result"]["formaliser"] == "remote"
+    assert upstreams.counters["formal"] == 1
+
+
+def test_autoModeFallsBackToTheAnswerSentence(makeClient, upstreams):
+    upstreams.config["formal"].update(loadingRequests=100)
+    client = makeClient(formalMode="auto")
+
+    output = client.getAIFormalAnswer("What does CPU stand for?", "Central Processing Unit")
+
+    assert output["result"] == {"generated_text": "Central Processing Unit.", "formaliser": "local"}
+
+
+def test_batchAutoModeOnlySendsTheQuestionsWithoutATemplate(makeClient, upstreams):
+    client = makeClient(formalMode="auto", qaMode="remote")
+    upstreams.config["serper"].update(directAnswerRate=1)
+
+    batch = client.getAnswersInBatch(["What is the latest version of pkg?", "What does pkg stand for?"], num_results=1)
+
+    formalisers = [answer.formalAnswerOutput["result"]["formaliser"] for answer in batch.answers]
+    assert formalisers == ["local", "remote"]
+    assert upstreams.counters["formal"] == 1
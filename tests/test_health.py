@@ -0,0 +1,95 @@
+import time
+
+from question_answer import HostHealthRegistry, SQLiteHostHealthRegistry
+from question_answer.__utils import getSearchResultSnippet
+
+#### Const Variables ####
+
+URL = "https://www.example.com/article"
+
+
+def test_consecutiveFailuresTripTheBreakerUntilTheCooldownIsOver():
+    registry = HostHealthRegistry(failureThreshold=3, cooldown=0.2)
+
+    for i in range(3):
+        assert registry.allow(URL)
+        registry.record(URL, 0.1, "error")
+
+    assert not registry.allow("http://example.com/other")
+    assert registry.stats()["open"] == ["example.com"]
+
+    time.sleep(0.25)
+    # One Probe Fetch, the next Fetches wait for its Outcome
+    assert registry.allow(URL)
+    assert not registry.allow(URL)
+
+    registry.record(URL, 0.1, "ok")
+    assert registry.allow(URL)
+    assert registry.getHealth(URL)["consecutiveFailures"] == 0
+
+
+def test_failedProbesDoubleTheCooldownUpToTheMax():
+    registry = HostHealthRegistry(failureThreshold=1, cooldown=0.1, maxCooldown=0.3)
+
+    cooldowns = []
+    for i in range(4):
+        registry.record(URL, 0.1, "empty")
+        health = registry.getHealth(URL)
+        cooldowns.append(round(health["openUntil"] - health["updated"], 2))
+
+    assert cooldowns == [0.1, 0.2, 0.3, 0.3]
+
+
+def test_badRatesTripTheBreakerOnceThereAreEnoughRequests():
+    registry = HostHealthRegistry(failureThreshold=10, minYield=0.6, minRequests=4)
+
+    for outcome in ["ok", "empty", "ok", "empty"]:
+        registry.record(URL, 0.1, outcome)
+    assert registry.allow(URL)
+
+    registry.record(URL, 0.1, "empty")
+    assert registry.getHealth(URL)["yield"] < 0.6
+    assert not registry.allow(URL)
+
+
+def test_searchResultsAreOrderedHealthyPoorThenTripped():
+    registry = HostHealthRegistry(failureThreshold=2)
+    # The Poor Host is Slow, not Failing
+    items = [{"url": f"https://{host}.com/page"} for host in ["tripped", "poor", "unknown", "healthy"]]
+    registry.record(items[0]["url"], 0.1, "error")
+    registry.record(items[0]["url"], 0.1, "error")
+    registry.record(items[1]["url"], 100, "ok")
+    registry.record(items[3]["url"], 0.1, "ok")
+
+    ordered = registry.orderSearchResults(items)
+
+    assert [item["url"] for item in ordered] == [items[2]["url"], items[3]["url"],
+                                                 items[1]["url"], items[0]["url"]]
+
+
+def test_sqliteRegistriesShareTheHostHealth(tmp_path):
+    path = str(tmp_path / "health.db")
+    first = SQLiteHostHealthRegistry(path, failureThreshold=2)
+    second = SQLiteHostHealthRegistry(path, failureThreshold=2)
+
+    first.record(URL, 0.1, "error")
+    second.record(URL, 0.1, "error")
+
+    assert not first.allow(URL)
+    assert second.stats() == {"hosts": 1, "open": ["example.com"]}
+    second.reset()
+    assert first.allow(URL)
+
+
+def test_clientSkipsTheTrippedHosts(makeClient, articleItem, upstreams):
+    client = makeClient(hostHealth=HostHealthRegistry(failureThreshold=2))
+    for i in range(2):
+        client.parseArticlesFromSearchResults([articleItem("missing", i, status=404)])
+    requests = upstreams.counters.get("articles", 0)
+    assert requests == 2
+
+    items = [articleItem("good")]
+    articles = client.parseArticlesFromSearchResults(items)
+
+    assert articles == [getSearchResultSnippet(items[0])]
+    assert upstreams.counters.get("articles", 0) == requests
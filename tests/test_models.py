@@ -0,0 +1,142 @@
+import time
+
+from question_answer.__models import queryModel, queryModelBatch, ModelWarmer
+from question_answer import MemoryCache, RequestScheduler, Transport
+
+# Context of the QnA Payloads, the Fake Model Answers the Version in it
+CONTEXT = "The latest version of pkg is 1.2.3, released in May."
+
+
+def getQaPayload(context=CONTEXT):
+    return {"inputs": {"question": "What is the latest version of pkg?", "context": context}}
+
+
+def test_requestsAreReIssuedWhileTheModelIsLoading(upstreams):
+    upstreams.config["qa"].update(loadingRequests=2, estimatedTime=0.05)
+
+    output = queryModel(f"{upstreams.url}/models/qa", getQaPayload(), "key", "answer",
+                        transport=Transport())
+
+    assert output["success"]
+    assert output["result"]["answer"] == "1.2.3"
+    assert upstreams.counters["qa"] == 3
+
+
+def test_loadingModelIsNotWaitedForPastMaxWait(upstreams):
+    upstreams.config["qa"].update(loadingRequests=100, estimatedTime=0.05)
+
+    startTime = time.monotonic()
+    output = queryModel(f"{upstreams.url}/models/qa", getQaPayload(), "key", "answer",
+                        maxWait=0, transport=Transport())
+
+    assert time.monotonic() - startTime < 1
+    assert not output["success"]
+    assert "loading" in output["result"]["error"]
+    assert upstreams.counters["qa"] == 1
+
+
+def test_modelWarmerPingsTheModelsAtStart(upstreams):
+    url = f"{upstreams.url}/models/qa"
+    warmer = ModelWarmer([(url, getQaPayload())], "key",
+                         interval=60, transport=Transport())
+
+    warmer.start()
+    try:
+        for i in range(50):
+            if (url in warmer.lastPing):
+                break
+            time.sleep(0.05)
+    finally:
+        warmer.stop()
+
+    assert warmer.lastPing[url]["status_code"] == 200
+    assert upstreams.counters["qa"] == 1
+
+
+def test_inferenceResultsAreMemoizedByModelAndPayload(makeClient, upstreams):
+    client = makeClient(inferenceCache=MemoryCache())
+    question = "What is the latest version of pkg?"
+
+    first = client.getAIQuestionAnswer(CONTEXT, question, qaMode="remote")
+    second = client.getAIQuestionAnswer(CONTEXT, question, qaMode="remote")
+    client.getAIQuestionAnswer(CONTEXT + " Or 1.2.4.", question, qaMode="remote")
+
+    assert first == second
+    assert first["result"]["answer"] == "1.2.3"
+    assert upstreams.counters["qa"] == 2
+
+
+def test_formalAnswersAreMemoized(makeClient, upstreams):
+    client = makeClient(inferenceCache=MemoryCache())
+    question = "What is the latest version of pkg?"
+
+    outputs = [client.getAIFormalAnswer(question, "1.2.3", formalMode="remote")
+               for i in range(2)]
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0]["success"]
+    assert upstreams.counters["formal"] == 1
+
+
+def test_failedInferenceIsNotMemoized(makeClient, upstreams):
+    client = makeClient(inferenceCache=MemoryCache())
+    upstreams.config["qa"].update(failureRate=1)
+
+    assert not client.getAIQuestionAnswer(CONTEXT, "What is the latest version of pkg?", qaMode="remote")["success"]
+    upstreams.config["qa"].update(failureRate=0)
+
+    assert client.getAIQuestionAnswer(CONTEXT, "What is the latest version of pkg?", qaMode="remote")["success"]
+    assert upstreams.counters["qa"] >= 2
+
+
+def test_expiredInferenceResultsAreFetchedAgain(makeClient, upstreams):
+    client = makeClient(inferenceCache=MemoryCache(ttl=0.1))
+
+    client.getAIQuestionAnswer(CONTEXT, "What is the latest version of pkg?", qaMode="remote")
+    time.sleep(0.15)
+    client.getAIQuestionAnswer(CONTEXT, "What is the latest version of pkg?", qaMode="remote")
+
+    assert upstreams.counters["qa"] == 2
+
+
+def getBatchPayloads(count=3):
+    return [getQaPayload(f"The latest version of pkg{i} is 1.2.{i}.") for i in range(count)]
+
+
+def test_batchedInputsAreSentInOneRequest(upstreams):
+    outputs = queryModelBatch(f"{upstreams.url}/models/qa", getBatchPayloads(), "key", "answer", transport=Transport())
+
+    assert [output["result"]["answer"] for output in outputs] == ["1.2.0", "1.2.1", "1.2.2"]
+    assert upstreams.counters["qa"] == 1
+
+
+def test_modelRejectingBatchesGetsOneRequestPerInput(upstreams):
+    upstreams.config["qa"].update(batching=False)
+
+    outputs = queryModelBatch(f"{upstreams.url}/models/qa", getBatchPayloads(), "key", "answer", transport=Transport())
+
+    assert [output["result"]["answer"] for output in outputs] == ["1.2.0", "1.2.1", "1.2.2"]
+    assert upstreams.counters["qa"] == 1 + 3
+
+
+def test_failedBatchGivesEveryInputItsError(upstreams):
+    upstreams.config["qa"].update(failureRate=1)
+
+    outputs = queryModelBatch(f"{upstreams.url}/models/qa", getBatchPayloads(), "key", "answer",
+                              transport=Transport(maxRetries=0))
+
+    assert [output["success"] for output in outputs] == [False] * 3
+    assert outputs[0]["result"]["error"] == "Internal Server Error"
+    assert upstreams.counters["qa"] == 1
+
+
+def test_everyFallbackRequestTakesItsOwnSlot(makeClient, upstreams):
+    upstreams.config["qa"].update(batching=False)
+    scheduler = RequestScheduler(defaultLimit={"rate": None, "burst": None, "concurrency": 1})
+    client = makeClient(scheduler=scheduler)
+    url = client.qaModels[0]
+
+    outputs = client.queryModelInBatches(url, getBatchPayloads(), "answer", batchSize=3)
+
+    assert [output["success"] for output in outputs] == [True] * 3
+    assert scheduler.stats()[url]["acquired"] == 1 + 3
@@ -0,0 +1,83 @@
+import time
+
+from benchmarks.servers import FILLER_SENTENCES, getPackageVersion
+from question_answer.__utils import getSearchResultSnippet
+
+QUESTION = "What is the latest version of pkg?"
+
+
+# Long Context with the Version in its last Words
+def getLongContext(words=1000):
+    filler = " ".join(FILLER_SENTENCES).split()
+    return " ".join(filler[i % len(filler)] for i in range(words)) + " The latest version of pkg is 1.2.3."
+
+
+def test_chunkedAnswerSpanIsRelativeToTheWholeContext(makeClient, upstreams):
+    client = makeClient()
+    context = getLongContext()
+
+    output = client.getAIQuestionAnswerChunked(context, QUESTION, chunkWords=300, overlapWords=50, qaMode="remote")
+
+    assert output["success"]
+    assert output["result"]["answer"] == "1.2.3"
+    assert context[output["result"]["start"]:output["result"]["end"]] == "1.2.3"
+    assert upstreams.counters["qa"] == 4
+
+
+def test_chunksAreAnsweredInParallel(makeClient, upstreams):
+    upstreams.config["qa"].update(latency=0.3)
+    client = makeClient()
+
+    startTime = time.monotonic()
+    output = client.getAIQuestionAnswerChunked(getLongContext(), QUESTION, chunkWords=300, overlapWords=50, maxWorkers=4,
+                                               qaMode="remote")
+
+    assert output["success"]
+    assert time.monotonic() - startTime < 0.9
+
+
+def test_shortContextIsAnsweredInOneRequest(makeClient, upstreams):
+    client = makeClient()
+
+    output = client.getAIQuestionAnswerChunked("The latest version of pkg is 1.2.3.", QUESTION, qaMode="remote")
+
+    assert output["result"]["answer"] == "1.2.3"
+    assert upstreams.counters["qa"] == 1
+
+
+def test_confidentAnswerStopsTheFetching(makeClient, articleItem, upstreams):
+    client = makeClient()
+    items = [articleItem("slow", latency=3), articleItem("fast")]
+
+    startTime = time.monotonic()
+    articles, output = client.parseArticlesUntilConfident(QUESTION, items, 0.5, qaMode="remote")
+
+    assert time.monotonic() - startTime < 1.5
+    assert output["result"]["answer"] == getPackageVersion("fast")
+    assert articles[0] == getSearchResultSnippet(items[0])
+    assert "The latest version of fast is" in articles[1]
+
+
+def test_noConfidentAnswerParsesEveryArticle(makeClient, articleItem):
+    client = makeClient()
+    items = [articleItem("first"), articleItem("second")]
+
+    articles, output = client.parseArticlesUntilConfident(QUESTION, items, 0.95, qaMode="remote")
+
+    assert output is None
+    assert "The latest version of first is" in articles[0]
+    assert "The latest version of second is" in articles[1]
+
+
+def test_earlyExitAnswerSkipsTheCombinedContext(makeClient, articleItem, upstreams):
+    client = makeClient(formalMode="local")
+    items = [articleItem("fast"), articleItem("slow", latency=3)]
+
+    startTime = time.monotonic()
+    answer = client.getAIAnswer(QUESTION, items, confidenceThreshold=0.5, qaMode="remote")
+
+    assert time.monotonic() - startTime < 1.5
+    assert answer.success
+    assert answer.answerOutput["result"]["answer"] == getPackageVersion("fast")
+    assert answer.combinedArticle is None
+    assert upstreams.counters["qa"] == 1
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from question_answer import QuestionAnswerClient, QuestionIndex, canonicalizeQuestion
+
+
+def test_paraphrasesShareTheirRecentlyAskedEquivalent():
+    index = QuestionIndex()
+    question = "What is the latest version of Node.js?"
+
+    assert index.resolve(question) == question
+    assert index.resolve("what's the newest version of node js") == question
+    assert index.resolve("Latest version of NodeJS??") == question
+    assert index.stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_rewordedQuestionsShareTheirEquivalent():
+    index = QuestionIndex()
+
+    assert index.resolve("node.js newest version") == "node.js newest version"
+    assert index.resolve("latest node js version") == "node.js newest version"
+    assert index.resolve("Tell me the current version of NodeJS") == "node.js newest version"
+
+
+def test_canonicalFormKeepsTheWordOrder():
+    assert canonicalizeQuestion("Is Python faster than Java?") == "python faster than java"
+    assert canonicalizeQuestion("Is Java faster than Python?") == "java faster than python"
+
+
+@pytest.mark.parametrize("first, second", [
+    ("What is bar?", "What is baz?"),
+    ("What is the capital of Iraq?", "What is the capital of Iran?"),
+    ("What is the population of Nigeria?", "What is the population of Niger?"),
+    ("What is the latest version of React Native?", "What is the latest version of React?"),
+    ("Is Python faster than Java?", "Is Java faster than Python?"),
+    ("Who was the president in 2020?", "Who will be the president in 2020?"),
+    ("What is new in Python 3.11?", "What is new in Python 3.1 1?"),
+    ("python 3.11", "python 3.12"),
+    ("latest version of node", "latest version of node js"),
+    ("What is the latest version of Node.js?", "Node.js version")
+])
+def test_differentQuestionsAreNotEquivalent(first, second):
+    index = QuestionIndex()
+
+    assert index.resolve(first) == first
+    assert index.resolve(second) == second
+    assert index.stats()["hits"] == 0
+
+
+def test_questionsExpireFromTheIndex():
+    index = QuestionIndex(ttl=0.1, maxSize=1)
+    index.resolve("What is the latest version of pkg?")
+    time.sleep(0.15)
+
+    assert index.find("latest version of pkg") is None
+    assert index.resolve("latest version of pkg") == "latest version of pkg"
+    index.resolve("What is the latest version of other?")
+    assert index.stats()["size"] == 1
+    assert index.find("latest version of pkg") is None
+
+
+def test_clientResolvesTheParaphrasesByDefault(makeClient, upstreams):
+    client = makeClient(questionIndex=QuestionAnswerClient().questionIndex)
+
+    first = client.getAnswerViaSerperApi("node.js newest version", num_results=1)
+    second = client.getAnswerViaSerperApi("latest node js version", num_results=1)
+
+    assert first.success and second.success
+    assert client.questionIndex.stats()["hits"] == 1
@@ -0,0 +1,54 @@
+from benchmarks.servers import FILLER_SENTENCES, getPackageVersion
+from question_answer.__retrieval import BM25Index, buildContext, countTokens, splitContextChunks, splitPassages
+
+# Article of the Fake Upstreams: the Answer Sentence lost in Filler
+ARTICLE = "\n".join([FILLER_SENTENCES[i % len(FILLER_SENTENCES)] for i in range(40)] +
+                    [f"The latest version of pkg is {getPackageVersion('pkg')}, released on May 2, 2024."] +
+                    [FILLER_SENTENCES[i % len(FILLER_SENTENCES)] for i in range(40)])
+
+
+def test_passagesFitTheirBudgetWithoutCuttingSentences():
+    passages = splitPassages(ARTICLE, passageTokens=40)
+
+    assert len(passages) > 1
+    assert " ".join(passages) == ARTICLE.replace("\n", " ")
+    for passage in passages:
+        assert passage.endswith(".")
+        assert countTokens(passage) <= 40
+
+
+def test_bm25RanksTheMatchingPassageFirst():
+    passages = splitPassages(ARTICLE, passageTokens=40)
+    index = BM25Index(passages)
+
+    best, score = index.search("What is the latest version of pkg?", topK=1)[0]
+
+    assert "The latest version of pkg is" in passages[best]
+    assert score > 0
+    assert index.search("unrelated words") == []
+
+
+def test_contextIsCappedToTheTokenBudget():
+    searchResults = [{"title": "pkg Releases", "description": "The latest version of pkg is ..."},
+                     {"title": "Other", "description": "Nothing about it."}]
+
+    context = buildContext("What is the latest version of pkg?", [ARTICLE, ARTICLE], searchResults, tokenBudget=100,
+                           passageTokens=40)
+
+    # The Budget is of the Passages, the Titles are added to it
+    bodies = [block.split("\nBody: ", 1)[1] for block in context.split("\n\n")]
+    assert sum(countTokens(body) for body in bodies) <= 100
+    assert f"The latest version of pkg is {getPackageVersion('pkg')}" in context
+    assert context.startswith("Title: pkg Releases\nBody: ")
+    assert len(context) < len(ARTICLE) / 4
+
+
+def test_chunksOverlapAndCoverTheContext():
+    context = " ".join(f"w{i}" for i in range(100))
+
+    chunks = splitContextChunks(context, chunkWords=30, overlapWords=10)
+
+    assert [offset for offset, chunk in chunks] == [context.index(chunk) for offset, chunk in chunks]
+    assert chunks[0][1].split()[-10:] == chunks[1][1].split()[:10]
+    assert chunks[-1][1].endswith("w99")
+    assert splitContextChunks("short context") == [(0, "short context")]
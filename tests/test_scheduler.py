@@ -0,0 +1,101 @@
+import threading
+import time
+
+from question_answer import PRIORITY_BATCH, PRIORITY_INTERACTIVE, QuestionAnswerClient, RequestScheduler
+
+# Limit without a Rate, only the Concurrency Cap
+SINGLE_SLOT = {"rate": None, "burst": None, "concurrency": 1}
+
+
+# Scheduler whose Slot is Released right after a Waiter found it busy, before the Waiter sleeps
+class RacingScheduler(RequestScheduler):
+    raced = False
+
+    def tryAcquire(self, ticket):
+        wait = super().tryAcquire(ticket)
+        if (wait is None) and (not self.raced):
+            self.raced = True
+            threading.Thread(target=self.release, args=(ticket[2],)).start()
+            time.sleep(0.1)
+
+        return wait
+
+
+def test_releaseBetweenTheCheckAndTheWaitIsNotLost():
+    scheduler = RacingScheduler(limits={}, defaultLimit=SINGLE_SLOT)
+    scheduler.acquire("model")
+
+    waiter = threading.Thread(target=scheduler.acquire, args=("model",), daemon=True)
+    waiter.start()
+    waiter.join(timeout=2)
+
+    assert scheduler.raced
+    assert not waiter.is_alive()
+    assert scheduler.stats()["model"]["inFlight"] == 1
+
+
+def test_singleSlotUnderContentionServesEveryWaiter():
+    scheduler = RequestScheduler(limits={}, defaultLimit=SINGLE_SLOT)
+    inFlight, maxInFlight = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        for i in range(500):
+            with scheduler.slot("model"):
+                with lock:
+                    inFlight[0] += 1
+                    maxInFlight[0] = max(maxInFlight[0], inFlight[0])
+                with lock:
+                    inFlight[0] -= 1
+
+    threads = [threading.Thread(target=work) for i in range(4)]
+    startTime = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert time.monotonic() - startTime < 5
+    assert not any(thread.is_alive() for thread in threads)
+    assert maxInFlight[0] == 1
+    assert scheduler.stats()["model"]["acquired"] == 4 * 500
+
+
+def test_interactiveRequestsGoAheadOfBatchOnes():
+    scheduler = RequestScheduler(limits={}, defaultLimit=SINGLE_SLOT)
+    order = []
+
+    def request(name, priority):
+        with scheduler.slot("model", priority):
+            order.append(name)
+
+    scheduler.acquire("model")
+    threads = [threading.Thread(target=request, args=(f"batch{i}", PRIORITY_BATCH)) for i in range(3)]
+    threads.append(threading.Thread(target=request, args=("interactive", PRIORITY_INTERACTIVE)))
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+
+    assert scheduler.stats()["model"]["queueDepth"] == 4
+    scheduler.release("model")
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order[0] == "interactive"
+    assert sorted(order[1:]) == ["batch0", "batch1", "batch2"]
+
+
+def test_tokenBucketSpreadsTheBurst():
+    scheduler = RequestScheduler(limits={"serper": {"rate": 20, "burst": 1, "concurrency": None}})
+
+    startTime = time.monotonic()
+    for i in range(5):
+        with scheduler.slot("serper"):
+            pass
+
+    assert time.monotonic() - startTime >= 4 / 20 - 0.02
+    assert scheduler.stats()["serper"]["maxWait"] > 0
+
+
+def test_clientHasNoSchedulerByDefault():
+    assert QuestionAnswerClient().scheduler is None
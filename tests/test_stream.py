@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from benchmarks.servers import getPackageVersion
+from question_answer import AsyncGetQuestionAnswer, AsyncQuestionAnswerClient, AsyncTransport, GetQuestionAnswer
+
+QUESTION = "latest version of pkg"
+
+
+# Stream the Question. Returns [(eventType, seconds since the Start)] and the Events
+def streamEvents(questionAnswer, question=QUESTION):
+    startTime = time.monotonic()
+    events, timings = [], []
+    for event in questionAnswer.stream(question):
+        events.append(event)
+        timings.append((event.type, time.monotonic() - startTime))
+
+    return events, timings
+
+
+def test_rawAnswerIsStreamedBeforeTheFormalAnswer(makeClient, upstreams):
+    upstreams.config["formal"].update(latency=0.5)
+    client = makeClient(formalMode="remote", qaMode="remote")
+
+    events, timings = streamEvents(GetQuestionAnswer("serper", num_results=2, client=client))
+
+    assert [eventType for eventType, seconds in timings] == ["searchResults", "article", "article", "answer", "formalAnswer"]
+    assert timings[-1][1] - timings[-2][1] >= 0.4
+    assert events[3].data["result"]["answer"] == getPackageVersion("latest-version-of-pkg")
+    assert events[-1].data["success"]
+    assert sorted(event.data["index"] for event in events if event.type == "article") == [0, 1]
+
+
+def test_directAnswerSkipsTheArticles(makeClient, upstreams):
+    upstreams.config["serper"].update(directAnswerRate=1)
+    client = makeClient(formalMode="local")
+
+    events, timings = streamEvents(GetQuestionAnswer("serper", num_results=2, client=client))
+
+    assert [event.type for event in events] == ["searchResults", "directAnswer", "formalAnswer"]
+    assert events[1].data["answer"] == getPackageVersion("latest-version-of-pkg")
+    assert upstreams.counters.get("articles", 0) == 0
+
+
+def test_asyncStreamYieldsTheSameEvents(makeClient):
+    client = makeClient(formalMode="local", qaMode="remote")
+
+    async def main():
+        async with AsyncQuestionAnswerClient(client, AsyncTransport(backoffFactor=0.01)) as asyncClient:
+            questionAnswer = AsyncGetQuestionAnswer("serper", num_results=2, client=asyncClient)
+            return [event async for event in questionAnswer.stream(QUESTION)]
+
+    events = asyncio.run(main())
+
+    assert [event.type for event in events] == ["searchResults", "article", "article", "answer", "formalAnswer"]
+    assert events[-1].data["success"]
@@ -0,0 +1,63 @@
+from question_answer import MetricsRegistry, Tracer
+from question_answer.__trace import span, setSpanAttributes
+
+
+def test_answerTraceHasTheStagesOfTheRequest(makeClient):
+    client = makeClient(formalMode="local", qaMode="remote")
+
+    answer = client.getAnswerViaSerperApi("latest version of pkg", num_results=2)
+
+    names = [stageSpan.name for stageSpan in answer.trace.spans]
+    for name in ["search", "article", "context", "inference", "formalAnswer"]:
+        assert name in names
+    articleSpans = [stageSpan for stageSpan in answer.trace.spans if stageSpan.name == "article"]
+    assert len(articleSpans) == 2
+    assert all(stageSpan.attributes["status"] == 200 for stageSpan in articleSpans)
+    assert set(answer.trace.summary()) >= {"search", "article", "total"}
+
+
+def test_hooksGetEverySpanAndAFailingHookIsIgnored():
+    tracer = Tracer()
+    ended = []
+    tracer.addHook(lambda stageSpan: 1 / 0)
+    tracer.addHook(ended.append)
+
+    with tracer.trace("answer", question="q"):
+        with span("search", provider="serper"):
+            setSpanAttributes(results=3)
+
+    assert [stageSpan.name for stageSpan in ended] == ["search", "answer"]
+    assert ended[0].attributes == {"provider": "serper", "results": 3}
+    assert ended[0].parent is ended[1]
+
+
+def test_spansOutsideATraceAreNotRecorded():
+    tracer = Tracer()
+    ended = []
+    tracer.addHook(ended.append)
+
+    with span("search") as stageSpan:
+        setSpanAttributes(results=3)
+
+    assert stageSpan.attributes == {}
+    assert ended == []
+
+
+def test_stageDurationsAreExportedForPrometheus():
+    metrics = MetricsRegistry()
+    tracer = Tracer(metrics=metrics)
+
+    with tracer.trace("answer"):
+        with span("article", bytes=1000):
+            pass
+        try:
+            with span("inference"):
+                raise TimeoutError()
+        except TimeoutError:
+            pass
+
+    exported = metrics.exportPrometheus()
+    assert 'question_answer_stage_total{stage="article",status="ok"} 1' in exported
+    assert 'question_answer_stage_total{stage="inference",status="error"} 1' in exported
+    assert 'question_answer_stage_duration_seconds_count{stage="answer"} 1' in exported
+    assert "question_answer_article_bytes_total 1000" in exported
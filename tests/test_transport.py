@@ -0,0 +1,32 @@
+import pytest
+import requests
+
+from question_answer import Transport
+
+
+def test_articleRequestsAreNotRetried(makeClient, articleItem, upstreams):
+    client = makeClient()
+
+    assert client.parseArticleContent(articleItem(status=503)) is None
+    assert upstreams.counters["articles"] == 1
+
+
+def test_upstreamRequestsAreRetried(upstreams):
+    upstreams.config["serper"]["failureRate"] = 1
+    transport = Transport(maxRetries=2, backoffFactor=0.01)
+
+    response = transport.post(f"{upstreams.url}/search", json={"q": "x"})
+
+    assert response.status_code == 500
+    assert upstreams.counters["serper"] == 3
+
+
+def test_maxRetriesOfARequestOverridesTheTransport(upstreams):
+    upstreams.config["serper"]["failureRate"] = 1
+    transport = Transport(maxRetries=2, backoffFactor=0.01)
+
+    transport.post(f"{upstreams.url}/search", json={"q": "x"}, maxRetries=0)
+
+    assert upstreams.counters["serper"] == 1
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://127.0.0.1:9/closed", maxRetries=0)